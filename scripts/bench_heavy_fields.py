@@ -0,0 +1,135 @@
+"""
+Benchmark the NetBox-side cost of rendering config_context, with and without exclude.
+
+NetBox renders config_context for every device and virtual machine of a full response
+by merging all config contexts that apply to it, even when ?fields= leaves it out, so
+the MCP server sends exclude=config_context unless the field is requested. This script runs
+a local stand-in for the NetBox devices endpoint that does the same per-object merge, and
+fetches pages through NetBoxRestClient with and without the exclude parameter.
+
+Reported per page size: the median render time inside the stand-in, the median request
+time seen by the client, and the response size. Absolute numbers depend on the number
+and size of config contexts (see --contexts).
+
+Usage:
+    python scripts/bench_heavy_fields.py
+    python scripts/bench_heavy_fields.py --contexts 30 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from urllib.parse import parse_qs, urlparse
+
+from synthetic_netbox import synthetic_device
+
+from netbox_mcp_server.netbox_client import NetBoxRestClient
+from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+
+PAGE_SIZES = (50, 250, 1000)
+
+
+def config_context(layer: int) -> dict:
+    """Build one config context, as assigned to a region, site, role or platform."""
+    return {
+        "ntp_servers": [f"10.{layer}.0.{i}" for i in range(1, 4)],
+        "syslog": {"servers": [f"10.{layer}.1.10"], "facility": "local7", "severity": "info"},
+        "snmp": {"communities": [{"name": f"monitor-{layer}", "mode": "ro"}]},
+        "vlans": {str(vid): {"name": f"VLAN{vid}", "layer": layer} for vid in range(100, 140)},
+        f"layer_{layer}": {"weight": layer * 10, "owner": f"team-{layer}"},
+    }
+
+
+def deep_merge(base: dict, update: dict) -> dict:
+    """Merge two config contexts the way NetBox does (later contexts win)."""
+    merged = dict(base)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serve /api/dcim/devices/ pages, rendering config contexts unless excluded."""
+
+    contexts: ClassVar[list[dict]] = []
+    render_times: ClassVar[list[float]] = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        limit = int(query.get("limit", ["50"])[0])
+        excluded = query.get("exclude", [""])[0].split(",")
+
+        started = time.perf_counter()
+        results = []
+        for id in range(1, limit + 1):
+            obj = synthetic_device(id, config_context=False)
+            if "config_context" not in excluded:
+                # Every device gets the contexts of its region, site, role, platform, ...
+                context: dict = {}
+                for layer in self.contexts:
+                    context = deep_merge(context, layer)
+                obj["config_context"] = context
+            results.append(obj)
+        body = json.dumps({"count": limit, "next": None, "previous": None, "results": results})
+        self.render_times.append((time.perf_counter() - started) * 1000)
+
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(client: NetBoxRestClient, params: dict, repeat: int) -> tuple[float, float, int]:
+    """Return the median render and request times in milliseconds and the body size."""
+    StandIn.render_times.clear()
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(client.get_raw("dcim/devices", params=params))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(StandIn.render_times), statistics.median(timings), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--contexts", type=int, default=12, help="Config contexts per device")
+    parser.add_argument("--repeat", type=int, default=7, help="Requests per measurement")
+    args = parser.parse_args()
+
+    StandIn.contexts = [config_context(layer) for layer in range(args.contexts)]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = NetBoxRestClient(url=f"http://127.0.0.1:{server.server_port}", token="bench")  # noqa: S106
+
+    exclude = ",".join(NETBOX_OBJECT_TYPES["dcim.device"]["exclude"])
+    print(  # noqa: T201
+        f"{'rows':>5} {'exclude':<16} {'render ms':>10} {'request ms':>11} {'bytes':>10}"
+    )
+    try:
+        for size in PAGE_SIZES:
+            for label, extra in (("-", {}), (exclude, {"exclude": exclude})):
+                render, request, body = measure(client, {"limit": size, **extra}, args.repeat)
+                print(  # noqa: T201
+                    f"{size:>5} {label:<16} {render:>10.1f} {request:>11.1f} {body:>10}"
+                )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark JSON decoding of NetBox list responses per decoder backend and page size.
+
+Reports the median decode time and the peak traced memory of one decode for every
+installed backend (orjson, msgspec, stdlib json).
+
+Usage:
+    # Synthetic dcim.device pages with config context and nested objects
+    python scripts/bench_json_decode.py
+
+    # Recorded NetBox responses, e.g. saved with
+    #   curl -H "Authorization: Token $NETBOX_TOKEN" \
+    #        "$NETBOX_URL/api/dcim/devices/?limit=1000" > devices.json
+    python scripts/bench_json_decode.py devices.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from synthetic_netbox import synthetic_device, synthetic_page
+
+from netbox_mcp_server.jsoncodec import DECODER_BACKENDS, get_decoder
+
+PAGE_SIZES = (10, 50, 100, 250, 1000)
+
+
+def synthetic_body(size: int) -> bytes:
+    """Build a paginated list response body with ``size`` devices."""
+    return json.dumps(synthetic_page(synthetic_device, "dcim/devices", size)).encode()
+
+
+def recorded_pages(paths: list[str]) -> dict[str, bytes]:
+    """Load recorded NetBox responses, keyed by file name and result count."""
+    pages = {}
+    for path in paths:
+        body = Path(path).read_bytes()
+        rows = len(json.loads(body).get("results", []))
+        pages[f"{Path(path).name} ({rows} rows)"] = body
+    return pages
+
+
+def measure(loads, body: bytes, repeat: int) -> tuple[float, int]:
+    """Return the median decode time in milliseconds and the peak traced memory in bytes."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loads(body)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    loads(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("payloads", nargs="*", help="Recorded NetBox list responses (JSON files)")
+    parser.add_argument("--repeat", type=int, default=20, help="Decodes per measurement")
+    args = parser.parse_args()
+
+    if args.payloads:
+        pages = recorded_pages(args.payloads)
+    else:
+        pages = {f"{size} devices": synthetic_body(size) for size in PAGE_SIZES}
+
+    decoders = []
+    for name in DECODER_BACKENDS:
+        try:
+            decoders.append(get_decoder(name))
+        except ValueError:
+            print(f"{name}: not installed, skipped")  # noqa: T201
+
+    print(f"{'payload':<28} {'size':>10} {'decoder':<8} {'median ms':>10} {'peak KiB':>10}")  # noqa: T201
+    for label, body in pages.items():
+        for decoder in decoders:
+            median, peak = measure(decoder.loads, body, args.repeat)
+            print(  # noqa: T201
+                f"{label:<28} {len(body):>10} {decoder.name:<8} {median:>10.2f} {peak / 1024:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark the size of netbox_get_objects responses per output format.
+
+Reports the bytes per row of a page rendered as compact JSON (as MCP transmits it),
+CSV and TSV, for full objects and for a typical field projection.
+
+Usage:
+    # Synthetic ipam.ipaddress and dcim.device pages
+    python scripts/bench_output_format.py
+
+    # Recorded NetBox responses, e.g. saved with
+    #   curl -H "Authorization: Token $NETBOX_TOKEN" \
+    #        "$NETBOX_URL/api/ipam/ip-addresses/?limit=100" > ips.json
+    python scripts/bench_output_format.py ips.json --fields address,dns_name,status
+"""
+
+import argparse
+import json
+from functools import partial
+from pathlib import Path
+
+from synthetic_netbox import synthetic_device, synthetic_ip, synthetic_page
+
+from netbox_mcp_server.tabular import render_page
+
+FORMATS = ("json", "csv", "tsv")
+
+
+def project(page: dict, fields: list[str]) -> dict:
+    """Apply a field projection to a page, as NetBox's ?fields= does."""
+    return {
+        **page,
+        "results": [{f: obj.get(f) for f in fields} for obj in page["results"]],
+    }
+
+
+def render(page: dict, output_format: str) -> bytes:
+    """Render a page as the tool would return it."""
+    if output_format == "json":
+        return json.dumps(page, separators=(",", ":")).encode()
+    return render_page(page, output_format).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("payloads", nargs="*", help="Recorded NetBox list responses (JSON files)")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per synthetic page")
+    parser.add_argument(
+        "--fields", help="Comma-separated projection for recorded payloads (default: all)"
+    )
+    args = parser.parse_args()
+
+    pages = {}
+    if args.payloads:
+        for path in args.payloads:
+            page = json.loads(Path(path).read_text())
+            pages[Path(path).name] = page
+            if args.fields:
+                pages[f"{Path(path).name} [{args.fields}]"] = project(page, args.fields.split(","))
+    else:
+        ips = synthetic_page(synthetic_ip, "ipam/ip-addresses", args.rows)
+        devices = synthetic_page(
+            partial(synthetic_device, config_context=False), "dcim/devices", args.rows
+        )
+        pages = {
+            "ip addresses": ips,
+            "ip addresses [3 fields]": project(ips, ["address", "dns_name", "status"]),
+            "devices": devices,
+            "devices [3 fields]": project(devices, ["name", "site", "status"]),
+        }
+
+    print(f"{'payload':<32} {'rows':>5} " + " ".join(f"{f + ' B/row':>12}" for f in FORMATS))  # noqa: T201
+    for label, page in pages.items():
+        rows = max(len(page.get("results", [])), 1)
+        sizes = [len(render(page, output_format)) / rows for output_format in FORMATS]
+        print(  # noqa: T201
+            f"{label:<32} {rows:>5} " + " ".join(f"{size:>12.0f}" for size in sizes)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Synthetic NetBox objects shaped like NetBox 4.x API responses, shared by the benchmarks.
+
+The objects are deterministic in their ID, so related objects (sites, roles, tenants,
+...) repeat across a page the way they do in a real inventory.
+"""
+
+BASE_URL = "https://netbox.example.com"
+
+
+def nested(id: int, name: str, endpoint: str) -> dict:
+    """Build a brief nested object as NetBox embeds it."""
+    return {
+        "id": id,
+        "url": f"{BASE_URL}/api/{endpoint}/{id}/",
+        "display": name,
+        "name": name,
+        "slug": name.lower().replace(" ", "-"),
+        "description": "",
+    }
+
+
+def ipv4_address(id: int) -> str:
+    """Return the address of the IP address with an ID."""
+    return f"10.{id // 65536 % 256}.{id // 256 % 256}.{id % 256}/24"
+
+
+def synthetic_device(id: int, config_context: bool = True) -> dict:
+    """
+    Build a full dcim.device object.
+
+    Args:
+        id: The device ID
+        config_context: Whether to include the rendered config context, which NetBox
+                        leaves out when asked to exclude it
+    """
+    device = {
+        "id": id,
+        "url": f"{BASE_URL}/api/dcim/devices/{id}/",
+        "display_url": f"{BASE_URL}/dcim/devices/{id}/",
+        "display": f"sw-{id:05d}",
+        "name": f"sw-{id:05d}",
+        "device_type": {
+            **nested(id % 20, f"Model {id % 20}", "dcim/device-types"),
+            "manufacturer": nested(id % 5, f"Vendor {id % 5}", "dcim/manufacturers"),
+        },
+        "role": nested(id % 8, f"Role {id % 8}", "dcim/device-roles"),
+        "tenant": nested(id % 12, f"Tenant {id % 12}", "tenancy/tenants"),
+        "platform": nested(id % 6, f"Platform {id % 6}", "dcim/platforms"),
+        "serial": f"SN{id:010d}",
+        "asset_tag": None,
+        "site": nested(id % 40, f"Site {id % 40}", "dcim/sites"),
+        "location": nested(id % 90, f"Room {id % 90}", "dcim/locations"),
+        "rack": nested(id % 400, f"R{id % 400}", "dcim/racks"),
+        "position": float(id % 42 + 1),
+        "face": {"value": "front", "label": "Front"},
+        "status": {"value": "active", "label": "Active"},
+        "airflow": {"value": "front-to-rear", "label": "Front to rear"},
+        "primary_ip4": {
+            "id": id,
+            "url": f"{BASE_URL}/api/ipam/ip-addresses/{id}/",
+            "display": ipv4_address(id),
+            "family": {"value": 4, "label": "IPv4"},
+            "address": ipv4_address(id),
+            "description": "",
+        },
+        "primary_ip6": None,
+        "oob_ip": None,
+        "cluster": None,
+        "virtual_chassis": None,
+        "description": "Top of rack switch",
+        "comments": "",
+        "config_template": None,
+        "local_context_data": None,
+        "tags": [{"id": 1, "name": "production", "slug": "production", "color": "4caf50"}],
+        "custom_fields": {"warranty_end": "2027-01-01", "owner_team": "network"},
+        "created": "2024-01-15T09:30:00.000000Z",
+        "last_updated": "2025-06-01T12:00:00.000000Z",
+        "console_port_count": 1,
+        "interface_count": 52,
+        "power_port_count": 2,
+    }
+    if config_context:
+        device["config_context"] = {
+            "ntp_servers": ["10.0.0.1", "10.0.0.2"],
+            "syslog": {"servers": ["10.0.1.10"], "facility": "local7", "severity": "info"},
+            "snmp": {
+                "communities": [{"name": "monitor", "mode": "ro"}],
+                "location": f"Site {id % 40}",
+            },
+            "vlans": [{"vid": vid, "name": f"VLAN{vid}"} for vid in range(100, 120)],
+        }
+    return device
+
+
+def synthetic_ip(id: int) -> dict:
+    """Build a full ipam.ipaddress object assigned to a device interface."""
+    return {
+        "id": id,
+        "url": f"{BASE_URL}/api/ipam/ip-addresses/{id}/",
+        "display_url": f"{BASE_URL}/ipam/ip-addresses/{id}/",
+        "display": ipv4_address(id),
+        "family": {"value": 4, "label": "IPv4"},
+        "address": ipv4_address(id),
+        "vrf": None,
+        "tenant": nested(id % 12, f"Tenant {id % 12}", "tenancy/tenants"),
+        "status": {"value": "active", "label": "Active"},
+        "role": None,
+        "assigned_object_type": "dcim.interface",
+        "assigned_object_id": id,
+        "assigned_object": {
+            **nested(id, f"eth{id % 48}", "dcim/interfaces"),
+            "device": nested(id // 48, f"sw-{id // 48:05d}", "dcim/devices"),
+            "cable": None,
+            "_occupied": False,
+        },
+        "nat_inside": None,
+        "nat_outside": [],
+        "dns_name": f"host-{id}.example.com",
+        "description": "",
+        "comments": "",
+        "tags": [{"id": 1, "name": "production", "slug": "production", "color": "4caf50"}],
+        "custom_fields": {},
+        "created": "2024-01-15T09:30:00.000000Z",
+        "last_updated": "2025-06-01T12:00:00.000000Z",
+    }
+
+
+def synthetic_page(build, endpoint: str, size: int, count: int = 10_000) -> dict:
+    """Build a paginated list response with ``size`` objects of ``count`` in total."""
+    return {
+        "count": count,
+        "next": f"{BASE_URL}/api/{endpoint}/?limit={size}&offset={size}" if size < count else None,
+        "previous": None,
+        "results": [build(i) for i in range(1, size + 1)],
+    }
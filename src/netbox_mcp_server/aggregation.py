@@ -0,0 +1,196 @@
+"""
+Streaming aggregation of NetBox objects.
+
+Objects are fed to an Aggregator page by page and reduced to one row per group as they
+arrive, so that aggregating a large object set only ever holds the current page and the
+running per-group accumulators in memory.
+"""
+
+from typing import Any, NamedTuple
+
+from netbox_mcp_server.merging import sort_value
+
+# Supported metric operations; all but count take a field
+METRIC_OPS = ("count", "sum", "avg", "min", "max", "distinct")
+
+
+class Metric(NamedTuple):
+    """An aggregate computed per group, e.g. sum of vcpus."""
+
+    op: str
+    path: str | None
+
+    @property
+    def label(self) -> str:
+        """Column name of the metric in the aggregate table (e.g. 'sum:vcpus')."""
+        return self.op if self.path is None else f"{self.op}:{self.path}"
+
+
+def parse_metric(spec: str) -> Metric:
+    """
+    Parse a metric specification.
+
+    Args:
+        spec: 'count', or '<op>:<field>' with op one of sum, avg, min, max, distinct and
+              field a (dotted) field path such as 'vcpus' or 'site.name'
+
+    Returns:
+        The parsed metric
+
+    Raises:
+        ValueError: If the operation is unknown or its field is missing
+    """
+    op, _, path = spec.strip().partition(":")
+    if op not in METRIC_OPS:
+        raise ValueError(f"Unknown metric '{spec}'; use one of {', '.join(METRIC_OPS)}")
+    if op == "count":
+        if path:
+            raise ValueError("The count metric takes no field; use 'distinct:<field>'")
+        return Metric(op, None)
+    if not path:
+        raise ValueError(f"Metric '{op}' needs a field, e.g. '{op}:vcpus'")
+    return Metric(op, path)
+
+
+def field_value(obj: dict[str, Any], path: str) -> Any:
+    """Return the value at a dotted path of an object, or None if any part is missing."""
+    value: Any = obj
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def group_value(value: Any) -> Any:
+    """
+    Reduce a field value to a scalar usable as a group key.
+
+    Choice fields reduce to their value, related objects to their name (or display/id) and
+    lists (e.g. tags) to their sorted, comma-separated elements.
+    """
+    if isinstance(value, dict):
+        for key in ("value", "name", "display", "id"):
+            if key in value:
+                return group_value(value[key])
+        return None
+    if isinstance(value, list):
+        return ",".join(sorted(str(group_value(item)) for item in value))
+    return value
+
+
+def top_level_fields(paths: list[str]) -> list[str]:
+    """Return the top-level fields that must be fetched to evaluate field paths."""
+    return sorted({path.split(".", 1)[0] for path in paths})
+
+
+class _Accumulator:
+    """Running values of every metric for one group."""
+
+    __slots__ = ("count", "distinct", "maxs", "mins", "sums")
+
+    def __init__(self):
+        self.count = 0
+        self.sums: dict[str, tuple[float, int]] = {}
+        self.mins: dict[str, Any] = {}
+        self.maxs: dict[str, Any] = {}
+        self.distinct: dict[str, set] = {}
+
+
+class Aggregator:
+    """Group objects and compute count, sum, avg, min, max and distinct metrics."""
+
+    def __init__(self, group_by: list[str], metrics: list[Metric]):
+        """
+        Initialize the aggregator.
+
+        Args:
+            group_by: Field paths to group by (no grouping when empty)
+            metrics: Metrics computed per group
+        """
+        self.group_by = group_by
+        self.metrics = metrics
+        self._sum_paths = {m.path for m in metrics if m.op in ("sum", "avg")}
+        self._other_metrics = {m for m in metrics if m.op in ("min", "max", "distinct")}
+        self.groups: dict[tuple, _Accumulator] = {}
+        self.scanned = 0
+        # Metrics over all objects, kept separately only when there are several groups
+        self._totals_acc = _Accumulator()
+
+    def add(self, objects: list[dict[str, Any]]) -> None:
+        """Fold a page of objects into the running aggregates."""
+        for obj in objects:
+            key = tuple(group_value(field_value(obj, path)) for path in self.group_by)
+            acc = self.groups.get(key)
+            if acc is None:
+                acc = self.groups[key] = _Accumulator()
+            self._update(acc, obj)
+            if self.group_by:
+                self._update(self._totals_acc, obj)
+        self.scanned += len(objects)
+
+    def _update(self, acc: _Accumulator, obj: dict[str, Any]) -> None:
+        """Add one object to a group's accumulator."""
+        acc.count += 1
+        # sum and avg of a field share one running (total, n) pair
+        for path in self._sum_paths:
+            value = group_value(field_value(obj, path))
+            if isinstance(value, int | float) and not isinstance(value, bool):
+                total, n = acc.sums.get(path, (0, 0))
+                acc.sums[path] = (total + value, n + 1)
+        for metric in self._other_metrics:
+            value = group_value(field_value(obj, metric.path))
+            if value is None:
+                continue
+            path = metric.path
+            if metric.op == "min":
+                if path not in acc.mins or sort_value(value) < sort_value(acc.mins[path]):
+                    acc.mins[path] = value
+            elif metric.op == "max":
+                if path not in acc.maxs or sort_value(value) > sort_value(acc.maxs[path]):
+                    acc.maxs[path] = value
+            elif metric.op == "distinct":
+                acc.distinct.setdefault(path, set()).add(value)
+
+    def totals(self) -> dict[str, Any]:
+        """Return the metrics over all objects, regardless of their group."""
+        if not self.group_by:
+            return self._row((), self.groups.get((), self._totals_acc))
+        return self._row((), self._totals_acc)
+
+    def _row(self, key: tuple, acc: _Accumulator) -> dict[str, Any]:
+        """Build the output row of one group (or the totals, when key is empty)."""
+        row: dict[str, Any] = dict(zip(self.group_by, key, strict=False))
+        for metric in self.metrics:
+            path = metric.path
+            if metric.op == "count":
+                value: Any = acc.count
+            elif metric.op == "sum":
+                value = acc.sums.get(path, (0, 0))[0]
+            elif metric.op == "avg":
+                total, n = acc.sums.get(path, (0, 0))
+                value = round(total / n, 6) if n else None
+            elif metric.op == "min":
+                value = acc.mins.get(path)
+            elif metric.op == "max":
+                value = acc.maxs.get(path)
+            else:
+                value = len(acc.distinct.get(path, ()))
+            row[metric.label] = value
+        return row
+
+    def rows(self, max_rows: int) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Return the aggregate table, largest groups first.
+
+        Args:
+            max_rows: Maximum number of rows to return
+
+        Returns:
+            Tuple of (rows, truncated) where truncated tells whether groups were cut off
+        """
+        ordered = sorted(
+            self.groups.items(),
+            key=lambda item: (-item[1].count, [sort_value(v) for v in item[0]]),
+        )
+        return [self._row(key, acc) for key, acc in ordered[:max_rows]], len(ordered) > max_rows
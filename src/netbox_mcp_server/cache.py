@@ -0,0 +1,205 @@
+"""
+Response cache for NetBox API clients.
+
+Caches raw GET response bodies keyed on the canonicalized endpoint and query parameters,
+with per-object-type time-to-live values and least-recently-used eviction bounded by the
+total size of the cached bodies.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+
+# Reference data that rarely changes can be cached for a long time, while operational
+# data that is edited frequently should only be reused for a few seconds.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "circuits.circuittype": 3600,
+    "circuits.provider": 3600,
+    "dcim.devicerole": 3600,
+    "dcim.devicetype": 3600,
+    "dcim.manufacturer": 3600,
+    "dcim.moduletype": 3600,
+    "dcim.platform": 3600,
+    "dcim.region": 3600,
+    "dcim.sitegroup": 3600,
+    "ipam.rir": 3600,
+    "ipam.role": 3600,
+    "tenancy.tenantgroup": 3600,
+    "virtualization.clustertype": 3600,
+    "dcim.site": 600,
+    "dcim.location": 600,
+    "tenancy.tenant": 600,
+    "core.objectchange": 5,
+    "dcim.interface": 10,
+    "ipam.ipaddress": 10,
+}
+
+
+def collection_endpoint(endpoint: str) -> str:
+    """Strip a trailing object ID from an endpoint (e.g., 'dcim/sites/1' -> 'dcim/sites')."""
+    endpoint = endpoint.strip("/")
+    head, _, tail = endpoint.rpartition("/")
+    if head and tail.isdigit():
+        return head
+    return endpoint
+
+
+def make_cache_key(
+    endpoint: str, id: int | None = None, params: dict[str, Any] | None = None
+) -> str:
+    """
+    Build a canonical cache key for a GET request.
+
+    Parameters are sorted and None values dropped (both clients leave them out of the
+    request), so equivalent requests map to the same key regardless of dict ordering.
+
+    Args:
+        endpoint: The API endpoint (e.g., 'dcim/sites', 'dcim/sites/1')
+        id: Optional ID of a specific object
+        params: Optional query parameters
+
+    Returns:
+        Canonical key string
+    """
+    path = endpoint.strip("/")
+    if id is not None:
+        path = f"{path}/{id}"
+    items = sorted(
+        (str(k), [str(x) for x in v] if isinstance(v, list | tuple) else str(v))
+        for k, v in (params or {}).items()
+        if v is not None
+    )
+    return f"{path}?{json.dumps(items, separators=(',', ':'))}"
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of raw NetBox GET response bodies.
+
+    Entries expire after the TTL configured for their object type and the least recently
+    used entries are evicted once the total size of cached bodies exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached response bodies in bytes
+            default_ttl: TTL in seconds for object types without an explicit TTL
+            ttls: Per-object-type TTLs in seconds, keyed by object type
+                  (e.g., {"dcim.manufacturer": 3600}). Defaults to DEFAULT_CACHE_TTLS.
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        self._endpoint_ttls: dict[str, float] = {}
+        for object_type, ttl in ttls.items():
+            type_info = NETBOX_OBJECT_TYPES[object_type]
+            self._endpoint_ttls[type_info["endpoint"]] = ttl
+            if type_info.get("fallback_endpoint"):
+                self._endpoint_ttls[type_info["fallback_endpoint"]] = ttl
+        # key -> (collection endpoint, expiry time, body)
+        self._entries: OrderedDict[str, tuple[str, float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL in seconds that applies to responses from ``endpoint``."""
+        return self._endpoint_ttls.get(collection_endpoint(endpoint), self.default_ttl)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the cached body for ``key``, or None if missing or expired.
+
+        Args:
+            key: Key built with make_cache_key
+
+        Returns:
+            The raw response body, or None on a cache miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: str, endpoint: str, body: bytes) -> None:
+        """
+        Store a response body, evicting least recently used entries as needed.
+
+        Bodies larger than the whole cache are not stored.
+
+        Args:
+            key: Key built with make_cache_key
+            endpoint: The API endpoint the response came from (used for TTL and invalidation)
+            body: The raw response body
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (collection_endpoint(endpoint), time.monotonic() + ttl, body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop every cached response for the collection ``endpoint`` belongs to.
+
+        Args:
+            endpoint: The API endpoint that was written to (e.g., 'dcim/sites')
+
+        Returns:
+            Number of entries removed
+        """
+        collection = collection_endpoint(endpoint)
+        with self._lock:
+            stale = [k for k, entry in self._entries.items() if entry[0] == collection]
+            for key in stale:
+                self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; the caller must hold the lock."""
+        _, _, body = self._entries.pop(key)
+        self.size -= len(body)
@@ -38,6 +38,80 @@ class Settings(BaseSettings):
     verify_ssl: bool = True
     """Whether to verify SSL certificates when connecting to NetBox"""
 
+    # ===== NetBox Client Settings =====
+    netbox_client: Literal["sync", "async"] = "sync"
+    """NetBox client implementation (sync uses requests, async uses httpx with HTTP/2)"""
+
+    http2: bool = True
+    """Whether the async client negotiates HTTP/2 with NetBox"""
+
+    max_connections: int = 100
+    """Maximum number of concurrent connections to NetBox"""
+
+    max_keepalive_connections: int = 20
+    """Maximum number of idle connections kept alive by the async client"""
+
+    keepalive_expiry: float = 5.0
+    """Seconds an idle connection is kept alive by the async client"""
+
+    json_decoder: Literal["auto", "orjson", "msgspec", "json"] = "auto"
+    """JSON decoder for NetBox responses (auto prefers orjson, then msgspec, then stdlib json)"""
+
+    raw_passthrough: bool = True
+    """Whether tools that do not post-process NetBox's JSON return the response body as-is
+    (with lean_responses on, only for queries with explicit fields)"""
+
+    lean_responses: bool = True
+    """Whether tools strip links, nulls and related-object detail from returned objects
+    (except for changelogs, and for queries with explicit fields when raw_passthrough is
+    on); the savings are logged at info level per tool call"""
+
+    replica_path: str | None = None
+    """SQLite replica (built with netbox-mcp-replica) to serve reads from, instead of NetBox"""
+
+    # ===== Response Cache Settings =====
+    cache_enabled: bool = False
+    """Whether GET responses are cached in memory (invalidated by the client's own writes)"""
+
+    cache_max_bytes: int = 64 * 1024 * 1024
+    """Maximum total size of cached response bodies in bytes"""
+
+    cache_default_ttl: float = 60.0
+    """TTL in seconds for object types without a built-in TTL"""
+
+    count_cache_ttl: float = 30.0
+    """Seconds netbox_count_objects reuses a count for (0 disables count caching)"""
+
+    # ===== Timeout Settings =====
+    request_timeout: float = 30.0
+    """Seconds to wait for NetBox to connect or send data, per request (0 disables)"""
+
+    tool_timeout: float = 120.0
+    """Seconds after which a tool call is cancelled, with its pending NetBox requests (0 disables)"""
+
+    # ===== Retry Settings =====
+    retry_max_retries: int = 3
+    """Maximum retries of a request that failed with 429/502/503/504 or a connection error"""
+
+    retry_backoff: float = 0.5
+    """Backoff ceiling in seconds for the first retry (doubled per retry, with full jitter)"""
+
+    retry_backoff_max: float = 10.0
+    """Maximum backoff ceiling in seconds"""
+
+    retry_deadline: float = 30.0
+    """Total retry budget in seconds shared by all NetBox requests of one tool call"""
+
+    retry_writes: bool = False
+    """Whether create/update/delete and bulk requests are retried too"""
+
+    # ===== Search Settings =====
+    search_concurrency: int = 8
+    """Maximum number of object types netbox_search_objects queries concurrently"""
+
+    search_timeout: float = 10.0
+    """Seconds after which netbox_search_objects reports still-running object types as timed out"""
+
     # ===== Observability Settings =====
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     """Logging verbosity level"""
@@ -61,6 +135,54 @@ class Settings(BaseSettings):
             raise ValueError(f"Port must be between 1 and 65535, got {v}")
         return v
 
+    @field_validator("max_connections", "max_keepalive_connections")
+    @classmethod
+    def validate_connection_limits(cls, v: int) -> int:
+        """Ensure connection pool limits are positive."""
+        if v < 1:
+            raise ValueError(f"Connection limits must be at least 1, got {v}")
+        return v
+
+    @field_validator("search_concurrency", "search_timeout")
+    @classmethod
+    def validate_search_settings(cls, v: float) -> float:
+        """Ensure search concurrency and deadline are positive."""
+        if v <= 0:
+            raise ValueError(f"Search settings must be positive, got {v}")
+        return v
+
+    @field_validator("cache_max_bytes")
+    @classmethod
+    def validate_cache_max_bytes(cls, v: int) -> int:
+        """Ensure the cache size bound is positive."""
+        if v < 1:
+            raise ValueError(f"Cache size must be at least 1 byte, got {v}")
+        return v
+
+    @field_validator("count_cache_ttl")
+    @classmethod
+    def validate_count_cache_ttl(cls, v: float) -> float:
+        """Ensure the count cache TTL is not negative."""
+        if v < 0:
+            raise ValueError(f"Count cache TTL must not be negative, got {v}")
+        return v
+
+    @field_validator("request_timeout", "tool_timeout")
+    @classmethod
+    def validate_timeouts(cls, v: float) -> float:
+        """Ensure timeouts are not negative."""
+        if v < 0:
+            raise ValueError(f"Timeouts must not be negative, got {v}")
+        return v
+
+    @field_validator("retry_max_retries", "retry_backoff", "retry_backoff_max", "retry_deadline")
+    @classmethod
+    def validate_retry_settings(cls, v: float) -> float:
+        """Ensure retry settings are not negative."""
+        if v < 0:
+            raise ValueError(f"Retry settings must not be negative, got {v}")
+        return v
+
     @field_validator("netbox_url")
     @classmethod
     def validate_netbox_url(cls, v: AnyUrl) -> AnyUrl:
@@ -90,6 +212,18 @@ class Settings(BaseSettings):
             "host": self.host if self.transport == "http" else "N/A",
             "port": self.port if self.transport == "http" else "N/A",
             "verify_ssl": self.verify_ssl,
+            "netbox_client": self.netbox_client,
+            "http2": self.http2 if self.netbox_client == "async" else "N/A",
+            "max_connections": self.max_connections,
+            "json_decoder": self.json_decoder,
+            "raw_passthrough": self.raw_passthrough,
+            "lean_responses": self.lean_responses,
+            "replica_path": self.replica_path,
+            "cache_enabled": self.cache_enabled,
+            "count_cache_ttl": self.count_cache_ttl,
+            "request_timeout": self.request_timeout,
+            "tool_timeout": self.tool_timeout,
+            "retry_max_retries": self.retry_max_retries,
             "log_level": self.log_level,
         }
 
@@ -0,0 +1,123 @@
+"""
+Deduplication of the related objects NetBox embeds in every object.
+
+A page of 100 devices embeds the same site, role, device type and tenant dicts in nearly
+every row. The Interner makes a crawl hold a single copy of each distinct nested dict,
+and normalize_objects moves related objects out of the rows into one table of unique
+entities, leaving their IDs behind as references.
+"""
+
+from typing import Any
+
+# Distinct nested dicts an Interner keeps before it stops interning new ones
+MAX_INTERNED = 100_000
+
+
+def _token(value: Any) -> Any:
+    """Return a hashable key for a value whose nested dicts are already interned."""
+    if isinstance(value, dict):
+        # Interned dicts are kept alive by the interner, so their identity is stable
+        return ("dict", id(value))
+    if isinstance(value, list):
+        return ("list", *(_token(item) for item in value))
+    if isinstance(value, str):
+        return value
+    # Keep 1, 1.0 and True apart
+    return (value.__class__, value)
+
+
+class Interner:
+    """
+    Share one copy of each distinct nested dict across the objects of a crawl.
+
+    Nested dicts (related objects, choices, custom fields, ...) with equal content are
+    replaced by the first copy seen. Interned dicts are shared between objects, so code
+    handling interned objects must replace nested dicts rather than modify them.
+    """
+
+    def __init__(self, max_entries: int = MAX_INTERNED):
+        """
+        Initialize the interner.
+
+        Args:
+            max_entries: Distinct nested dicts to keep; once reached, only the dicts kept
+                         so far are shared
+        """
+        self.max_entries = max_entries
+        self._seen: dict[tuple, dict[str, Any]] = {}
+        self.hits = 0
+
+    def intern(self, obj: dict[str, Any]) -> dict[str, Any]:
+        """
+        Replace the nested dicts of an object, in place, by their shared copies.
+
+        Args:
+            obj: A top-level object (which is not itself interned)
+
+        Returns:
+            The object
+        """
+        for key, value in obj.items():
+            if isinstance(value, dict | list):
+                obj[key] = self._intern(value)
+        return obj
+
+    def _intern(self, value: Any) -> Any:
+        """Intern a nested value, children first, returning its shared copy."""
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if isinstance(item, dict | list):
+                    value[i] = self._intern(item)
+            return value
+        for key, item in value.items():
+            if isinstance(item, dict | list):
+                value[key] = self._intern(item)
+        key = tuple((name, _token(item)) for name, item in value.items())
+        shared = self._seen.get(key)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        if len(self._seen) < self.max_entries:
+            self._seen[key] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def _is_related(value: Any) -> bool:
+    """Tell whether a field value is an embedded related object."""
+    return isinstance(value, dict) and "id" in value
+
+
+def normalize_objects(objects: list[dict[str, Any]]) -> dict[str, dict[int, dict[str, Any]]]:
+    """
+    Replace the related objects embedded in objects by their IDs, in place.
+
+    Each related object moves to a table keyed by the field it appeared in, so that
+    ``row["site"] == 3`` refers to ``entities["site"][3]``. Lists of related objects
+    (e.g. tags) become lists of IDs. A generic relation whose ID is already taken by an
+    object of another type (e.g. assigned_object) is left inline.
+
+    Args:
+        objects: The objects, as decoded from NetBox
+
+    Returns:
+        The unique related objects, per field and ID
+    """
+    entities: dict[str, dict[int, dict[str, Any]]] = {}
+
+    def reference(field: str, related: dict[str, Any]) -> Any:
+        table = entities.setdefault(field, {})
+        known = table.setdefault(related["id"], related)
+        if known is not related and known.get("url") != related.get("url"):
+            return related
+        return related["id"]
+
+    for obj in objects:
+        for field, value in obj.items():
+            if _is_related(value):
+                obj[field] = reference(field, value)
+            elif isinstance(value, list) and value and all(map(_is_related, value)):
+                obj[field] = [reference(field, item) for item in value]
+    return {field: table for field, table in entities.items() if table}
@@ -0,0 +1,369 @@
+"""
+Join planning for multi-hop relationship filters.
+
+NetBox's REST API only filters on an object's own fields, so a filter such as
+``device__site_id`` on interfaces cannot be sent as-is. The planner rewrites it into a
+direct filter: the inner relation (devices with ``site_id``) is resolved to an ID set with
+id-only queries, and the outer query filters on ``device_id`` with those IDs. Relations
+can be nested (``interface__device__site`` on IP addresses) and are resolved innermost
+first. Resolved ID sets are cached per MCP session for a short time, so follow-up pages
+and refinements of the same question do not resolve them again.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from typing import Any
+from urllib.parse import urlencode
+
+from netbox_mcp_server.netbox_client import chunk_ids, iter_pages
+from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+
+# Lookup expressions NetBox accepts after a field name (e.g. name__ic)
+LOOKUP_SUFFIXES = frozenset(
+    {
+        "n",
+        "ic",
+        "nic",
+        "isw",
+        "nisw",
+        "iew",
+        "niew",
+        "ie",
+        "nie",
+        "empty",
+        "regex",
+        "iregex",
+        "lt",
+        "lte",
+        "gt",
+        "gte",
+        "in",
+    }
+)
+
+# Parameters that are not filters
+CONTROL_PARAMS = frozenset({"limit", "offset", "fields", "brief", "ordering", "q"})
+
+# Relations of an object type whose target cannot be derived from the relation's name
+RELATION_TYPES = {
+    ("virtualization.virtualmachine", "role"): "dcim.devicerole",
+    ("tenancy.contactassignment", "role"): "tenancy.contactrole",
+    ("circuits.circuitgroupassignment", "group"): "circuits.circuitgroup",
+    ("ipam.fhrpgroupassignment", "group"): "ipam.fhrpgroup",
+}
+
+# Relation names many object types use for different models; never matched across apps
+GENERIC_RELATIONS = frozenset({"group", "role", "type"})
+
+# Most objects an inner relation may resolve to
+MAX_JOIN_IDS = 10_000
+
+# Objects requested per page when resolving an inner relation
+ID_PAGE_SIZE = 1000
+
+# Maximum number of id-only page requests in flight while resolving one relation
+ID_CONCURRENCY = 4
+
+# Room left for the scheme, host and API prefix when sizing chunks of resolved IDs
+URL_PREFIX_LENGTH = 200
+
+# Fetches a list endpoint: (endpoint, params=..., fallback_endpoint=...) -> response dict
+Fetch = Callable[..., Awaitable[dict[str, Any]]]
+
+
+def is_multi_hop(filter_name: str) -> bool:
+    """Return whether a filter traverses a relation, e.g. 'device__site_id'."""
+    parts = filter_name.split("__")
+    if len(parts) <= 1:
+        return False
+    return not (len(parts) == 2 and parts[1] in LOOKUP_SUFFIXES)
+
+
+def related_object_type(object_type: str, relation: str) -> str:
+    """
+    Return the object type a relation of an object type points to.
+
+    Relations are matched by name: first as a model of the outer type's own
+    (dcim.site's 'group' is dcim.sitegroup, dcim.rack's 'role' is dcim.rackrole), then as
+    a model of its app (ipam.prefix's 'role' is ipam.role), then as the only model of that
+    name in any app (dcim.device's 'tenant' is tenancy.tenant). Generic names such as
+    'group' are never matched across apps.
+
+    Args:
+        object_type: The outer object type (e.g. 'dcim.interface')
+        relation: The relation name (e.g. 'device', 'virtual_machine')
+
+    Returns:
+        The related object type (e.g. 'dcim.device')
+
+    Raises:
+        ValueError: If the relation cannot be resolved to a single object type
+    """
+    if (object_type, relation) in RELATION_TYPES:
+        return RELATION_TYPES[object_type, relation]
+    app, outer = object_type.split(".", 1)
+    model = relation.replace("_", "")
+    for candidate in (f"{app}.{outer}{model}", f"{app}.{model}"):
+        if candidate in NETBOX_OBJECT_TYPES:
+            return candidate
+    matches = [t for t in NETBOX_OBJECT_TYPES if t.split(".", 1)[1] == model]
+    if len(matches) == 1 and relation not in GENERIC_RELATIONS:
+        return matches[0]
+    raise ValueError(
+        f"'{relation}' is neither a lookup suffix nor a relation of {object_type} that can "
+        f"be resolved to an object type; filter on '{relation}_id' instead"
+    )
+
+
+def check_relations(object_type: str, filters: dict[str, Any]) -> None:
+    """
+    Check that every relation a set of filters traverses resolves to an object type.
+
+    Lets a query fail before any of its relations is resolved against NetBox.
+
+    Args:
+        object_type: The object type being queried
+        filters: The query's filters, possibly with multi-hop filters
+
+    Raises:
+        ValueError: If a multi-hop filter traverses a relation that cannot be resolved
+    """
+    for name in filters:
+        if name in CONTROL_PARAMS:
+            continue
+        target, path = object_type, name
+        try:
+            while is_multi_hop(path):
+                relation, path = path.split("__", 1)
+                target = related_object_type(target, relation)
+        except ValueError as e:
+            raise ValueError(f"Invalid filter '{name}': {e}") from e
+
+
+class IdSetCache:
+    """Short-lived LRU cache of resolved ID sets, keyed per session."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a resolved ID set is reused for
+            max_entries: Maximum number of cached ID sets across sessions
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, list[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(session: str | None, object_type: str, filters: dict[str, Any]) -> tuple:
+        """Build the cache key of an ID set."""
+        canonical = json.dumps(filters, sort_keys=True, default=str)
+        return (session, object_type, hashlib.sha256(canonical.encode()).hexdigest())
+
+    def get(self, key: tuple) -> list[int] | None:
+        """Return a cached ID set, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, ids = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return ids
+
+    def set(self, key: tuple, ids: list[int]) -> None:
+        """Cache an ID set, evicting the least recently used ones beyond max_entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached ID set."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class JoinPlanner:
+    """Rewrite multi-hop filters into direct ``<relation>_id`` filters."""
+
+    def __init__(self, fetch: Fetch, cache: IdSetCache | None = None):
+        """
+        Initialize the planner.
+
+        Args:
+            fetch: Coroutine function fetching one page of a list endpoint
+            cache: Cache for resolved ID sets (a new one when None)
+        """
+        self.fetch = fetch
+        self.cache = cache if cache is not None else IdSetCache()
+
+    async def plan(
+        self, object_type: str, filters: dict[str, Any], session: str | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Rewrite the multi-hop filters of a query into direct ID-list filters.
+
+        Args:
+            object_type: The object type being queried
+            filters: The query's filters, possibly with multi-hop filters
+            session: Key of the MCP session the resolved ID sets are cached for
+
+        Returns:
+            The filters with every multi-hop filter replaced by a '<relation>_id' filter
+            holding the matching IDs, or None if a relation matches no object at all
+            (so nothing can match the query)
+
+        Raises:
+            ValueError: If a relation cannot be resolved or matches too many objects
+        """
+        direct: dict[str, Any] = {}
+        relations: dict[str, dict[str, Any]] = {}
+        targets: dict[str, str] = {}
+        for name, value in filters.items():
+            if name in CONTROL_PARAMS or not is_multi_hop(name):
+                direct[name] = value
+                continue
+            relation, inner = name.split("__", 1)
+            if relation not in targets:
+                try:
+                    targets[relation] = related_object_type(object_type, relation)
+                except ValueError as e:
+                    raise ValueError(f"Invalid filter '{name}': {e}") from e
+            relations.setdefault(relation, {})[inner] = value
+
+        resolved = await asyncio.gather(
+            *(
+                self.resolve(targets[relation], inner, session)
+                for relation, inner in relations.items()
+            )
+        )
+        for relation, ids in zip(relations, resolved, strict=True):
+            if not ids:
+                return None
+            key = f"{relation}_id"
+            if key in direct:
+                # Both a direct and a multi-hop filter on the relation: intersect them
+                given = direct[key] if isinstance(direct[key], list) else [direct[key]]
+                allowed = {str(g) for g in given}
+                ids = [id for id in ids if str(id) in allowed]
+                if not ids:
+                    return None
+            direct[key] = ids
+        return direct
+
+    async def resolve(
+        self,
+        object_type: str,
+        filters: dict[str, Any],
+        session: str | None = None,
+        cache: bool = True,
+    ) -> list[int]:
+        """
+        Resolve the objects of a type matching filters (possibly multi-hop) to their IDs.
+
+        Args:
+            object_type: The object type to resolve
+            filters: Filters on that object type
+            session: Key of the MCP session the result is cached for
+            cache: Whether the result itself is cached; False for ID sets that are the
+                   final answer to a query (the relations they are resolved through are
+                   cached either way)
+
+        Returns:
+            Sorted IDs of the matching objects
+
+        Raises:
+            ValueError: If the filters match more than MAX_JOIN_IDS objects
+        """
+        key = IdSetCache.key(session, object_type, filters)
+        if cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        planned = await self.plan(object_type, filters, session)
+        if planned is None:
+            ids: list[int] = []
+        else:
+            ids = await self._fetch_ids(object_type, planned)
+        if cache:
+            self.cache.set(key, ids)
+        return ids
+
+    async def _fetch_ids(self, object_type: str, filters: dict[str, Any]) -> list[int]:
+        """Run an id-only query, splitting a long resolved ID-list filter into chunks."""
+        info = NETBOX_OBJECT_TYPES[object_type]
+        endpoint, fallback = info["endpoint"], info.get("fallback_endpoint")
+        params = {**filters, "fields": "id", "ordering": "id"}
+        # Bounds the page requests of all chunks together
+        semaphore = asyncio.Semaphore(ID_CONCURRENCY)
+
+        lists = [k for k, v in params.items() if isinstance(v, list) and k.endswith("_id")]
+        if not lists:
+            ids = await self._fetch_id_pages(object_type, endpoint, fallback, params, semaphore)
+            return sorted(ids)
+        name = max(lists, key=lambda key: len(params[key]))
+        rest = {k: v for k, v in params.items() if k != name}
+        base_length = URL_PREFIX_LENGTH + len(endpoint) + len(urlencode(rest, doseq=True))
+        ids: set[int] = set()
+        for part in await asyncio.gather(
+            *(
+                self._fetch_id_pages(
+                    object_type, endpoint, fallback, {**rest, name: chunk}, semaphore
+                )
+                for chunk in chunk_ids(params[name], base_length, name=name)
+            )
+        ):
+            ids |= part
+        if len(ids) > MAX_JOIN_IDS:
+            raise self._too_many(object_type, len(ids))
+        return sorted(ids)
+
+    async def _fetch_id_pages(
+        self,
+        object_type: str,
+        endpoint: str,
+        fallback: str | None,
+        params: dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> set[int]:
+        """Page through an id-only query, with the semaphore bounding requests in flight."""
+
+        async def fetch(offset: int, limit: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.fetch(
+                    endpoint,
+                    params={**params, "offset": offset, "limit": limit},
+                    fallback_endpoint=fallback,
+                )
+
+        ids: set[int] = set()
+        async with aclosing(iter_pages(fetch, ID_PAGE_SIZE, concurrency=ID_CONCURRENCY)) as pages:
+            async for page in pages:
+                if not ids and page.get("count", 0) > MAX_JOIN_IDS:
+                    raise self._too_many(object_type, page["count"])
+                ids.update(obj["id"] for obj in page.get("results", []))
+        return ids
+
+    @staticmethod
+    def _too_many(object_type: str, count: int) -> ValueError:
+        """Build the error for filters that match more than MAX_JOIN_IDS objects."""
+        return ValueError(
+            f"The filters on {object_type} match {count} objects (more than "
+            f"{MAX_JOIN_IDS}); narrow them"
+        )
@@ -0,0 +1,67 @@
+"""
+Pluggable JSON decoding for NetBox response bodies.
+
+Full objects such as dcim.device with config context and nested relations are large, and
+decoding them with the stdlib parser dominates CPU time for big pages. When orjson or
+msgspec is installed it is used instead; otherwise the stdlib decoder is the fallback.
+"""
+
+import importlib
+import json
+import logging
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Preference order for backend="auto"
+DECODER_BACKENDS = ("orjson", "msgspec", "json")
+
+
+class JsonDecoder(NamedTuple):
+    """A named JSON decoding function accepting bytes or str."""
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+
+
+def _load_backend(name: str) -> JsonDecoder:
+    """Import a decoder backend, raising ImportError if it is not installed."""
+    if name == "json":
+        return JsonDecoder("json", json.loads)
+    if name == "orjson":
+        orjson = importlib.import_module("orjson")
+        return JsonDecoder("orjson", orjson.loads)
+    if name == "msgspec":
+        msgspec_json = importlib.import_module("msgspec.json")
+        return JsonDecoder("msgspec", msgspec_json.Decoder().decode)
+    raise ValueError(
+        f"Unknown JSON decoder '{name}'. Valid options: auto, {', '.join(DECODER_BACKENDS)}"
+    )
+
+
+def get_decoder(backend: str = "auto") -> JsonDecoder:
+    """
+    Select a JSON decoder.
+
+    Args:
+        backend: 'auto' for the fastest installed backend, or one of 'orjson', 'msgspec', 'json'
+
+    Returns:
+        The selected decoder
+
+    Raises:
+        ValueError: If the backend is unknown or was requested explicitly but is not installed
+    """
+    if backend != "auto":
+        try:
+            return _load_backend(backend)
+        except ImportError as e:
+            raise ValueError(f"JSON decoder '{backend}' is not installed") from e
+
+    for name in DECODER_BACKENDS[:-1]:
+        try:
+            return _load_backend(name)
+        except ImportError:
+            logger.debug(f"JSON decoder '{name}' not installed, trying next")
+    return _load_backend("json")
@@ -0,0 +1,112 @@
+"""
+Merging of list results fetched with several NetBox queries.
+
+When one logical query has to be split into several requests (ID lists too long for one
+URL, OR-ed filter branches), each request fetches the first offset + limit objects of its
+part in the requested order. The parts are then deduplicated by ``id``, re-sorted and
+sliced here, so the caller still sees a single ordered page.
+"""
+
+from typing import Any
+
+# Most objects one merged query may fetch per request (NetBox's default MAX_PAGE_SIZE)
+MAX_MERGE_WINDOW = 1000
+
+
+def parse_ordering(ordering: str | None) -> list[tuple[str, bool]]:
+    """
+    Parse a NetBox ordering parameter.
+
+    Args:
+        ordering: Comma-separated field names, each optionally prefixed with '-'
+
+    Returns:
+        List of (field, descending) pairs; ordering by id when none is given
+    """
+    fields = [f.strip() for f in (ordering or "").split(",") if f.strip()]
+    if not fields:
+        return [("id", False)]
+    return [(f.lstrip("-"), f.startswith("-")) for f in fields]
+
+
+def sort_value(value: Any) -> tuple:
+    """Return a key that orders mixed JSON values (nulls first, then numbers, then text)."""
+    if isinstance(value, dict):
+        for key in ("value", "name", "display", "id"):
+            if key in value:
+                return sort_value(value[key])
+        return (0, "")
+    if value is None:
+        return (0, "")
+    if isinstance(value, bool | int | float):
+        return (1, value)
+    if isinstance(value, list):
+        return (3, len(value))
+    return (2, str(value).casefold())
+
+
+def branch_params(
+    params: dict[str, Any], offset: int, limit: int
+) -> tuple[dict[str, Any], set[str]]:
+    """
+    Build the query parameters one part of a merged query is fetched with.
+
+    Every part fetches the first offset + limit objects, so that the merged page can be
+    cut from them. Fields needed to dedupe and re-sort the parts are added to a ``fields``
+    projection and returned, so that they can be stripped again afterwards.
+
+    Args:
+        params: Query parameters of the logical query (without limit/offset)
+        offset: Offset of the requested page
+        limit: Size of the requested page
+
+    Returns:
+        Tuple of (parameters for each part, fields added to the projection)
+
+    Raises:
+        ValueError: If the page lies too deep to be merged
+    """
+    window = offset + limit
+    if window > MAX_MERGE_WINDOW:
+        raise ValueError(
+            f"offset + limit may not exceed {MAX_MERGE_WINDOW} for this query; "
+            "narrow the filters instead of paging deeper"
+        )
+    params = {**params, "limit": window, "offset": 0}
+    added: set[str] = set()
+    if params.get("fields"):
+        fields = [f for f in str(params["fields"]).split(",") if f]
+        needed = ["id", *(field for field, _ in parse_ordering(params.get("ordering")))]
+        added = {f for f in needed if f not in fields}
+        params["fields"] = ",".join([*fields, *sorted(added)])
+    return params, added
+
+
+def merge_results(
+    parts: list[list[dict[str, Any]]],
+    ordering: str | None,
+    offset: int,
+    limit: int,
+    added_fields: set[str] | frozenset[str] = frozenset(),
+) -> list[dict[str, Any]]:
+    """
+    Merge the results of several queries into one page.
+
+    Args:
+        parts: Results of each query, each already holding its first offset + limit objects
+        ordering: The requested ordering
+        offset: Offset of the requested page
+        limit: Size of the requested page
+        added_fields: Fields added by branch_params, removed from the returned objects
+
+    Returns:
+        The objects of the requested page, deduplicated by id
+    """
+    merged = list({obj["id"]: obj for part in parts for obj in part}.values())
+    # Stable sorts from the last ordering field to the first give a multi-key sort
+    for field, descending in reversed(parse_ordering(ordering)):
+        merged.sort(key=lambda obj, field=field: sort_value(obj.get(field)), reverse=descending)
+    page = merged[offset : offset + limit]
+    if added_fields:
+        page = [{k: v for k, v in obj.items() if k not in added_fields} for obj in page]
+    return page
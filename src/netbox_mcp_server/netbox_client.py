@@ -2,13 +2,255 @@
 """
 NetBox Client Library
 
-This module provides a base class for NetBox client implementations and a REST API implementation.
+This module provides a base class for NetBox client implementations, a blocking REST API
+implementation built on requests, and an asynchronous REST API implementation built on httpx.
 """
 
 import abc
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing, closing
+from itertools import islice
 from typing import Any
+from urllib.parse import urlencode
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from netbox_mcp_server.cache import ResponseCache, collection_endpoint, make_cache_key
+from netbox_mcp_server.entities import Interner
+from netbox_mcp_server.jsoncodec import JsonDecoder
+from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+from netbox_mcp_server.retry import RequestCancelledError, RetryPolicy, check_cancelled
+from netbox_mcp_server.singleflight import AsyncSingleFlight, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Longest request URL get_many builds; stays below common proxy and server limits (~8 KB)
+MAX_URL_LENGTH = 2000
+
+# Most IDs requested at once, kept within NetBox's default MAX_PAGE_SIZE
+MAX_IDS_PER_REQUEST = 1000
+
+
+def chunk_ids(
+    ids: list[int], base_length: int, max_length: int = MAX_URL_LENGTH, name: str = "id"
+) -> list[list[int]]:
+    """
+    Split IDs into chunks whose repeated ``id=`` parameters keep a URL under a length.
+
+    Args:
+        ids: The IDs to split
+        base_length: Length of the URL without any ID parameters
+        max_length: Maximum URL length
+        name: Name of the repeated parameter (e.g. 'device_id')
+
+    Returns:
+        Chunks of IDs, in order; each holds at least one ID
+    """
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    length = base_length
+    for id in ids:
+        extra = len(f"&{name}={id}")
+        if chunk and (length + extra > max_length or len(chunk) >= MAX_IDS_PER_REQUEST):
+            chunks.append(chunk)
+            chunk, length = [], base_length
+        chunk.append(id)
+        length += extra
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def remaining_offsets(first: dict[str, Any], max_items: int | None = None) -> range:
+    """
+    Plan the pages of a list query that follow its first page.
+
+    NetBox may cap the page size (MAX_PAGE_SIZE), so the pages step by the number of
+    objects the first page actually holds rather than by the requested limit.
+
+    Args:
+        first: The first page (offset 0) of the query
+        max_items: Optional maximum number of objects to fetch in total
+
+    Returns:
+        The offsets of the remaining pages; its step is the page size and its stop the
+        number of objects to fetch. Empty when the first page holds everything.
+    """
+    results = first.get("results", [])
+    step = len(results)
+    total = first.get("count", step)
+    if max_items is not None:
+        total = min(total, max_items)
+    if not results or not first.get("next") or step >= total:
+        return range(0)
+    return range(step, total, step)
+
+
+async def iter_pages(
+    fetch: Callable[[int, int], Awaitable[dict[str, Any]]],
+    page_size: int,
+    max_items: int | None = None,
+    concurrency: int = 1,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Fetch the pages of a list query in order, with up to ``concurrency`` in flight.
+
+    Sequentially, the next page is requested while the caller handles the current one and
+    the crawl follows the pages' next links. With concurrency > 1, the offsets of all pages
+    are computed from the first page's count and fetched through a sliding window.
+
+    Args:
+        fetch: Coroutine function fetching the page at (offset, limit)
+        page_size: Number of objects requested per page
+        max_items: Optional maximum number of objects to fetch; pages hold no more in total
+                   (the first page is still fetched when it is 0, for its count)
+        concurrency: Maximum number of page requests in flight
+
+    Yields:
+        The pages, first one first
+    """
+
+    def start(offset: int, size: int) -> asyncio.Task:
+        if max_items is not None:
+            size = max(1, min(size, max_items - offset))
+        return asyncio.ensure_future(fetch(offset, size))
+
+    first = await start(0, page_size)
+    if max_items is not None and len(first.get("results", [])) > max_items:
+        first = {**first, "results": first["results"][: max(0, max_items)]}
+    offsets = remaining_offsets(first, max_items)
+    if not offsets:
+        yield first
+        return
+
+    window: deque[asyncio.Task] = deque()
+    try:
+        if concurrency > 1:
+            pending = iter(offsets)
+            window.extend(start(offset, offsets.step) for offset in islice(pending, concurrency))
+            yield first
+            while window:
+                page = await window.popleft()
+                offset = next(pending, None)
+                if offset is not None:
+                    window.append(start(offset, offsets.step))
+                yield page
+            return
+
+        offset = offsets.start
+        window.append(start(offset, offsets.step))
+        yield first
+        while window:
+            page = await window.popleft()
+            results = page.get("results", [])
+            offset += len(results)
+            if results and page.get("next") and offset < offsets.stop:
+                window.append(start(offset, offsets.step))
+            yield page
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """
+    Parse the numeric part of a NetBox version string.
+
+    Args:
+        version: Version string as reported by /api/status/ (e.g., '4.3.7-Docker-3.3.0')
+
+    Returns:
+        Tuple of version components (e.g., (4, 3, 7))
+    """
+    match = re.match(r"\d+(?:\.\d+)*", version.strip().lstrip("v"))
+    if not match:
+        return ()
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+class EndpointResolver:
+    """
+    Remembers whether version-dependent endpoints resolve to their primary or fallback path.
+
+    The map is keyed on the primary collection endpoint (e.g., 'core/object-types') and is
+    filled either from the NetBox version reported by /api/status/ or by learning from the
+    first request that had to fall back. Once an endpoint is resolved, requests go straight
+    to the right path and never pay for a second round trip.
+    """
+
+    def __init__(self):
+        self.netbox_version: str | None = None
+        self.resolved: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def apply_version(self, version: str) -> None:
+        """
+        Resolve every fallback-capable type in NETBOX_OBJECT_TYPES for a NetBox version.
+
+        Args:
+            version: NetBox version string (e.g., '4.3.7')
+        """
+        parsed = parse_version(version)
+        with self._lock:
+            self.netbox_version = version
+            for type_info in NETBOX_OBJECT_TYPES.values():
+                fallback = type_info.get("fallback_endpoint")
+                threshold = type_info.get("fallback_before")
+                if not fallback or not threshold or not parsed:
+                    continue
+                use_fallback = parsed < parse_version(threshold)
+                self.resolved[type_info["endpoint"]] = (
+                    fallback if use_fallback else type_info["endpoint"]
+                )
+
+    def resolve(self, endpoint: str, fallback_endpoint: str | None) -> tuple[str, str | None]:
+        """
+        Return the (endpoint, fallback_endpoint) pair to actually request.
+
+        Resolved endpoints are returned without a fallback so a genuine 404 is not retried.
+
+        Args:
+            endpoint: The primary endpoint, optionally with a trailing object ID
+            fallback_endpoint: The fallback endpoint, optionally with a trailing object ID
+        """
+        if not fallback_endpoint:
+            return endpoint, fallback_endpoint
+        resolved = self.resolved.get(collection_endpoint(endpoint))
+        if resolved is None:
+            return endpoint, fallback_endpoint
+        if resolved == collection_endpoint(fallback_endpoint):
+            return fallback_endpoint, None
+        return endpoint, None
+
+    def record(self, endpoint: str, used: str) -> None:
+        """
+        Remember which path served a successful request for a fallback-capable endpoint.
+
+        Args:
+            endpoint: The primary endpoint that was requested
+            used: The endpoint that returned the successful response
+        """
+        primary = collection_endpoint(endpoint)
+        resolved = collection_endpoint(used)
+        with self._lock:
+            if self.resolved.get(primary) != resolved:
+                logger.debug(f"Resolved NetBox endpoint {primary} -> {resolved}")
+                self.resolved[primary] = resolved
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the probed NetBox version and resolved endpoint map for debugging."""
+        with self._lock:
+            return {"netbox_version": self.netbox_version, "resolved": dict(self.resolved)}
 
 
 class NetBoxClientBase(abc.ABC):
@@ -19,6 +261,21 @@ class NetBoxClientBase(abc.ABC):
     either via the REST API or directly via the ORM in a NetBox plugin.
     """
 
+    # Fast JSON decoder for response bodies; None keeps the HTTP library's stdlib decoding
+    decoder: JsonDecoder | None = None
+
+    def _loads(self, body: bytes | str) -> Any:
+        """Decode a raw JSON body with the configured decoder."""
+        if self.decoder is None:
+            return json.loads(body)
+        return self.decoder.loads(body)
+
+    def _decode(self, response: requests.Response | httpx.Response) -> Any:
+        """Decode an HTTP response body with the configured decoder."""
+        if self.decoder is None:
+            return response.json()
+        return self.decoder.loads(response.content)
+
     @abc.abstractmethod
     def get(
         self,
@@ -47,6 +304,206 @@ class NetBoxClientBase(abc.ABC):
         """
         pass
 
+    def get_raw(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> bytes:
+        """
+        Retrieve one or more objects from NetBox as an undecoded JSON body.
+
+        Implementations that receive JSON over the wire should override this to return the
+        body as-is; the default encodes the result of get().
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+
+        Returns:
+            The JSON body, shaped like the return value of get()
+        """
+        return json.dumps(self.get(endpoint, id, params, fallback_endpoint)).encode()
+
+    def _id_chunks(self, endpoint: str, ids: list[int], params: dict[str, Any]) -> list[list[int]]:
+        """Chunk IDs for get_many so that each request URL stays under MAX_URL_LENGTH."""
+        base_url = f"{getattr(self, 'api_url', '')}/{endpoint.strip('/')}/"
+        # limit is sized per chunk; reserve room for it
+        base_length = len(base_url) + len(urlencode(params, doseq=True)) + len("?&limit=1000")
+        return chunk_ids(ids, base_length)
+
+    @staticmethod
+    def _collect_many(
+        ids: list[int], pages: list[dict[str, Any]]
+    ) -> dict[str, dict[int, Any] | list[int]]:
+        """
+        Key the objects of get_many's pages by ID and list the IDs that were not found.
+
+        The objects' nested dicts are interned, so that the site, role, ... shared by many
+        objects are held once.
+        """
+        interner = Interner()
+        found = {
+            obj["id"]: interner.intern(obj) for page in pages for obj in page.get("results", [])
+        }
+        return {
+            "results": {id: found[id] for id in ids if id in found},
+            "missing": [id for id in ids if id not in found],
+        }
+
+    @staticmethod
+    def _many_params(ids: list[int], params: dict[str, Any] | None) -> tuple[list[int], dict]:
+        """Deduplicate get_many's IDs and make sure its projected objects keep their id."""
+        ids = list(dict.fromkeys(int(id) for id in ids))
+        params = {k: v for k, v in (params or {}).items() if k not in ("id", "limit", "offset")}
+        fields = params.get("fields")
+        if fields and "id" not in str(fields).split(","):
+            params["fields"] = f"{fields},id"
+        return ids, params
+
+    def get_many(
+        self,
+        endpoint: str,
+        ids: list[int],
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+        concurrency: int = 4,
+    ) -> dict[str, dict[int, Any] | list[int]]:
+        """
+        Retrieve many objects by ID with as few requests as possible.
+
+        The IDs are sent as repeated ``id`` filters (NetBox ORs them), split into chunks
+        that keep every URL under MAX_URL_LENGTH, and the chunks are fetched in parallel.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/devices')
+            ids: IDs of the objects to retrieve (duplicates are fetched once)
+            params: Optional extra query parameters, such as fields or brief
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+            concurrency: Maximum number of chunk requests in flight toward NetBox
+
+        Returns:
+            Dict with:
+                - results: Objects keyed by ID, in the order the IDs were given
+                - missing: IDs that matched no object
+        """
+        ids, params = self._many_params(ids, params)
+        chunks = self._id_chunks(endpoint, ids, params)
+
+        def fetch(chunk: list[int]) -> dict[str, Any]:
+            chunk_params = {**params, "id": chunk, "limit": len(chunk)}
+            return self.get(endpoint, params=chunk_params, fallback_endpoint=fallback_endpoint)
+
+        if len(chunks) <= 1:
+            return self._collect_many(ids, [fetch(chunk) for chunk in chunks])
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(chunks))), thread_name_prefix="netbox-many"
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch, chunk) for chunk in chunks
+            ]
+            return self._collect_many(ids, [future.result() for future in futures])
+
+    def iter_objects(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 250,
+        max_items: int | None = None,
+        fallback_endpoint: str | None = None,
+        concurrency: int = 1,
+        intern: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream every object matching a list query, page by page.
+
+        Sequentially, only the current page and the next one (which is prefetched in the
+        background while the caller consumes the current one) are held in memory. With
+        concurrency > 1, the offsets of all pages are computed from the first page's count
+        and up to ``concurrency`` pages are fetched in parallel, still yielded in order.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/interfaces')
+            params: Optional query parameters for filtering (limit/offset are managed here)
+            page_size: Number of objects requested per page
+            max_items: Optional maximum number of objects to yield
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+            concurrency: Maximum number of page requests in flight toward NetBox
+            intern: Share one copy of each distinct nested dict (site, role, ...) across
+                    the yielded objects, for callers that keep many of them; such nested
+                    dicts must not be modified
+
+        Yields:
+            Objects in the order NetBox returns them
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        if intern:
+            interner = Interner()
+            with closing(
+                self.iter_objects(
+                    endpoint, params, page_size, max_items, fallback_endpoint, concurrency
+                )
+            ) as objects:
+                for obj in objects:
+                    yield interner.intern(obj)
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, concurrency), thread_name_prefix="netbox-prefetch"
+        )
+
+        def fetch(offset: int, size: int) -> Future:
+            if max_items is not None:
+                size = min(size, max_items - offset)
+            page_params = {**(params or {}), "limit": size, "offset": offset}
+            context = contextvars.copy_context()
+            return executor.submit(
+                context.run,
+                self.get,
+                endpoint,
+                params=page_params,
+                fallback_endpoint=fallback_endpoint,
+            )
+
+        try:
+            first = fetch(0, page_size).result()
+            results = first.get("results", [])
+            offsets = remaining_offsets(first, max_items)
+            if not offsets:
+                yield from results
+                return
+
+            if concurrency > 1:
+                pending_offsets = iter(offsets)
+                window = deque(
+                    fetch(offset, offsets.step) for offset in islice(pending_offsets, concurrency)
+                )
+                yield from results
+                while window:
+                    page = window.popleft().result()
+                    offset = next(pending_offsets, None)
+                    if offset is not None:
+                        window.append(fetch(offset, offsets.step))
+                    yield from page.get("results", [])
+                return
+
+            offset = offsets.start
+            pending = fetch(offset, offsets.step)
+            yield from results
+            while pending is not None:
+                page = pending.result()
+                results = page.get("results", [])
+                offset += len(results)
+                pending = None
+                if results and page.get("next") and offset < offsets.stop:
+                    pending = fetch(offset, offsets.step)
+                yield from results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @abc.abstractmethod
     def create(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -161,7 +618,17 @@ class NetBoxRestClient(NetBoxClientBase):
     # })
     # print(f"Created site: {new_site.get('name')} (ID: {new_site.get('id')})")
 
-    def __init__(self, url: str, token: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        verify_ssl: bool = True,
+        max_connections: int = 10,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        decoder: JsonDecoder | None = None,
+        timeout: float | None = 30.0,
+    ):
         """
         Initialize the REST API client.
 
@@ -169,12 +636,27 @@ class NetBoxRestClient(NetBoxClientBase):
             url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
             token: API token for authentication
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Maximum number of pooled connections kept open to NetBox
+            cache: Optional response cache for GET requests (disabled when None)
+            retry_policy: Optional retry policy for transient failures (no retries when None)
+            decoder: Optional fast JSON decoder for response bodies (stdlib when None)
+            timeout: Seconds to wait for NetBox to connect or send data, per request
+                     (no timeout when None)
         """
         self.base_url = url.rstrip("/")
         self.api_url = f"{self.base_url}/api"
         self.token = token
         self.verify_ssl = verify_ssl
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.decoder = decoder
+        self.timeout = timeout
+        self.endpoints = EndpointResolver()
+        self.inflight = SingleFlight()
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "Authorization": f"Token {token}",
@@ -190,6 +672,78 @@ class NetBoxRestClient(NetBoxClientBase):
             return f"{self.api_url}/{endpoint}/{id}/"
         return f"{self.api_url}/{endpoint}/"
 
+    def _send(self, method: str, url: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: Lowercase requests.Session method name (e.g., 'get', 'post')
+            url: Full request URL
+            endpoint: The API endpoint the URL was built from (used for retry counters)
+            **kwargs: Additional arguments for the session method
+
+        Returns:
+            The final response (possibly still a retryable error once retries are exhausted)
+
+        Raises:
+            RequestCancelledError: If the tool call making the request was cancelled before
+                                   it was sent (see retry.cancel_scope)
+            RetryBudgetExhaustedError: If the request failed and could still be retried, but
+                                       not within the tool call's retry budget
+        """
+        send = getattr(self.session, method)
+        kwargs.setdefault("timeout", self.timeout)
+        policy = self.retry_policy
+        check_cancelled()
+        if policy is None or not policy.allows(method):
+            return send(url, verify=self.verify_ssl, **kwargs)
+
+        deadline = policy.start()
+        attempt = 0
+        while True:
+            if attempt:
+                check_cancelled()
+            try:
+                response = send(url, verify=self.verify_ssl, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                reason = type(e).__name__
+                delay = policy.next_delay(attempt, deadline)
+                if delay is None:
+                    policy.check_budget(attempt, deadline, reason)
+                    raise
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                delay = policy.next_delay(attempt, deadline, response.headers.get("Retry-After"))
+                if delay is None:
+                    policy.check_budget(attempt, deadline, reason)
+                    return response
+            attempt += 1
+            policy.record(endpoint)
+            logger.debug(f"Retrying {method.upper()} {url} in {delay:.2f}s ({reason})")
+            policy.sleep(delay)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop cached responses for an endpoint after a write."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    def probe(self) -> dict[str, Any]:
+        """
+        Probe the NetBox version via /api/status/ and resolve version-dependent endpoints.
+
+        Returns:
+            The probe result: the NetBox version and the resolved endpoint map
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        response = self._send("get", f"{self.api_url}/status/", "status")
+        response.raise_for_status()
+        self.endpoints.apply_version(str(self._decode(response).get("netbox-version", "")))
+        return self.endpoints.snapshot()
+
     def get(
         self,
         endpoint: str,
@@ -218,17 +772,103 @@ class NetBoxRestClient(NetBoxClientBase):
         Raises:
             requests.HTTPError: If the request fails
         """
+        key = make_cache_key(endpoint, id, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return self._loads(cached)
+
+        # Identical concurrent requests share one round trip; each caller decodes its own copy.
+        # A caller whose tool call is cancelled or out of budget fails alone (see singleflight).
+        response = self.inflight.do(
+            key,
+            lambda: self._fetch(key, endpoint, id, params, fallback_endpoint),
+            retry_on=(RequestCancelledError,),
+        )
+        return self._decode(response)
+
+    def get_raw(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> bytes:
+        """
+        Retrieve one or more objects from NetBox as the raw JSON response body.
+
+        Shares the cache and in-flight requests with get(), but skips decoding.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+
+        Returns:
+            The response body bytes, exactly as sent by NetBox
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        key = make_cache_key(endpoint, id, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = self.inflight.do(
+            key,
+            lambda: self._fetch(key, endpoint, id, params, fallback_endpoint),
+            retry_on=(RequestCancelledError,),
+        )
+        return response.content
+
+    def _fetch(
+        self,
+        key: str,
+        endpoint: str,
+        id: int | None,
+        params: dict[str, Any] | None,
+        fallback_endpoint: str | None,
+    ) -> requests.Response:
+        """
+        Perform a GET request, trying the fallback endpoint on 404 and filling the cache.
+
+        Args:
+            key: Canonical request key (see make_cache_key)
+            endpoint: The API endpoint
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+
+        Returns:
+            The successful response
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        requested = endpoint
+        endpoint, fallback_endpoint = self.endpoints.resolve(endpoint, fallback_endpoint)
         url = self._build_url(endpoint, id)
-        response = self.session.get(url, params=params, verify=self.verify_ssl)
+        response = self._send("get", url, endpoint, params=params)
 
         # Try fallback endpoint if primary returns 404
         if response.status_code == 404 and fallback_endpoint:
             fallback_url = self._build_url(fallback_endpoint, id)
-            response = self.session.get(fallback_url, params=params, verify=self.verify_ssl)
+            response = self._send("get", fallback_url, fallback_endpoint, params=params)
+            endpoint = fallback_endpoint
 
         response.raise_for_status()
 
-        return response.json()
+        # Remember which path served a still-unresolved fallback-capable endpoint
+        if fallback_endpoint:
+            self.endpoints.record(requested, endpoint)
+
+        if self.cache is not None:
+            self.cache.set(key, requested, response.content)
+
+        return response
 
     def create(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -245,9 +885,10 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint)
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        response = self._send("post", url, endpoint, json=data)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return self._decode(response)
 
     def update(self, endpoint: str, id: int, data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -265,9 +906,10 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint, id)
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        response = self._send("patch", url, endpoint, json=data)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return self._decode(response)
 
     def delete(self, endpoint: str, id: int) -> bool:
         """
@@ -284,8 +926,9 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = self._build_url(endpoint, id)
-        response = self.session.delete(url, verify=self.verify_ssl)
+        response = self._send("delete", url, endpoint)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.status_code == 204
 
     def bulk_create(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -303,9 +946,10 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        response = self._send("post", url, endpoint, json=data)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return self._decode(response)
 
     def bulk_update(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -322,9 +966,10 @@ class NetBoxRestClient(NetBoxClientBase):
             requests.HTTPError: If the request fails
         """
         url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        response = self._send("patch", url, endpoint, json=data)
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return self._decode(response)
 
     def bulk_delete(self, endpoint: str, ids: list[int]) -> bool:
         """
@@ -342,6 +987,506 @@ class NetBoxRestClient(NetBoxClientBase):
         """
         url = f"{self._build_url(endpoint)}bulk/"
         data = [{"id": id} for id in ids]
-        response = self.session.delete(url, json=data, verify=self.verify_ssl)
+        response = self._send("delete", url, endpoint, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return response.status_code == 204
+
+
+class NetBoxAsyncClient(NetBoxClientBase):
+    """
+    NetBox client implementation using the REST API over an asynchronous httpx client.
+
+    All CRUD methods are coroutines. Requests share a single connection pool and, when
+    HTTP/2 is enabled, are multiplexed over a small number of sockets, so many concurrent
+    callers do not each hold a thread or a connection for the full NetBox round trip.
+    """
+
+    # # Example of how to use the client
+    # async with NetBoxAsyncClient(
+    #     url="https://netbox.example.com",
+    #     token="your_api_token_here",
+    # ) as client:
+    #     sites = await client.get("dcim/sites")
+    #     site = await client.get("dcim/sites", id=1)
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        verify_ssl: bool = True,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        decoder: JsonDecoder | None = None,
+        timeout: float | None = 30.0,
+    ):
+        """
+        Initialize the asynchronous REST API client.
+
+        Args:
+            url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
+            token: API token for authentication
+            verify_ssl: Whether to verify SSL certificates
+            http2: Whether to negotiate HTTP/2 with NetBox (falls back to HTTP/1.1)
+            max_connections: Maximum number of concurrent connections to NetBox
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive before closing
+            cache: Optional response cache for GET requests (disabled when None)
+            retry_policy: Optional retry policy for transient failures (no retries when None)
+            decoder: Optional fast JSON decoder for response bodies (stdlib when None)
+            timeout: Seconds to wait for NetBox to connect or send data, per request
+                     (no timeout when None)
+        """
+        self.base_url = url.rstrip("/")
+        self.api_url = f"{self.base_url}/api"
+        self.token = token
+        self.verify_ssl = verify_ssl
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.decoder = decoder
+        self.timeout = timeout
+        self.endpoints = EndpointResolver()
+        self.inflight = AsyncSingleFlight()
+        self.client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Token {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            verify=verify_ssl,
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def __aenter__(self) -> "NetBoxAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    def _build_url(self, endpoint: str, id: int | None = None) -> str:
+        """Build the full URL for an API request."""
+        endpoint = endpoint.strip("/")
+        if id is not None:
+            return f"{self.api_url}/{endpoint}/{id}/"
+        return f"{self.api_url}/{endpoint}/"
+
+    async def _send(self, method: str, url: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST')
+            url: Full request URL
+            endpoint: The API endpoint the URL was built from (used for retry counters)
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+
+        Returns:
+            The final response (possibly still a retryable error once retries are exhausted)
+
+        Raises:
+            RetryBudgetExhaustedError: If the request failed and could still be retried, but
+                                       not within the tool call's retry budget
+        """
+        policy = self.retry_policy
+        if policy is None or not policy.allows(method):
+            return await self.client.request(method, url, **kwargs)
+
+        deadline = policy.start()
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                reason = type(e).__name__
+                delay = policy.next_delay(attempt, deadline)
+                if delay is None:
+                    policy.check_budget(attempt, deadline, reason)
+                    raise
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                delay = policy.next_delay(attempt, deadline, response.headers.get("Retry-After"))
+                if delay is None:
+                    policy.check_budget(attempt, deadline, reason)
+                    return response
+            attempt += 1
+            policy.record(endpoint)
+            logger.debug(f"Retrying {method} {url} in {delay:.2f}s ({reason})")
+            await asyncio.sleep(delay)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop cached responses for an endpoint after a write."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    async def iter_objects(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 250,
+        max_items: int | None = None,
+        fallback_endpoint: str | None = None,
+        concurrency: int = 1,
+        intern: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream every object matching a list query, page by page.
+
+        Sequentially, the next page is requested while the caller consumes the current one.
+        With concurrency > 1, the offsets of all pages are computed from the first page's
+        count and up to ``concurrency`` pages are fetched in parallel, still yielded in order.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/interfaces')
+            params: Optional query parameters for filtering (limit/offset are managed here)
+            page_size: Number of objects requested per page
+            max_items: Optional maximum number of objects to yield
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+            concurrency: Maximum number of page requests in flight toward NetBox
+            intern: Share one copy of each distinct nested dict (site, role, ...) across
+                    the yielded objects, for callers that keep many of them; such nested
+                    dicts must not be modified
+
+        Yields:
+            Objects in the order NetBox returns them
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        if intern:
+            interner = Interner()
+            async with aclosing(
+                self.iter_objects(
+                    endpoint, params, page_size, max_items, fallback_endpoint, concurrency
+                )
+            ) as objects:
+                async for obj in objects:
+                    yield interner.intern(obj)
+            return
+
+        def fetch(offset: int, limit: int) -> Awaitable[dict[str, Any]]:
+            page_params = {**(params or {}), "limit": limit, "offset": offset}
+            return self.get(endpoint, params=page_params, fallback_endpoint=fallback_endpoint)
+
+        async with aclosing(iter_pages(fetch, page_size, max_items, concurrency)) as pages:
+            async for page in pages:
+                for obj in page.get("results", []):
+                    yield obj
+
+    async def get_many(
+        self,
+        endpoint: str,
+        ids: list[int],
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+        concurrency: int = 4,
+    ) -> dict[str, dict[int, Any] | list[int]]:
+        """
+        Retrieve many objects by ID with as few requests as possible.
+
+        The IDs are sent as repeated ``id`` filters (NetBox ORs them), split into chunks
+        that keep every URL under MAX_URL_LENGTH, and the chunks are fetched in parallel.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/devices')
+            ids: IDs of the objects to retrieve (duplicates are fetched once)
+            params: Optional extra query parameters, such as fields or brief
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+            concurrency: Maximum number of chunk requests in flight toward NetBox
+
+        Returns:
+            Dict with:
+                - results: Objects keyed by ID, in the order the IDs were given
+                - missing: IDs that matched no object
+        """
+        ids, params = self._many_params(ids, params)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(chunk: list[int]) -> dict[str, Any]:
+            chunk_params = {**params, "id": chunk, "limit": len(chunk)}
+            async with semaphore:
+                return await self.get(
+                    endpoint, params=chunk_params, fallback_endpoint=fallback_endpoint
+                )
+
+        chunks = self._id_chunks(endpoint, ids, params)
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return self._collect_many(ids, list(pages))
+
+    async def probe(self) -> dict[str, Any]:
+        """
+        Probe the NetBox version via /api/status/ and resolve version-dependent endpoints.
+
+        Returns:
+            The probe result: the NetBox version and the resolved endpoint map
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        response = await self._send(
+            "GET", f"{self.api_url}/status/", "status", timeout=self.timeout
+        )
+        response.raise_for_status()
+        self.endpoints.apply_version(str(self._decode(response).get("netbox-version", "")))
+        return self.endpoints.snapshot()
+
+    async def get(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Retrieve one or more objects from NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+                               (used for NetBox version compatibility)
+
+        Returns:
+            For single object queries (with id): Returns the object dict
+            For list queries (without id): Returns the full paginated response dict
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        key = make_cache_key(endpoint, id, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return self._loads(cached)
+
+        # Identical concurrent requests share one round trip; each caller decodes its own copy.
+        # A caller whose tool call is cancelled or out of budget fails alone (see singleflight).
+        response = await self.inflight.do(
+            key,
+            lambda: self._fetch(key, endpoint, id, params, fallback_endpoint),
+            retry_on=(RequestCancelledError,),
+        )
+        return self._decode(response)
+
+    async def get_raw(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> bytes:
+        """
+        Retrieve one or more objects from NetBox as the raw JSON response body.
+
+        Shares the cache and in-flight requests with get(), but skips decoding.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+
+        Returns:
+            The response body bytes, exactly as sent by NetBox
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        key = make_cache_key(endpoint, id, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self.inflight.do(
+            key,
+            lambda: self._fetch(key, endpoint, id, params, fallback_endpoint),
+            retry_on=(RequestCancelledError,),
+        )
+        return response.content
+
+    async def _fetch(
+        self,
+        key: str,
+        endpoint: str,
+        id: int | None,
+        params: dict[str, Any] | None,
+        fallback_endpoint: str | None,
+    ) -> httpx.Response:
+        """
+        Perform a GET request, trying the fallback endpoint on 404 and filling the cache.
+
+        Args:
+            key: Canonical request key (see make_cache_key)
+            endpoint: The API endpoint
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to try if primary returns 404
+
+        Returns:
+            The successful response
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        requested = endpoint
+        endpoint, fallback_endpoint = self.endpoints.resolve(endpoint, fallback_endpoint)
+        url = self._build_url(endpoint, id)
+        if params:
+            # requests leaves None parameters out, httpx would send them as empty values
+            params = {k: v for k, v in params.items() if v is not None}
+        response = await self._send("GET", url, endpoint, params=params)
+
+        # Try fallback endpoint if primary returns 404
+        if response.status_code == 404 and fallback_endpoint:
+            fallback_url = self._build_url(fallback_endpoint, id)
+            response = await self._send("GET", fallback_url, fallback_endpoint, params=params)
+            endpoint = fallback_endpoint
+
+        response.raise_for_status()
+
+        # Remember which path served a still-unresolved fallback-capable endpoint
+        if fallback_endpoint:
+            self.endpoints.record(requested, endpoint)
+
+        if self.cache is not None:
+            self.cache.set(key, requested, response.content)
+
+        return response
+
+    async def create(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Create a new object in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: Object data to create
+
+        Returns:
+            The created object as a dict
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint)
+        response = await self._send("POST", url, endpoint, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return self._decode(response)
+
+    async def update(self, endpoint: str, id: int, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Update an existing object in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to update
+            data: Object data to update
+
+        Returns:
+            The updated object as a dict
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        response = await self._send("PATCH", url, endpoint, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return self._decode(response)
+
+    async def delete(self, endpoint: str, id: int) -> bool:
+        """
+        Delete an object from NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to delete
+
+        Returns:
+            True if deletion was successful, False otherwise
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        response = await self._send("DELETE", url, endpoint)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return response.status_code == 204
+
+    async def bulk_create(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create multiple objects in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to create
+
+        Returns:
+            List of created objects as dicts
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        response = await self._send("POST", url, endpoint, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return self._decode(response)
+
+    async def bulk_update(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Update multiple objects in NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to update (must include ID)
+
+        Returns:
+            List of updated objects as dicts
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        response = await self._send("PATCH", url, endpoint, json=data)
+        response.raise_for_status()
+        self._invalidate(endpoint)
+        return self._decode(response)
+
+    async def bulk_delete(self, endpoint: str, ids: list[int]) -> bool:
+        """
+        Delete multiple objects from NetBox via the REST API.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            ids: List of IDs to delete
+
+        Returns:
+            True if deletion was successful, False otherwise
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        data = [{"id": id} for id in ids]
+        response = await self._send("DELETE", url, endpoint, json=data)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.status_code == 204
@@ -63,6 +63,7 @@ NETBOX_OBJECT_TYPES = {
         "name": "ObjectType",
         "endpoint": "core/object-types",
         "fallback_endpoint": "extras/object-types",  # For NetBox < 4.4
+        "fallback_before": "4.4",
     },
     "dcim.cable": {
         "name": "Cable",
@@ -91,6 +92,8 @@ NETBOX_OBJECT_TYPES = {
     "dcim.device": {
         "name": "Device",
         "endpoint": "dcim/devices",
+        # Rendered for every object unless excluded; only sent when not requested in fields
+        "exclude": ["config_context"],
     },
     "dcim.devicebay": {
         "name": "DeviceBay",
@@ -459,6 +462,8 @@ NETBOX_OBJECT_TYPES = {
     "virtualization.virtualmachine": {
         "name": "VirtualMachine",
         "endpoint": "virtualization/virtual-machines",
+        # Rendered for every object unless excluded; only sent when not requested in fields
+        "exclude": ["config_context"],
     },
     "virtualization.vminterface": {
         "name": "VMInterface",
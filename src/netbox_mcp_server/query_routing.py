@@ -0,0 +1,80 @@
+"""
+Query-shape routing for global search.
+
+Search terms that are clearly an IP address, a CIDR prefix, a MAC address, a VLAN ID or a
+serial number are routed to the object types and exact filters that can match them,
+instead of running a broad ``q`` search across every default type.
+"""
+
+import ipaddress
+import re
+from typing import Any, NamedTuple
+
+# aa:bb:cc:dd:ee:ff, aa-bb-cc-dd-ee-ff, aabb.ccdd.eeff and aabbccddeeff
+_MAC_PATTERN = re.compile(
+    r"^(?:[0-9a-f]{2}([:-])(?:[0-9a-f]{2}\1){4}[0-9a-f]{2}"
+    r"|[0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4}"
+    r"|[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+# Upper-case letters and digits (with at least one of each), as printed on asset labels
+_SERIAL_PATTERN = re.compile(r"^(?=[A-Z0-9]*[0-9])(?=[A-Z0-9]*[A-Z])[A-Z0-9]{6,30}$")
+
+
+class SearchRoute(NamedTuple):
+    """An object type and exact filters that a search term should be sent to."""
+
+    object_type: str
+    filters: dict[str, Any]
+
+
+def classify_query(query: str) -> tuple[str, list[SearchRoute]]:
+    """
+    Detect the shape of a search term and return the precise queries for it.
+
+    Args:
+        query: The search term
+
+    Returns:
+        Tuple of (shape, routes). shape is one of 'ip', 'ip_interface', 'cidr', 'mac',
+        'vlan_id', 'serial' or 'text'; routes is empty for 'text', which means the term
+        should go through the broad ``q`` search.
+    """
+    term = query.strip()
+
+    try:
+        address = ipaddress.ip_address(term)
+    except ValueError:
+        pass
+    else:
+        return "ip", [SearchRoute("ipam.ipaddress", {"address": str(address)})]
+
+    if "/" in term:
+        try:
+            network = ipaddress.ip_network(term)
+        except ValueError:
+            pass
+        else:
+            return "cidr", [SearchRoute("ipam.prefix", {"prefix": str(network)})]
+        try:
+            interface = ipaddress.ip_interface(term)
+        except ValueError:
+            pass
+        else:
+            # An address with a mask, e.g. 10.0.0.5/24
+            return "ip_interface", [SearchRoute("ipam.ipaddress", {"address": str(interface)})]
+
+    if _MAC_PATTERN.match(term):
+        return "mac", [
+            SearchRoute("dcim.interface", {"mac_address": term}),
+            SearchRoute("virtualization.vminterface", {"mac_address": term}),
+        ]
+
+    if term.isdigit() and 1 <= int(term) <= 4094:
+        return "vlan_id", [SearchRoute("ipam.vlan", {"vid": int(term)})]
+
+    if _SERIAL_PATTERN.match(term):
+        return "serial", [SearchRoute("dcim.device", {"serial": term})]
+
+    return "text", []
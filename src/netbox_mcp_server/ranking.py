@@ -0,0 +1,89 @@
+"""
+Scoring and top-k selection for merged global search results.
+
+Each hit is scored by how well its name matches the search term: an exact match beats a
+prefix match, which beats a substring match, which beats a hit NetBox's ``q`` filter
+matched on some other field. Ties go to the higher-priority object type and then to the
+order NetBox returned the hits in.
+"""
+
+import heapq
+import itertools
+from typing import Any
+
+EXACT = 3
+PREFIX = 2
+SUBSTRING = 1
+OTHER = 0
+
+MATCH_LABELS = {EXACT: "exact", PREFIX: "prefix", SUBSTRING: "substring", OTHER: "other"}
+
+# Fields holding an object's primary identifier, in order of preference
+NAME_FIELDS = ("name", "address", "prefix", "cid", "vid", "display")
+
+
+def score_match(query: str, obj: dict[str, Any]) -> int:
+    """
+    Score how well an object's name matches a search term.
+
+    Args:
+        query: The search term
+        obj: The object as returned by NetBox
+
+    Returns:
+        EXACT, PREFIX, SUBSTRING or OTHER
+    """
+    term = query.strip().casefold()
+    best = OTHER
+    for field in NAME_FIELDS:
+        value = obj.get(field)
+        if value is None or isinstance(value, dict | list):
+            continue
+        value = str(value).casefold()
+        # Addresses and prefixes carry a mask NetBox users usually leave out of the term
+        if value == term or value.split("/", 1)[0] == term:
+            return EXACT
+        if value.startswith(term):
+            best = max(best, PREFIX)
+        elif term in value:
+            best = max(best, SUBSTRING)
+    return best
+
+
+class TopK:
+    """Keep the k best-scoring hits across object types using a min-heap."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: list[tuple] = []
+        self._counter = itertools.count()
+
+    def push(self, score: int, type_rank: int, object_type: str, obj: dict[str, Any]) -> None:
+        """
+        Offer a hit, evicting the weakest kept hit if it scores lower.
+
+        Args:
+            score: Match score from score_match
+            type_rank: Priority of the object type (lower is more important)
+            object_type: The hit's object type
+            obj: The object
+        """
+        # Higher score, then higher-priority type, then earlier arrival ranks better
+        entry = (score, -type_rank, -next(self._counter), object_type, obj)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, entry)
+
+    def full_of(self, min_score: int) -> bool:
+        """Return whether k hits scoring at least min_score have been kept."""
+        return len(self._heap) == self.k and self._heap[0][0] >= min_score
+
+    def results(self) -> list[dict[str, Any]]:
+        """Return the kept hits, best first."""
+        return [
+            {"object_type": object_type, "match": MATCH_LABELS[score], "object": obj}
+            for score, _, _, object_type, obj in sorted(
+                self._heap, key=lambda entry: entry[:3], reverse=True
+            )
+        ]
@@ -0,0 +1,1049 @@
+"""
+Local SQLite replica of selected NetBox object types.
+
+Read-heavy deployments can serve list and detail queries from a snapshot of NetBox kept in
+a local SQLite database instead of sending every request to NetBox. The snapshot is built
+by the ``netbox-mcp-replica`` command (see main()) and read by NetBoxReplicaClient, which
+supports the filter subset accepted by validate_filters plus fields, brief, exclude,
+ordering, limit and offset. Queries the replica cannot answer are forwarded to an upstream client.
+
+Objects are stored as JSON documents, one row per object, and filtered with SQLite's JSON
+functions; the columns most filters use are covered by expression indexes.
+"""
+
+import argparse
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import urlencode
+
+from netbox_mcp_server.netbox_client import NetBoxClientBase
+from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+
+logger = logging.getLogger(__name__)
+
+# NetBox's default and maximum page sizes
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Change log endpoint tailed by the incremental sync
+CHANGES_ENDPOINT = NETBOX_OBJECT_TYPES["core.objectchange"]["endpoint"]
+
+# Object types synced when none are given
+DEFAULT_REPLICA_TYPES = [
+    "dcim.device",
+    "dcim.site",
+    "dcim.rack",
+    "dcim.interface",
+    "ipam.ipaddress",
+    "ipam.prefix",
+    "ipam.vlan",
+    "circuits.circuit",
+    "virtualization.virtualmachine",
+]
+
+# JSON paths of common filter columns, covered by expression indexes
+INDEXED_PATHS = (
+    "$.name",
+    "$.slug",
+    "$.serial",
+    "$.address",
+    "$.prefix",
+    "$.vid",
+    "$.status.value",
+    "$.site.id",
+    "$.tenant.id",
+    "$.role.id",
+    "$.device.id",
+    "$.virtual_machine.id",
+    "$.vrf.id",
+)
+
+# Fields kept by brief=1, approximating NetBox's brief serializers
+BRIEF_FIELDS = ("id", "url", "display", "name", "slug", "address", "prefix", "vid", "cid")
+
+# Values of the brief parameter that enable it
+BRIEF_TRUE = ("1", 1, True, "true", "True")
+
+# Fields matched by the q filter
+SEARCH_PATHS = ("$.name", "$.display", "$.description", "$.serial", "$.address", "$.prefix")
+
+# Query parameters that are not filters
+CONTROL_PARAMS = {"limit", "offset", "fields", "brief", "exclude", "ordering", "q"}
+
+_FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    endpoint TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (endpoint, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS object_types (
+    endpoint TEXT PRIMARY KEY,
+    object_type TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    change_id INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS replica_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ReplicaQueryError(ValueError):
+    """Raised when a query uses a filter or ordering the replica cannot evaluate."""
+
+
+def _kind(value: Any) -> dict[str, Any]:
+    """Describe the JSON shape of a field value."""
+    if value is None:
+        return {"kind": "null"}
+    if isinstance(value, dict):
+        if "value" in value and "label" in value:
+            return {"kind": "choice"}
+        return {"kind": "object", "keys": sorted(value)}
+    if isinstance(value, list):
+        keys = sorted(value[0]) if value and isinstance(value[0], dict) else []
+        return {"kind": "list", "keys": keys}
+    return {"kind": "scalar"}
+
+
+def _merge_shape(shape: dict[str, Any], objects: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Update a field shape map with the fields of more objects (first non-null wins)."""
+    for obj in objects:
+        for field, value in obj.items():
+            known = shape.get(field)
+            if (
+                known is None
+                or known["kind"] == "null"
+                or (known["kind"] == "list" and not known["keys"])
+            ):
+                shape[field] = _kind(value)
+    return shape
+
+
+def _object_key(keys: list[str]) -> str:
+    """Pick the key NetBox filters a related object by (slug, then name, then id)."""
+    for key in ("slug", "name"):
+        if key in keys:
+            return key
+    return "id"
+
+
+def _candidates(value: Any) -> list[Any]:
+    """Return the values a query string may equal in JSON (text, number or boolean)."""
+    values = value if isinstance(value, list | tuple) else [value]
+    candidates: list[Any] = []
+    for item in values:
+        candidates.append(item)
+        if isinstance(item, str):
+            lowered = item.strip().lower()
+            if lowered in ("true", "false"):
+                candidates.append(1 if lowered == "true" else 0)
+            elif (number := _number(item)) is not item:
+                candidates.append(number)
+        elif isinstance(item, bool):
+            candidates.append(int(item))
+    return candidates
+
+
+def _number(value: Any) -> Any:
+    """Coerce a range lookup value to a number when it looks like one."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+    return value
+
+
+def _like_escape(value: Any) -> str:
+    """Escape LIKE wildcards in a user-supplied value."""
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _split_values(value: Any) -> list[Any]:
+    """Split an __in value given as a list or comma-separated string."""
+    if isinstance(value, list | tuple):
+        return list(value)
+    if isinstance(value, str):
+        return [item for item in value.split(",") if item != ""]
+    return [value]
+
+
+def _regexp(pattern: str, value: Any) -> bool:
+    """SQLite REGEXP implementation."""
+    return value is not None and re.search(pattern, str(value)) is not None
+
+
+class ReplicaStore:
+    """SQLite storage of replicated NetBox objects, safe to share between threads."""
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) a replica database.
+
+        Args:
+            path: SQLite database path (':memory:' for an in-memory replica)
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.create_function("regexp", 2, _regexp, deterministic=True)
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(object_types)")}
+            if "change_id" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE object_types ADD COLUMN change_id INTEGER NOT NULL DEFAULT 0"
+                )
+            for path_expr in INDEXED_PATHS:
+                name = "idx_objects_" + re.sub(r"\W+", "_", path_expr.strip("$."))
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} "
+                    f"ON objects (endpoint, json_extract(data, '{path_expr}'))"
+                )
+        self._shapes: dict[str, dict[str, Any]] = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ----- Metadata -----
+
+    def get_meta(self, key: str) -> str | None:
+        """Return a replica-wide metadata value."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM replica_meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a replica-wide metadata value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO replica_meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def endpoints(self) -> dict[str, str]:
+        """Return the replicated endpoints mapped to their object types."""
+        with self._lock:
+            rows = self._conn.execute("SELECT endpoint, object_type FROM object_types").fetchall()
+        return dict(rows)
+
+    def has(self, endpoint: str) -> bool:
+        """Return whether an endpoint is replicated."""
+        return self.shape(endpoint) is not None
+
+    def shape(self, endpoint: str) -> dict[str, Any] | None:
+        """Return the field shape map of a replicated endpoint, or None."""
+        if endpoint not in self._shapes:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT shape FROM object_types WHERE endpoint = ?", (endpoint,)
+                ).fetchone()
+            if row is None:
+                return None
+            self._shapes[endpoint] = json.loads(row[0])
+        return self._shapes[endpoint]
+
+    def synced_at(self) -> dict[str, float]:
+        """Return the last sync time (epoch seconds) of every replicated object type."""
+        with self._lock:
+            rows = self._conn.execute("SELECT object_type, synced_at FROM object_types").fetchall()
+        return dict(rows)
+
+    def change_ids(self) -> dict[str, int]:
+        """Return the high-water mark (last applied object change ID) of every endpoint."""
+        with self._lock:
+            rows = self._conn.execute("SELECT endpoint, change_id FROM object_types").fetchall()
+        return dict(rows)
+
+    def staleness(self, now: float | None = None) -> dict[str, float]:
+        """
+        Return how far behind NetBox each replicated object type may be.
+
+        Args:
+            now: Current epoch time (defaults to time.time())
+
+        Returns:
+            Seconds since each object type was last brought up to date, per object type
+        """
+        now = time.time() if now is None else now
+        return {
+            object_type: round(max(0.0, now - synced_at), 3)
+            for object_type, synced_at in self.synced_at().items()
+        }
+
+    # ----- Writes -----
+
+    def replace_all(
+        self,
+        endpoint: str,
+        object_type: str,
+        objects: Iterable[dict[str, Any]],
+        change_id: int = 0,
+    ) -> int:
+        """
+        Atomically replace every stored object of an endpoint with a fresh snapshot.
+
+        Args:
+            endpoint: The API endpoint the objects belong to
+            object_type: The NetBox object type of the endpoint
+            objects: All objects of the endpoint
+            change_id: ID of the newest object change the snapshot is known to include
+
+        Returns:
+            Number of objects stored
+        """
+        shape: dict[str, Any] = {}
+        count = 0
+
+        def rows():
+            nonlocal count
+            for obj in objects:
+                _merge_shape(shape, [obj])
+                count += 1
+                yield endpoint, obj["id"], json.dumps(obj, separators=(",", ":"))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM objects WHERE endpoint = ?", (endpoint,))
+                self._conn.executemany(
+                    "INSERT INTO objects (endpoint, id, data) VALUES (?, ?, ?)", rows()
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO object_types "
+                    "(endpoint, object_type, shape, synced_at, change_id) VALUES (?, ?, ?, ?, ?)",
+                    (endpoint, object_type, json.dumps(shape), time.time(), change_id),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._shapes.pop(endpoint, None)
+            # Refresh planner statistics so filters use the expression indexes
+            self._conn.execute("ANALYZE objects")
+        return count
+
+    def upsert(self, endpoint: str, objects: list[dict[str, Any]]) -> None:
+        """Insert or replace objects of an already replicated endpoint."""
+        shape = self.shape(endpoint)
+        if shape is None or not objects:
+            return
+        shape = _merge_shape(dict(shape), objects)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO objects (endpoint, id, data) VALUES (?, ?, ?)",
+                    [
+                        (endpoint, obj["id"], json.dumps(obj, separators=(",", ":")))
+                        for obj in objects
+                    ],
+                )
+                self._conn.execute(
+                    "UPDATE object_types SET shape = ? WHERE endpoint = ?",
+                    (json.dumps(shape), endpoint),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._shapes[endpoint] = shape
+
+    def mark_synced(self, endpoint: str, change_id: int, synced_at: float) -> None:
+        """Record that an endpoint has applied every object change up to ``change_id``."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE object_types SET change_id = MAX(change_id, ?), synced_at = ? "
+                "WHERE endpoint = ?",
+                (change_id, synced_at, endpoint),
+            )
+
+    def delete(self, endpoint: str, ids: Iterable[int]) -> None:
+        """Delete objects of an endpoint by ID."""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM objects WHERE endpoint = ? AND id = ?",
+                [(endpoint, id) for id in ids],
+            )
+
+    # ----- Reads -----
+
+    def get_one(self, endpoint: str, id: int) -> str | None:
+        """Return the stored JSON document of one object, or None if it is not stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM objects WHERE endpoint = ? AND id = ?", (endpoint, id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def query(self, endpoint: str, params: dict[str, Any]) -> tuple[int, list[str]]:
+        """
+        Run a NetBox-style list query against the stored objects of an endpoint.
+
+        Args:
+            endpoint: A replicated API endpoint
+            params: NetBox query parameters (filters, q, ordering, limit, offset)
+
+        Returns:
+            Tuple of (total matching count, JSON documents of the requested page)
+
+        Raises:
+            ReplicaQueryError: If a filter or ordering cannot be evaluated on the replica
+        """
+        shape = self.shape(endpoint) or {}
+        where = ["endpoint = ?"]
+        args: list[Any] = [endpoint]
+
+        for name, value in params.items():
+            if name in CONTROL_PARAMS or value is None:
+                continue
+            clause, clause_args = self._filter_clause(shape, name, value)
+            where.append(clause)
+            args.extend(clause_args)
+
+        q = params.get("q")
+        if q:
+            pattern = f"%{_like_escape(q)}%"
+            where.append(
+                "("
+                + " OR ".join(
+                    f"json_extract(data, '{path}') LIKE ? ESCAPE '\\'" for path in SEARCH_PATHS
+                )
+                + ")"
+            )
+            args.extend([pattern] * len(SEARCH_PATHS))
+
+        limit = int(params.get("limit") or DEFAULT_PAGE_SIZE)
+        limit = MAX_PAGE_SIZE if limit <= 0 else min(limit, MAX_PAGE_SIZE)
+        offset = max(0, int(params.get("offset") or 0))
+        order_by = self._order_clause(shape, params.get("ordering"))
+
+        sql_where = " AND ".join(where)
+        with self._lock:
+            count = self._conn.execute(
+                f"SELECT COUNT(*) FROM objects WHERE {sql_where}",  # noqa: S608 - values are bound
+                args,
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT data FROM objects WHERE {sql_where} ORDER BY {order_by} LIMIT ? OFFSET ?",  # noqa: S608
+                [*args, limit, offset],
+            ).fetchall()
+        return count, [row[0] for row in rows]
+
+    def _resolve(self, shape: dict[str, Any], field: str) -> tuple[str, str, str | None]:
+        """
+        Map a filter field name to a JSON path.
+
+        Returns:
+            Tuple of (kind, path, list item key). kind is 'scalar' or 'list'; for lists the
+            path points at the array and the item key names the compared key of each item.
+        """
+        if not _FIELD_PATTERN.match(field):
+            raise ReplicaQueryError(f"Unsupported filter field '{field}'")
+
+        info = shape.get(field)
+        if info is not None:
+            if info["kind"] == "choice":
+                return "scalar", f"$.{field}.value", None
+            if info["kind"] == "object":
+                return "scalar", f"$.{field}.{_object_key(info['keys'])}", None
+            if info["kind"] == "list":
+                return "list", f"$.{field}", _object_key(info["keys"]) if info["keys"] else None
+            return "scalar", f"$.{field}", None
+
+        # Related object by ID (site_id -> site.id) or list member by ID (tag_id -> tags[].id)
+        base = field[:-3] if field.endswith("_id") else None
+        if base and base in shape and shape[base]["kind"] in ("object", "null"):
+            return "scalar", f"$.{base}.id", None
+        if base and shape.get(f"{base}s", {}).get("kind") == "list":
+            return "list", f"$.{base}s", "id"
+
+        # Singular filters over lists (tag -> tags[].slug)
+        plural = shape.get(f"{field}s")
+        if plural is not None and plural["kind"] == "list":
+            return "list", f"$.{field}s", _object_key(plural["keys"]) if plural["keys"] else None
+
+        raise ReplicaQueryError(f"Filter field '{field}' is not present in the replica")
+
+    def _filter_clause(self, shape: dict[str, Any], name: str, value: Any) -> tuple[str, list]:
+        """Build the SQL condition of one filter."""
+        field, _, lookup = name.partition("__")
+        kind, path, item_key = self._resolve(shape, field)
+
+        if kind == "list":
+            expr = "json_extract(je.value, ?)" if item_key else "je.value"
+            item_args = [f"$.{item_key}"] if item_key else []
+            if lookup in ("", "in", "n"):
+                values = _split_values(value) if lookup == "in" else value
+                candidates = _candidates(values)
+                marks = ",".join("?" * len(candidates))
+                exists = (
+                    f"EXISTS (SELECT 1 FROM json_each(data, '{path}') AS je "  # noqa: S608
+                    f"WHERE {expr} IN ({marks}))"
+                )
+                if lookup == "n":
+                    exists = f"NOT {exists}"
+                return exists, [*item_args, *candidates]
+            if lookup == "empty":
+                empty = str(value).lower() in ("true", "1")
+                op = "=" if empty else ">"
+                return f"COALESCE(json_array_length(data, '{path}'), 0) {op} 0", []
+            raise ReplicaQueryError(f"Lookup '__{lookup}' is not supported on list field '{field}'")
+
+        expr = f"json_extract(data, '{path}')"
+
+        if lookup == "" or lookup == "in":
+            values = _split_values(value) if lookup == "in" else value
+            candidates = _candidates(values)
+            marks = ",".join("?" * len(candidates))
+            clause = f"{expr} IN ({marks})"
+            args = list(candidates)
+            # NetBox's address filter matches the host regardless of the mask
+            if path == "$.address":
+                hosts = [v for v in candidates if isinstance(v, str) and "/" not in v]
+                for host in hosts:
+                    clause += f" OR {expr} LIKE ? ESCAPE '\\'"
+                    args.append(f"{_like_escape(host)}/%")
+                clause = f"({clause})"
+            return clause, args
+        if lookup == "n":
+            candidates = _candidates(value)
+            marks = ",".join("?" * len(candidates))
+            return f"({expr} IS NULL OR {expr} NOT IN ({marks}))", candidates
+
+        like_patterns = {
+            "ic": "%{}%",
+            "nic": "%{}%",
+            "isw": "{}%",
+            "nisw": "{}%",
+            "iew": "%{}",
+            "niew": "%{}",
+        }
+        if lookup in like_patterns:
+            pattern = like_patterns[lookup].format(_like_escape(value))
+            if lookup.startswith("n"):
+                return f"({expr} IS NULL OR {expr} NOT LIKE ? ESCAPE '\\')", [pattern]
+            return f"{expr} LIKE ? ESCAPE '\\'", [pattern]
+        if lookup == "ie":
+            return f"lower({expr}) = lower(?)", [str(value)]
+        if lookup == "nie":
+            return f"({expr} IS NULL OR lower({expr}) != lower(?))", [str(value)]
+        if lookup == "empty":
+            if str(value).lower() in ("true", "1"):
+                return f"({expr} IS NULL OR {expr} = '')", []
+            return f"({expr} IS NOT NULL AND {expr} != '')", []
+        if lookup == "regex":
+            return f"{expr} REGEXP ?", [str(value)]
+        if lookup == "iregex":
+            return f"{expr} REGEXP ?", [f"(?i){value}"]
+        comparisons = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+        if lookup in comparisons:
+            return f"{expr} {comparisons[lookup]} ?", [_number(value)]
+        raise ReplicaQueryError(f"Lookup '__{lookup}' is not supported by the replica")
+
+    def _order_clause(self, shape: dict[str, Any], ordering: Any) -> str:
+        """Build the ORDER BY clause for a NetBox ordering parameter."""
+        if isinstance(ordering, list):
+            ordering = ",".join(ordering)
+        terms = []
+        for term in str(ordering or "").split(","):
+            term = term.strip()
+            if not term:
+                continue
+            descending = term.startswith("-")
+            field = term.lstrip("-")
+            if not _FIELD_PATTERN.match(field):
+                raise ReplicaQueryError(f"Unsupported ordering field '{field}'")
+            info = shape.get(field)
+            if field == "id":
+                expr = "id"
+            elif info is None:
+                raise ReplicaQueryError(f"Ordering field '{field}' is not present in the replica")
+            elif info["kind"] == "choice":
+                expr = f"json_extract(data, '$.{field}.value')"
+            elif info["kind"] == "object":
+                key = (
+                    "name"
+                    if "name" in info["keys"]
+                    else "display"
+                    if "display" in info["keys"]
+                    else "id"
+                )
+                expr = f"json_extract(data, '$.{field}.{key}')"
+            elif info["kind"] == "list":
+                raise ReplicaQueryError(f"Cannot order by list field '{field}'")
+            else:
+                expr = f"json_extract(data, '$.{field}')"
+            terms.append(f"{expr} {'DESC' if descending else 'ASC'}")
+        terms.append("id ASC")
+        return ", ".join(terms)
+
+
+class NetBoxReplicaClient(NetBoxClientBase):
+    """
+    NetBox client serving reads from a local SQLite replica.
+
+    Endpoints that are not replicated, queries the replica cannot evaluate and objects
+    missing from the replica are forwarded to the upstream client, if one is configured.
+    Writes always go to the upstream client and are applied to the replica on success.
+    """
+
+    def __init__(self, store: ReplicaStore, upstream: NetBoxClientBase | None = None):
+        """
+        Initialize the replica client.
+
+        Args:
+            store: The replica database
+            upstream: Optional client for everything the replica cannot serve
+        """
+        self.store = store
+        self.upstream = upstream
+        self.api_url = (store.get_meta("source_url") or "").rstrip("/") + "/api"
+
+    def _replicated(self, endpoint: str, fallback_endpoint: str | None) -> str | None:
+        """Return the replicated endpoint for a request, trying the fallback too."""
+        for candidate in (endpoint, fallback_endpoint):
+            if candidate and self.store.has(candidate.strip("/")):
+                return candidate.strip("/")
+        return None
+
+    def _forward(self, method: str, error: Exception, *args: Any) -> Any:
+        """Forward a read to the upstream client, or raise ``error`` if there is none."""
+        if self.upstream is None:
+            raise error
+        return getattr(self.upstream, method)(*args)
+
+    def _writer(self) -> NetBoxClientBase:
+        """Return the upstream client that writes go to."""
+        if self.upstream is None:
+            raise ReplicaQueryError("The replica is read-only without an upstream client")
+        return self.upstream
+
+    def _page(self, endpoint: str, params: dict[str, Any], count: int, size: int) -> dict:
+        """Build the count/next/previous envelope of a list response."""
+        limit = int(params.get("limit") or DEFAULT_PAGE_SIZE)
+        limit = MAX_PAGE_SIZE if limit <= 0 else min(limit, MAX_PAGE_SIZE)
+        offset = max(0, int(params.get("offset") or 0))
+
+        def link(page_offset: int) -> str:
+            query = {**params, "limit": limit, "offset": page_offset}
+            query = {k: v for k, v in query.items() if v is not None}
+            return f"{self.api_url}/{endpoint}/?{urlencode(query, doseq=True)}"
+
+        return {
+            "count": count,
+            "next": link(offset + limit) if offset + size < count else None,
+            "previous": link(max(0, offset - limit)) if offset > 0 else None,
+        }
+
+    @staticmethod
+    def _project(obj: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+        """Apply the fields, brief and exclude parameters to one object."""
+        fields = params.get("fields")
+        if fields:
+            wanted = [f.strip() for f in str(fields).split(",") if f.strip()]
+            return {f: obj[f] for f in wanted if f in obj}
+        if params.get("brief") in BRIEF_TRUE:
+            return {f: obj[f] for f in BRIEF_FIELDS if f in obj}
+        excluded = params.get("exclude")
+        if excluded:
+            for field in str(excluded).split(","):
+                obj.pop(field.strip(), None)
+        return obj
+
+    def get(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Retrieve one or more objects from the replica.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to look up as well
+
+        Returns:
+            The object dict, or the paginated response dict for list queries
+
+        Raises:
+            ReplicaQueryError: If the query cannot be served and there is no upstream client
+            LookupError: If the object is not in the replica and there is no upstream client
+        """
+        params = dict(params or {})
+        endpoint, id = self._split_id(endpoint, id)
+        args = (endpoint, id, params, fallback_endpoint)
+        replicated = self._replicated(endpoint, fallback_endpoint)
+        if replicated is None:
+            return self._forward("get", ReplicaQueryError(f"{endpoint} is not replicated"), *args)
+
+        if id is not None:
+            body = self.store.get_one(replicated, id)
+            if body is None:
+                missing = LookupError(f"{replicated} object {id} is not in the replica")
+                return self._forward("get", missing, *args)
+            return self._project(self._loads(body), params)
+
+        try:
+            count, rows = self.store.query(replicated, params)
+        except ReplicaQueryError as e:
+            logger.debug(f"Forwarding query on {replicated} to NetBox: {e}")
+            return self._forward("get", e, *args)
+
+        page = self._page(replicated, params, count, len(rows))
+        page["results"] = [self._project(self._loads(row), params) for row in rows]
+        return page
+
+    def get_raw(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> bytes:
+        """
+        Retrieve one or more objects from the replica as a JSON body.
+
+        Without fields/brief projection, the stored documents are spliced into the
+        response as-is, without being decoded.
+
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            fallback_endpoint: Optional alternative endpoint to look up as well
+
+        Returns:
+            The JSON body, shaped like the return value of get()
+        """
+        params = dict(params or {})
+        endpoint, id = self._split_id(endpoint, id)
+        args = (endpoint, id, params, fallback_endpoint)
+        replicated = self._replicated(endpoint, fallback_endpoint)
+        if replicated is None:
+            error = ReplicaQueryError(f"{endpoint} is not replicated")
+            return self._forward("get_raw", error, *args)
+        projected = (
+            bool(params.get("fields") or params.get("exclude")) or params.get("brief") in BRIEF_TRUE
+        )
+
+        if id is not None:
+            body = self.store.get_one(replicated, id)
+            if body is None:
+                missing = LookupError(f"{replicated} object {id} is not in the replica")
+                return self._forward("get_raw", missing, *args)
+            if projected:
+                return json.dumps(self._project(self._loads(body), params)).encode()
+            return body.encode()
+
+        try:
+            count, rows = self.store.query(replicated, params)
+        except ReplicaQueryError as e:
+            return self._forward("get_raw", e, *args)
+        if projected:
+            rows = [json.dumps(self._project(self._loads(row), params)) for row in rows]
+        envelope = json.dumps(self._page(replicated, params, count, len(rows)))
+        return f'{envelope[:-1]}, "results": [{",".join(rows)}]}}'.encode()
+
+    def get_many(
+        self,
+        endpoint: str,
+        ids: list[int],
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+        concurrency: int = 4,
+    ) -> dict[str, dict[int, Any] | list[int]]:
+        """
+        Retrieve many objects by ID from the replica, or from upstream if not replicated.
+
+        Accepts the same arguments as NetBoxClientBase.get_many.
+        """
+        if self._replicated(endpoint, fallback_endpoint) is None:
+            error = ReplicaQueryError(f"{endpoint} is not replicated")
+            args = (endpoint, ids, params, fallback_endpoint, concurrency)
+            return self._forward("get_many", error, *args)
+        return super().get_many(endpoint, ids, params, fallback_endpoint, concurrency)
+
+    @staticmethod
+    def _split_id(endpoint: str, id: int | None) -> tuple[str, int | None]:
+        """Split a trailing object ID off an endpoint such as 'dcim/devices/5'."""
+        endpoint = endpoint.strip("/")
+        head, _, tail = endpoint.rpartition("/")
+        if id is None and head and tail.isdigit():
+            return head, int(tail)
+        return endpoint, id
+
+    # ----- Writes go to NetBox and are applied to the replica -----
+
+    def create(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Create an object in NetBox and add it to the replica."""
+        result = self._writer().create(endpoint, data)
+        self.store.upsert(endpoint.strip("/"), [result])
+        return result
+
+    def update(self, endpoint: str, id: int, data: dict[str, Any]) -> dict[str, Any]:
+        """Update an object in NetBox and in the replica."""
+        result = self._writer().update(endpoint, id, data)
+        self.store.upsert(endpoint.strip("/"), [result])
+        return result
+
+    def delete(self, endpoint: str, id: int) -> bool:
+        """Delete an object from NetBox and from the replica."""
+        result = self._writer().delete(endpoint, id)
+        self.store.delete(endpoint.strip("/"), [id])
+        return result
+
+    def bulk_create(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create objects in NetBox and add them to the replica."""
+        result = self._writer().bulk_create(endpoint, data)
+        self.store.upsert(endpoint.strip("/"), result)
+        return result
+
+    def bulk_update(self, endpoint: str, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Update objects in NetBox and in the replica."""
+        result = self._writer().bulk_update(endpoint, data)
+        self.store.upsert(endpoint.strip("/"), result)
+        return result
+
+    def bulk_delete(self, endpoint: str, ids: list[int]) -> bool:
+        """Delete objects from NetBox and from the replica."""
+        result = self._writer().bulk_delete(endpoint, ids)
+        self.store.delete(endpoint.strip("/"), ids)
+        return result
+
+
+def sync_replica(
+    client: NetBoxClientBase,
+    store: ReplicaStore,
+    object_types: list[str],
+    page_size: int = 1000,
+    concurrency: int = 4,
+) -> dict[str, int]:
+    """
+    Take a full snapshot of object types from NetBox into the replica.
+
+    Each type is replaced atomically, so readers never see a partially synced type.
+
+    Args:
+        client: Synchronous NetBox client to read from
+        store: The replica database
+        object_types: Object types to sync (keys of NETBOX_OBJECT_TYPES)
+        page_size: Objects requested per page
+        concurrency: Pages fetched in parallel per type
+
+    Returns:
+        Number of objects stored per object type
+    """
+    counts = {}
+    for object_type in object_types:
+        if object_type not in NETBOX_OBJECT_TYPES:
+            raise ValueError(f"Unknown object type '{object_type}'")
+        info = NETBOX_OBJECT_TYPES[object_type]
+        endpoint = info["endpoint"]
+        started = time.monotonic()
+        # Changes made while the snapshot is taken are re-applied by the next incremental sync
+        change_id = latest_change_id(client)
+        objects = client.iter_objects(
+            endpoint,
+            page_size=page_size,
+            fallback_endpoint=info.get("fallback_endpoint"),
+            concurrency=concurrency,
+        )
+        counts[object_type] = store.replace_all(endpoint, object_type, objects, change_id)
+        logger.info(
+            f"Synced {counts[object_type]} {object_type} objects "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+    return counts
+
+
+def latest_change_id(client: NetBoxClientBase) -> int:
+    """Return the ID of the newest object change in NetBox (0 if there are none)."""
+    response = client.get(CHANGES_ENDPOINT, params={"ordering": "-id", "limit": 1, "fields": "id"})
+    results = response.get("results", [])
+    return results[0]["id"] if results else 0
+
+
+def sync_replica_incremental(
+    client: NetBoxClientBase,
+    store: ReplicaStore,
+    page_size: int = 1000,
+    batch_size: int = 100,
+) -> dict[str, dict[str, int]]:
+    """
+    Bring the replica up to date by tailing NetBox's object changes.
+
+    Object changes newer than each type's high-water mark are read in ID order. Created
+    and updated objects are re-fetched in batches of ``batch_size`` IDs and upserted;
+    deleted objects (and re-fetched objects that no longer exist) are removed. The
+    high-water marks and sync times are then advanced, which resets staleness.
+
+    Args:
+        client: Synchronous NetBox client to read from
+        store: The replica database (types must have been fully synced once)
+        page_size: Object changes requested per page
+        batch_size: Object IDs re-fetched per request
+
+    Returns:
+        Number of upserted and deleted objects per object type with changes
+    """
+    endpoints = store.endpoints()
+    if not endpoints:
+        return {}
+    by_type = {object_type: endpoint for endpoint, object_type in endpoints.items()}
+    marks = store.change_ids()
+    started = time.time()
+
+    # Last action per changed object, per endpoint
+    pending: dict[str, dict[int, str]] = {}
+    last_id = min(marks.values())
+    while True:
+        response = client.get(
+            CHANGES_ENDPOINT,
+            params={
+                "id__gt": last_id,
+                "ordering": "id",
+                "limit": page_size,
+                "fields": "id,action,changed_object_type,changed_object_id",
+            },
+        )
+        changes = response.get("results", [])
+        for change in changes:
+            last_id = change["id"]
+            endpoint = by_type.get(change.get("changed_object_type"))
+            if endpoint is None or change["id"] <= marks[endpoint]:
+                continue
+            action = change.get("action")
+            if isinstance(action, dict):
+                action = action.get("value")
+            pending.setdefault(endpoint, {})[change["changed_object_id"]] = action
+        if not changes or not response.get("next"):
+            break
+
+    applied = {}
+    for endpoint, actions in pending.items():
+        changed = sorted(id for id, action in actions.items() if action != "delete")
+        deleted = {id for id, action in actions.items() if action == "delete"}
+        fetched = []
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start : start + batch_size]
+            response = client.get(endpoint, params={"id": batch, "limit": len(batch)})
+            fetched.extend(response.get("results", []))
+        # Objects changed and then deleted after the last change we read
+        deleted |= set(changed) - {obj["id"] for obj in fetched}
+
+        store.upsert(endpoint, fetched)
+        store.delete(endpoint, deleted)
+        applied[endpoints[endpoint]] = {"upserted": len(fetched), "deleted": len(deleted)}
+
+    for endpoint in endpoints:
+        store.mark_synced(endpoint, last_id, started)
+    if applied:
+        logger.info(f"Applied object changes up to #{last_id}: {applied}")
+    return applied
+
+
+def main() -> None:
+    """Build or refresh a replica database from NetBox (netbox-mcp-replica command)."""
+    from netbox_mcp_server.config import Settings, configure_logging
+    from netbox_mcp_server.netbox_client import NetBoxRestClient
+
+    parser = argparse.ArgumentParser(
+        description="Sync NetBox object types into a local SQLite replica"
+    )
+    parser.add_argument("database", help="Path of the SQLite replica database")
+    parser.add_argument(
+        "--types",
+        default=",".join(DEFAULT_REPLICA_TYPES),
+        help="Comma-separated object types to sync (default: common types)",
+    )
+    parser.add_argument("--page-size", type=int, default=1000, help="Objects per page")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Pages fetched in parallel per type"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Apply object changes since the last sync instead of taking full snapshots "
+        "(types in --types that are not replicated yet are fully synced first)",
+    )
+    parser.add_argument(
+        "--follow",
+        type=float,
+        metavar="SECONDS",
+        help="Keep running, applying object changes every SECONDS (implies --incremental)",
+    )
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Print the staleness in seconds of every replicated type as JSON and exit",
+    )
+    args = parser.parse_args()
+
+    if args.status:
+        store = ReplicaStore(args.database)
+        print(json.dumps(store.staleness(), indent=2, sort_keys=True))  # noqa: T201
+        store.close()
+        return
+
+    try:
+        settings = Settings()
+    except Exception as e:
+        print(f"Configuration error: {e}", file=sys.stderr)  # noqa: T201 - before logging configured
+        sys.exit(1)
+    configure_logging(settings.log_level)
+
+    client = NetBoxRestClient(
+        url=str(settings.netbox_url),
+        token=settings.netbox_token.get_secret_value(),
+        verify_ssl=settings.verify_ssl,
+        max_connections=max(settings.max_connections, args.concurrency),
+    )
+    store = ReplicaStore(args.database)
+    store.set_meta("source_url", client.base_url)
+    object_types = [t.strip() for t in args.types.split(",") if t.strip()]
+    try:
+        if args.incremental or args.follow:
+            replicated = set(store.endpoints().values())
+            missing = [t for t in object_types if t not in replicated]
+            sync_replica(client, store, missing, args.page_size, args.concurrency)
+            sync_replica_incremental(client, store, args.page_size)
+            while args.follow:
+                time.sleep(args.follow)
+                try:
+                    sync_replica_incremental(client, store, args.page_size)
+                except Exception as e:
+                    logger.warning(f"Incremental sync failed, retrying in {args.follow}s: {e}")
+        else:
+            sync_replica(client, store, object_types, args.page_size, args.concurrency)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
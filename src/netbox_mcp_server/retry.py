@@ -0,0 +1,236 @@
+"""
+Retry policy for transient NetBox failures.
+
+Idempotent GET requests that fail with a retryable status (429, 502, 503, 504) or a
+connection error are retried with exponential backoff and full jitter, honoring the
+Retry-After header, within a total deadline budget. Writes are only retried when explicitly
+enabled, since a write that timed out may already have been applied.
+
+Requests made by the sync client run in worker threads, which asyncio cannot cancel.
+A cancel_scope() lets a cancelled or timed-out tool call tell its worker threads to stop
+retrying and to skip requests they have not sent yet.
+"""
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from email.utils import parsedate_to_datetime
+
+from netbox_mcp_server.cache import collection_endpoint
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Absolute monotonic deadline shared by every request made inside a retry_budget() block
+_budget_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "netbox_retry_budget_deadline", default=None
+)
+
+# Event set once the tool call that made a request has finished, been cancelled or timed out
+_cancelled: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar(
+    "netbox_request_cancelled", default=None
+)
+
+
+class RequestCancelledError(Exception):
+    """Raised in place of a request whose tool call has been cancelled or timed out."""
+
+
+class RetryBudgetExhaustedError(RequestCancelledError):
+    """Raised when a failed request is not retried because its tool call's budget ran out."""
+
+
+@contextlib.contextmanager
+def retry_budget(seconds: float) -> Iterator[None]:
+    """
+    Share one retry deadline across all requests made within the block.
+
+    Nested budgets can only shorten the deadline, never extend it.
+
+    Args:
+        seconds: Total time budget in seconds
+    """
+    deadline = time.monotonic() + seconds
+    outer = _budget_deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _budget_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _budget_deadline.reset(token)
+
+
+@contextlib.contextmanager
+def cancel_scope() -> Iterator[threading.Event]:
+    """
+    Cancel the sync requests still pending in worker threads when the block exits.
+
+    Worker threads started within the block (asyncio.to_thread, or an executor with a
+    copied context) see the scope's event; once it is set, check_cancelled() raises and
+    retry backoff is cut short. The event is set however the block exits, so threads left
+    behind by a tool call never outlive it by more than the request they are sending.
+
+    Yields:
+        The scope's event, which may also be set early to cancel the pending requests
+    """
+    event = threading.Event()
+    token = _cancelled.set(event)
+    try:
+        yield event
+    finally:
+        event.set()
+        _cancelled.reset(token)
+
+
+def check_cancelled() -> None:
+    """
+    Raise if the enclosing cancel_scope() has been cancelled.
+
+    Raises:
+        RequestCancelledError: If the tool call making the request is no longer waiting for it
+    """
+    event = _cancelled.get()
+    if event is not None and event.is_set():
+        raise RequestCancelledError("NetBox request cancelled: the tool call has been cancelled")
+
+
+def parse_retry_after(value: object) -> float | None:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Configurable retry policy with per-endpoint retry counters.
+
+    The same policy object drives the retry loops of both the sync and async clients.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        deadline: float = 30.0,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        retry_writes: bool = False,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff_base: Backoff ceiling in seconds for the first retry (doubled per retry)
+            backoff_max: Maximum backoff ceiling in seconds
+            deadline: Total time budget in seconds for one request including all retries
+            retry_statuses: HTTP status codes that are retried
+            retry_writes: Whether create/update/delete and bulk requests are retried too
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.retry_writes = retry_writes
+        self.retries: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def allows(self, method: str) -> bool:
+        """Return whether requests with this HTTP method may be retried."""
+        return method.upper() in ("GET", "HEAD") or self.retry_writes
+
+    def start(self) -> float:
+        """Return the absolute monotonic deadline for a request starting now."""
+        deadline = time.monotonic() + self.deadline
+        budget = _budget_deadline.get()
+        return deadline if budget is None else min(deadline, budget)
+
+    def next_delay(self, attempt: int, deadline: float, retry_after: object = None) -> float | None:
+        """
+        Compute how long to wait before the next attempt.
+
+        Args:
+            attempt: Number of retries already made for this request
+            deadline: Absolute monotonic deadline returned by start()
+            retry_after: Retry-After header value of the failed response, if any
+
+        Returns:
+            Seconds to sleep, or None if the request must not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+            delay = random.uniform(0, ceiling)  # noqa: S311 - jitter, not cryptography
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def check_budget(self, attempt: int, deadline: float, reason: str) -> None:
+        """
+        Raise if a failed request is only left unretried because of its caller's retry budget.
+
+        A request coalesced with identical ones (see singleflight) runs with the budget of the
+        tool call that sent it. Raising, rather than handing back the failure, lets the other
+        callers retry the request within their own budget.
+
+        Args:
+            attempt: Number of retries already made for the request
+            deadline: Absolute monotonic deadline returned by start()
+            reason: Description of the last failure, for the error message
+
+        Raises:
+            RetryBudgetExhaustedError: If retries remain but the budget does not
+        """
+        if attempt < self.max_retries and deadline == _budget_deadline.get():
+            raise RetryBudgetExhaustedError(
+                f"NetBox request failed ({reason}) and the tool call's retry budget is exhausted"
+            )
+
+    def sleep(self, delay: float) -> None:
+        """
+        Block for a retry delay, waking up early if the enclosing cancel_scope() is cancelled.
+
+        Args:
+            delay: Seconds to wait, as returned by next_delay()
+
+        Raises:
+            RequestCancelledError: If the scope was cancelled before the delay elapsed
+        """
+        event = _cancelled.get()
+        if event is None:
+            time.sleep(delay)
+        elif event.wait(delay):
+            check_cancelled()
+
+    def record(self, endpoint: str) -> None:
+        """Count a retry against the collection an endpoint belongs to."""
+        with self._lock:
+            self.retries[collection_endpoint(endpoint)] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of retries made per endpoint."""
+        with self._lock:
+            return dict(self.retries)
@@ -1,14 +1,45 @@
 import argparse
+import asyncio
+import base64
+import binascii
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
 import logging
 import sys
-from typing import Annotated, Any
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Literal
+from urllib.parse import urlencode
 
 from fastmcp import FastMCP
-from pydantic import Field
+from fastmcp.server.dependencies import get_context
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+from pydantic import BaseModel, Field
 
+from netbox_mcp_server.aggregation import Aggregator, parse_metric, top_level_fields
+from netbox_mcp_server.cache import ResponseCache
 from netbox_mcp_server.config import Settings, configure_logging
-from netbox_mcp_server.netbox_client import NetBoxRestClient
+from netbox_mcp_server.entities import normalize_objects
+from netbox_mcp_server.joins import JoinPlanner, check_relations, is_multi_hop
+from netbox_mcp_server.jsoncodec import get_decoder
+from netbox_mcp_server.merging import branch_params, merge_results
+from netbox_mcp_server.netbox_client import (
+    NetBoxAsyncClient,
+    NetBoxClientBase,
+    NetBoxRestClient,
+    chunk_ids,
+    iter_pages,
+)
 from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
+from netbox_mcp_server.query_routing import classify_query
+from netbox_mcp_server.ranking import PREFIX, TopK, score_match
+from netbox_mcp_server.replica import NetBoxReplicaClient, ReplicaStore
+from netbox_mcp_server.retry import RetryPolicy, cancel_scope, retry_budget
+from netbox_mcp_server.shaping import shape_objects
+from netbox_mcp_server.tabular import OutputFormat, render_page, render_search
 
 
 def parse_cli_args() -> dict[str, Any]:
@@ -69,6 +100,19 @@ def parse_cli_args() -> dict[str, Any]:
         help="Disable SSL certificate verification (not recommended)",
     )
 
+    # NetBox client settings
+    parser.add_argument(
+        "--netbox-client",
+        type=str,
+        choices=["sync", "async"],
+        help="NetBox client implementation (default: sync)",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        help="Maximum number of concurrent connections to NetBox (default: 100)",
+    )
+
     # Observability settings
     parser.add_argument(
         "--log-level",
@@ -92,6 +136,10 @@ def parse_cli_args() -> dict[str, Any]:
         overlay["port"] = args.port
     if args.verify_ssl is not None:
         overlay["verify_ssl"] = args.verify_ssl
+    if args.netbox_client is not None:
+        overlay["netbox_client"] = args.netbox_client
+    if args.max_connections is not None:
+        overlay["max_connections"] = args.max_connections
     if args.log_level is not None:
         overlay["log_level"] = args.log_level
 
@@ -110,8 +158,168 @@ DEFAULT_SEARCH_TYPES = [
     "virtualization.virtualmachine",  # VM names
 ]
 
+logger = logging.getLogger(__name__)
+
+# Most filter dicts netbox_get_objects ORs together
+MAX_FILTER_BRANCHES = 10
+
+# Page size and pages in flight when netbox_aggregate streams objects
+AGGREGATE_PAGE_SIZE = 1000
+AGGREGATE_CONCURRENCY = 4
+
+# Number of object types a ranked search queries at a time, in priority order
+RANKED_SEARCH_WAVE_SIZE = 3
+
 mcp = FastMCP("NetBox")
-netbox = None
+netbox: NetBoxClientBase | None = None
+
+# Retry budget in seconds shared by all NetBox requests of one tool call (None = per request)
+tool_retry_budget: float | None = None
+
+# Seconds after which a tool call is cancelled, with its pending NetBox requests (None = none)
+tool_timeout: float | None = None
+
+# Maximum concurrent per-type queries of one search, and its deadline in seconds (None = none)
+search_concurrency: int = 8
+search_timeout: float | None = None
+
+# Whether unmodified NetBox responses are handed to MCP as raw JSON text (see _netbox_get_raw)
+raw_passthrough: bool = False
+
+# Whether objects are stripped of links, nulls and related-object detail (see _shape)
+lean_responses: bool = False
+
+# Short-lived cache of netbox_count_objects results (None = no caching)
+count_cache: ResponseCache | None = None
+
+
+async def _call_netbox(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call a NetBox client method without blocking the event loop.
+
+    Methods of the async client are awaited directly. Those of the sync client (and the
+    replica) run in a worker thread, which inherits the caller's context, including its
+    retry budget and cancel scope, so that concurrent calls overlap and other MCP sessions
+    are served meanwhile.
+
+    Args:
+        method: The bound client method (e.g. netbox.get)
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        The method's result
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    result = await asyncio.to_thread(method, *args, **kwargs)
+    if inspect.isawaitable(result):
+        # A replica forwarding to the async client
+        result = await result
+    return result
+
+
+async def _netbox_get(*args: Any, **kwargs: Any) -> Any:
+    """
+    Call netbox.get without blocking the event loop (see _call_netbox).
+
+    Accepts the same arguments as NetBoxClientBase.get.
+    """
+    return await _call_netbox(netbox.get, *args, **kwargs)
+
+
+# Resolves multi-hop filters (device__site_id, ...) to ID-list filters, caching ID sets
+join_planner = JoinPlanner(_netbox_get)
+
+
+def _session_key() -> str | None:
+    """Return the ID of the calling MCP session, or None outside of a request."""
+    try:
+        return get_context().session_id
+    except RuntimeError:
+        return None
+
+
+async def _netbox_get_raw(*args: Any, **kwargs: Any) -> ToolResult:
+    """
+    Fetch a NetBox response body and return it to MCP without a decode/encode round trip.
+
+    Used when a tool applies no post-processing to NetBox's JSON. The body becomes the
+    tool's text content as-is, so no structured content is produced.
+
+    Accepts the same arguments as NetBoxClientBase.get_raw.
+    """
+    body = await _call_netbox(netbox.get_raw, *args, **kwargs)
+    return _text_result(body.decode())
+
+
+def _text_result(text: str) -> ToolResult:
+    """Return text as a tool's only content, without structured content."""
+    return ToolResult(content=[TextContent(type="text", text=text)])
+
+
+def _passthrough(fields: list[str] | None) -> bool:
+    """
+    Tell whether a query's NetBox response is handed to MCP as-is (see _netbox_get_raw).
+
+    Lean shaping needs decoded objects, so it takes precedence over the passthrough, except
+    when the agent asked for explicit fields: NetBox then returns only those, which shaping
+    keeps anyway, so it would do no more than collapse related objects.
+
+    Args:
+        fields: Fields the agent asked for
+    """
+    return raw_passthrough and (not lean_responses or bool(fields))
+
+
+def _shape(tool: str, objects: list[dict[str, Any]], fields: list[str] | None) -> None:
+    """
+    Apply lean shaping to the objects a tool returns, in place, when it is enabled.
+
+    What shaping saved is logged at info level for every tool call. Changelog entries are
+    never shaped: their object data is the change itself, and a null or empty value there
+    is as much a part of it as any other.
+
+    Args:
+        tool: Name of the tool, for the savings report
+        objects: The objects to shape
+        fields: Fields the agent asked for, which are kept even when null or empty
+    """
+    if not lean_responses:
+        return
+    stats = shape_objects(objects, frozenset(fields or ()))
+    logger.info(f"{tool}: lean shaping {stats}")
+
+
+def _with_deadline(fn):
+    """
+    Run a tool within its time limits.
+
+    All NetBox requests of the call share a single retry deadline, and the call is cancelled
+    once tool_timeout has passed. When the call ends, however it ends (including when the
+    MCP client disconnects or cancels the request), requests still pending in worker threads
+    stop retrying and unsent ones are skipped.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with contextlib.ExitStack() as stack:
+            if tool_retry_budget is not None:
+                stack.enter_context(retry_budget(tool_retry_budget))
+            stack.enter_context(cancel_scope())
+            deadline = asyncio.timeout(tool_timeout)
+            try:
+                async with deadline:
+                    return await fn(*args, **kwargs)
+            except TimeoutError as e:
+                if not deadline.expired():
+                    raise
+                raise TimeoutError(
+                    f"{fn.__name__} did not complete within {tool_timeout}s; "
+                    "narrow the query (filters, fields, limit) and try again"
+                ) from e
+
+    return wrapper
 
 
 def validate_filters(filters: dict) -> None:
@@ -185,14 +393,20 @@ def validate_filters(filters: dict) -> None:
                 FILTER RULES:
                 Valid: Direct fields like {'site_id': 1, 'name': 'router', 'status': 'active'}
                 Valid: Lookups like {'name__ic': 'switch', 'id__in': [1,2,3], 'vid__gte': 100}
-                Invalid: Multi-hop like {'device__site_id': 1} - NOT supported
+                Valid: Multi-hop like {'device__site_id': 1} or {'interface__device__name': 'sw1'}
+                       The server resolves the related objects to IDs and filters on
+                       'device_id' / 'interface_id' for you - no two-step queries needed.
 
                 Lookup suffixes: n, ic, nic, isw, nisw, iew, niew, ie, nie,
                                  empty, regex, iregex, lt, lte, gt, gte, in
 
-                Two-step pattern for cross-relationship queries:
-                  sites = netbox_get_objects('dcim.site', {'name': 'NYC'})
-                  netbox_get_objects('dcim.device', {'site_id': sites[0]['id']})
+                OR: pass a list of filter dicts to match objects matching ANY of them, e.g.
+                  [{'name__ic': 'core'}, {'role': 'spine'}]
+                Keys within one dict are ANDed as usual. The branches are merged server-side:
+                duplicates are removed and count, ordering, limit and offset apply to the
+                merged set.
+                Limits: each branch may match at most 10,000 objects, and offset + limit may
+                not exceed 1000 when the merged set has too many IDs for a single request.
 
         fields: Optional list of specific fields to return
                 **IMPORTANT: ALWAYS USE THIS PARAMETER TO MINIMIZE TOKEN USAGE**
@@ -202,12 +416,14 @@ def validate_filters(filters: dict) -> None:
                 - ['id', 'name'] = returns only specified fields (RECOMMENDED)
 
                 Examples:
-                - For counting: ['id'] (minimal payload)
+                - For counting: use netbox_count_objects instead
                 - For listings: ['id', 'name', 'status']
                 - For IP addresses: ['address', 'dns_name', 'description']
 
                 Uses NetBox's native field filtering via ?fields= parameter.
                 **Always specify only the fields you actually need.**
+                Without fields, null and empty fields are omitted from the results and
+                related objects are reduced to their id and name.
 
         brief: returns only a minimal representation of each object in the response.
                This is useful when you need only a list of available objects without any related data.
@@ -228,6 +444,30 @@ def validate_filters(filters: dict) -> None:
                   - ['facility', '-name'] (by facility, then by name descending)
                   - None, '' or [] (default NetBox ordering)
 
+        pagination: 'offset' (default) or 'cursor'.
+                    Use 'cursor' to walk large result sets: pages are ordered by id and fetched
+                    with id__gt=<last id>, so every page costs the same no matter how deep the
+                    walk goes and results do not drift when objects are added mid-walk.
+                    ordering and offset cannot be combined with cursor pagination.
+
+        cursor: Opaque cursor returned as next_cursor by a previous cursor-paginated call.
+                Pass it back with the same object_type and filters to get the next page.
+                Passing a cursor implies pagination='cursor'.
+
+        output_format: 'json' (default), 'csv' or 'tsv'.
+                       The tabular formats name each field once instead of once per object,
+                       which makes listings of many objects much smaller. They return a
+                       '# count=... next=...' header line followed by one row per object;
+                       nested objects are flattened to their display name, choices to their
+                       value and lists to ';'-separated values.
+                       Use them for listings; use 'json' when you need nested details.
+
+        normalize: Deduplicate related objects (default False).
+                   Related objects in the results (site, role, tenant, tags, ...) are
+                   replaced by their ID, and each unique one is returned once under
+                   entities[<field>][<id>], e.g. {"site": 3} -> entities["site"]["3"].
+                   Use it for listings of many objects sharing the same related objects.
+
 
     Returns:
         Paginated response dict with the following structure:
@@ -240,6 +480,14 @@ def validate_filters(filters: dict) -> None:
             - results: Array of objects for this page
                        ALWAYS REFER TO THIS FIELD FOR THE OBJECTS ON THIS PAGE
 
+        With normalize=True, also:
+            - entities: Unique related objects, keyed by field and then by ID
+
+        With cursor pagination, next and previous are replaced by:
+            - next_cursor: Cursor for the next page (or null if no more pages)
+                           PASS THIS AS cursor TO GET THE NEXT PAGE OF RESULTS
+        and count is the number of matching objects from the cursor position onward.
+
     ENSURE YOU ARE AWARE THE RESULTS ARE PAGINATED BEFORE PROVIDING RESPONSE TO THE USER.
 
     Valid object_type values:
@@ -251,31 +499,97 @@ def validate_filters(filters: dict) -> None:
     See NetBox API documentation for filtering options for each object type.
     """
 )
-def netbox_get_objects(
+@_with_deadline
+async def netbox_get_objects(
     object_type: str,
-    filters: dict,
+    filters: dict | list[dict],
     fields: list[str] | None = None,
     brief: bool = False,
     limit: Annotated[int, Field(default=5, ge=1, le=100)] = 5,
     offset: Annotated[int, Field(default=0, ge=0)] = 0,
     ordering: str | list[str] | None = None,
+    pagination: Literal["offset", "cursor"] = "offset",
+    cursor: str | None = None,
+    output_format: OutputFormat = "json",
+    normalize: bool = False,
 ):
     """
     Get objects from NetBox based on their type and filters
     """
+    if normalize and output_format != "json":
+        raise ValueError(
+            "normalize requires output_format='json'; tables already flatten related objects"
+        )
+
+    # Only an unmodified JSON body can be passed through; tables, lean shaping (see
+    # _passthrough) and normalization need objects
+    result = await _get_objects(
+        object_type,
+        filters,
+        fields,
+        brief,
+        limit,
+        offset,
+        ordering,
+        pagination,
+        cursor,
+        passthrough=_passthrough(fields) and not normalize and output_format == "json",
+    )
+    if isinstance(result, ToolResult):
+        return result
+    if normalize:
+        entities = normalize_objects(result["results"])
+        # Entities are shaped like the objects themselves, not like related objects
+        _shape(
+            "netbox_get_objects",
+            [entity for table in entities.values() for entity in table.values()],
+            None,
+        )
+        result["entities"] = entities
+    _shape("netbox_get_objects", result["results"], fields)
+    if output_format == "json":
+        return result
+    return _text_result(render_page(result, output_format))
+
+
+async def _get_objects(
+    object_type: str,
+    filters: dict | list[dict],
+    fields: list[str] | None,
+    brief: bool,
+    limit: int,
+    offset: int,
+    ordering: str | list[str] | None,
+    pagination: str,
+    cursor: str | None,
+    passthrough: bool,
+) -> dict[str, Any] | ToolResult:
+    """
+    Fetch a page of objects for netbox_get_objects (see its description for the arguments).
+
+    Returns:
+        The page, or the NetBox body as a ToolResult when passthrough is set and the
+        response needs no post-processing
+    """
     # Validate object_type exists in mapping
     if object_type not in NETBOX_OBJECT_TYPES:
         valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
         raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
 
-    # Validate filter patterns
-    validate_filters(filters)
+    use_cursor = cursor is not None or pagination == "cursor"
+
+    # Rewrite OR-ed and multi-hop filters into direct filters on (related) object IDs
+    query_filters, planned = await _plan_filters(object_type, filters)
+    if query_filters is None:
+        if use_cursor:
+            return {"count": 0, "next_cursor": None, "results": []}
+        return {"count": 0, "next": None, "previous": None, "results": []}
 
     # Get API endpoint and fallback from mapping
     endpoint, fallback = _get_endpoint_info(object_type)
 
     # Build params with pagination (parameters override filters dict)
-    params = filters.copy()
+    params = query_filters.copy()
     params["limit"] = limit
     params["offset"] = offset
 
@@ -285,18 +599,253 @@ def netbox_get_objects(
     if brief:
         params["brief"] = "1"
 
+    _exclude_heavy_fields(object_type, params)
+
     if ordering:
         if isinstance(ordering, list):
             ordering = ",".join(ordering)
         if ordering.strip() != "":
             params["ordering"] = ordering
 
+    split = _split_id_filter(endpoint, params, planned)
+    if split is not None:
+        if use_cursor:
+            raise ValueError(
+                "The filters match too many objects for cursor pagination; "
+                "narrow them or use offset pagination"
+            )
+        return await _get_objects_in_chunks(endpoint, fallback, params, *split)
+
+    if use_cursor:
+        return await _get_objects_by_cursor(
+            object_type, filters, params, cursor, endpoint, fallback
+        )
+
     # Make API call
-    return netbox.get(endpoint, params=params, fallback_endpoint=fallback)
+    if passthrough:
+        return await _netbox_get_raw(endpoint, params=params, fallback_endpoint=fallback)
+    return await _netbox_get(endpoint, params=params, fallback_endpoint=fallback)
+
+
+async def _plan_filters(
+    object_type: str, filters: dict | list[dict]
+) -> tuple[dict[str, Any] | None, set[str]]:
+    """
+    Validate filters, rewriting OR-ed and multi-hop filters into direct ones.
+
+    Args:
+        object_type: The NetBox object type
+        filters: A filter dict, or a list of OR-ed filter dicts
+
+    Returns:
+        Tuple of (direct filters, names of the ID-list filters the rewrite added). The
+        filters are None when the query cannot match anything.
+
+    Raises:
+        ValueError: If the filters are invalid
+    """
+    if isinstance(filters, list):
+        return await _union_filters(object_type, filters), {"id"}
+    if not any(is_multi_hop(name) for name in filters):
+        validate_filters(filters)
+        return filters, set()
+    check_relations(object_type, filters)
+    query_filters = await join_planner.plan(object_type, filters, _session_key())
+    if query_filters is None:
+        return None, set()
+    validate_filters(query_filters)
+    return query_filters, set(query_filters) - set(filters)
+
+
+async def _union_filters(object_type: str, branches: list[dict]) -> dict[str, Any] | None:
+    """
+    Resolve OR-ed filter dicts to a single filter on the IDs matching any of them.
+
+    Each branch is resolved to its ID set with id-only queries, in parallel, so the union
+    is exact: querying NetBox with the union's IDs applies ordering and pagination to the
+    merged set and counts it exactly. The branches' own ID sets are resolved afresh on every
+    call; only the multi-hop relations within a branch come from the join cache.
+
+    Args:
+        object_type: The NetBox object type
+        branches: Filter dicts, an object matching any of them matches the query
+
+    Returns:
+        {'id': [...]} with the sorted union of IDs, or None if no branch matches anything
+
+    Raises:
+        ValueError: If there are no or too many branches, or a branch's filters are invalid
+    """
+    if not 1 <= len(branches) <= MAX_FILTER_BRANCHES:
+        raise ValueError(f"filters must be a dict or a list of 1 to {MAX_FILTER_BRANCHES} dicts")
+    # Reject invalid branches before any of them is sent to NetBox
+    for branch in branches:
+        if any(is_multi_hop(name) for name in branch):
+            check_relations(object_type, branch)
+        else:
+            validate_filters(branch)
+
+    session = _session_key()
+    id_sets = await asyncio.gather(
+        *(join_planner.resolve(object_type, branch, session, cache=False) for branch in branches)
+    )
+    ids = sorted(set().union(*id_sets))
+    return {"id": ids} if ids else None
+
+
+def _split_id_filter(
+    endpoint: str, params: dict[str, Any], planned: set[str]
+) -> tuple[str, list[list[int]]] | None:
+    """
+    Find a planned ID-list filter too long for one request URL and chunk its IDs.
+
+    Args:
+        endpoint: API endpoint of the query
+        params: The query parameters
+        planned: Names of the filters added by the join planner
+
+    Returns:
+        Tuple of (filter name, ID chunks), or None if the query fits in one request
+    """
+    if not planned:
+        return None
+    name = max(planned, key=lambda key: len(params[key]))
+    rest = {k: v for k, v in params.items() if k != name}
+    base_url = f"{getattr(netbox, 'api_url', '')}/{endpoint}/?{urlencode(rest, doseq=True)}"
+    chunks = chunk_ids(params[name], len(base_url), name=name)
+    return (name, chunks) if len(chunks) > 1 else None
+
+
+def _chunked_params(
+    endpoint: str, params: dict[str, Any], planned: set[str]
+) -> list[dict[str, Any]]:
+    """Return the params of each request a query is split into (see _split_id_filter)."""
+    split = _split_id_filter(endpoint, params, planned)
+    if split is None:
+        return [params]
+    name, chunks = split
+    return [{**params, name: chunk} for chunk in chunks]
+
+
+async def _get_objects_in_chunks(
+    endpoint: str,
+    fallback: str | None,
+    params: dict[str, Any],
+    name: str,
+    chunks: list[list[int]],
+) -> dict[str, Any]:
+    """
+    Run a query whose ID-list filter is split into chunks, and merge the pages.
+
+    Each related object ID matches a disjoint set of objects, so the chunk counts add up
+    to the exact total.
+
+    Args:
+        endpoint: API endpoint of the query
+        fallback: Optional fallback endpoint
+        params: The query parameters, including limit and offset
+        name: Name of the chunked filter
+        chunks: The filter's IDs, chunked
+
+    Returns:
+        Paginated response dict; next and previous are null, page with offset instead
+    """
+    offset, limit = params.pop("offset"), params.pop("limit")
+    branch, added = branch_params(params, offset, limit)
+    pages = await asyncio.gather(
+        *(
+            _netbox_get(endpoint, params={**branch, name: chunk}, fallback_endpoint=fallback)
+            for chunk in chunks
+        )
+    )
+    results = [page.get("results", []) for page in pages]
+    return {
+        "count": sum(page.get("count", 0) for page in pages),
+        "next": None,
+        "previous": None,
+        "results": merge_results(results, params.get("ordering"), offset, limit, added),
+    }
+
+
+def _filters_digest(filters: dict) -> str:
+    """Return a short digest of a filters dict, used to bind cursors to their query."""
+    canonical = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def _encode_cursor(object_type: str, filters: dict, last_id: int) -> str:
+    """Encode an opaque keyset cursor pointing after ``last_id``."""
+    payload = {"t": object_type, "f": _filters_digest(filters), "id": last_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, object_type: str, filters: dict) -> int:
+    """
+    Decode a keyset cursor and return the last ID it points after.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor: pass next_cursor from a previous response") from e
+    if payload.get("t") != object_type or payload.get("f") != _filters_digest(filters):
+        raise ValueError("Cursor was issued for a different object_type or filters")
+    return last_id
+
+
+async def _get_objects_by_cursor(
+    object_type: str,
+    filters: dict,
+    params: dict[str, Any],
+    cursor: str | None,
+    endpoint: str,
+    fallback: str | None,
+) -> dict[str, Any]:
+    """
+    Fetch one keyset-paginated page: ordered by id and filtered with id__gt=<last id>.
+
+    Args:
+        object_type: The NetBox object type
+        filters: The caller's filters (used to bind the cursor to the query)
+        params: Query params already built by netbox_get_objects
+        cursor: Cursor from a previous page, or None for the first page
+        endpoint: API endpoint for the object type
+        fallback: Optional fallback endpoint
+
+    Returns:
+        Page dict with count, next_cursor and results
+    """
+    if params.pop("offset", 0):
+        raise ValueError("offset cannot be combined with cursor pagination; pass cursor instead")
+    if params.get("ordering", "id") != "id":
+        raise ValueError("Cursor pagination always orders by id; remove the ordering parameter")
+    params["ordering"] = "id"
+
+    # The cursor needs every row's id, even when the caller projected other fields
+    if "fields" in params and "id" not in params["fields"].split(","):
+        params["fields"] += ",id"
+
+    if cursor:
+        last_id = _decode_cursor(cursor, object_type, filters)
+        if "id__gt" in params:
+            last_id = max(last_id, int(params["id__gt"]))
+        params["id__gt"] = last_id
+
+    response = await _netbox_get(endpoint, params=params, fallback_endpoint=fallback)
+    results = response.get("results", [])
+    next_cursor = None
+    if response.get("next") and results:
+        next_cursor = _encode_cursor(object_type, filters, results[-1]["id"])
+    return {"count": response.get("count"), "next_cursor": next_cursor, "results": results}
 
 
 @mcp.tool
-def netbox_get_object_by_id(
+@_with_deadline
+async def netbox_get_object_by_id(
     object_type: str,
     object_id: int,
     fields: list[str] | None = None,
@@ -322,6 +871,8 @@ def netbox_get_object_by_id(
 
                 Uses NetBox's native field filtering via ?fields= parameter.
                 **Always specify only the fields you actually need.**
+                Without fields, null and empty fields are omitted from the results and
+                related objects are reduced to their id and name.
         brief: returns only a minimal representation of the object in the response.
                This is useful when you need only a summary of the object without any related data.
 
@@ -345,16 +896,293 @@ def netbox_get_object_by_id(
     if brief:
         params["brief"] = "1"
 
-    return netbox.get(full_endpoint, params=params, fallback_endpoint=full_fallback)
+    _exclude_heavy_fields(object_type, params)
+
+    if _passthrough(fields):
+        return await _netbox_get_raw(full_endpoint, params=params, fallback_endpoint=full_fallback)
+    result = await _netbox_get(full_endpoint, params=params, fallback_endpoint=full_fallback)
+    _shape("netbox_get_object_by_id", [result], fields)
+    return result
+
+
+@mcp.tool
+@_with_deadline
+async def netbox_get_objects_by_ids(
+    object_type: str,
+    ids: Annotated[list[int], Field(min_length=1, max_length=1000)],
+    fields: list[str] | None = None,
+    brief: bool = False,
+):
+    """
+    Get many NetBox objects of one type by their IDs in a single call.
+
+    Use this instead of repeated netbox_get_object_by_id calls when resolving a list of
+    related IDs (e.g. the devices referenced by a set of interfaces).
+
+    Args:
+        object_type: String representing the NetBox object type (e.g. "dcim.device", "ipam.ipaddress")
+        ids: The numeric IDs of the objects (up to 1000; duplicates are fetched once)
+        fields: Optional list of specific fields to return
+                **IMPORTANT: ALWAYS USE THIS PARAMETER TO MINIMIZE TOKEN USAGE**
+                - ['id', 'name'] = returns only specified fields (RECOMMENDED)
+                The id field is always included.
+        brief: returns only a minimal representation of each object in the response.
+
+    Returns:
+        Dict with:
+            - results: Objects keyed by ID
+            - missing: IDs that matched no object (deleted or never existed)
+    """
+    # Validate object_type exists in mapping
+    if object_type not in NETBOX_OBJECT_TYPES:
+        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
+        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
+
+    endpoint, fallback = _get_endpoint_info(object_type)
+
+    params = {}
+    if fields:
+        params["fields"] = ",".join(fields)
+
+    if brief:
+        params["brief"] = "1"
+
+    _exclude_heavy_fields(object_type, params)
+
+    result = await _call_netbox(
+        netbox.get_many,
+        endpoint,
+        ids,
+        params=params,
+        fallback_endpoint=fallback,
+        concurrency=search_concurrency,
+    )
+    _shape("netbox_get_objects_by_ids", list(result["results"].values()), fields)
+    return result
+
+
+class CountQuery(BaseModel):
+    """One count requested from netbox_count_objects."""
+
+    object_type: str
+    filters: dict | list[dict] = Field(default_factory=dict)
+
+
+@mcp.tool
+@_with_deadline
+async def netbox_count_objects(
+    queries: Annotated[list[CountQuery], Field(min_length=1, max_length=50)],
+) -> list[dict[str, Any]]:
+    """
+    Count the NetBox objects matching several (object_type, filters) pairs at once.
+
+    Use this instead of netbox_get_objects when only "how many" matters (dashboards,
+    sanity checks, deciding whether a listing is worth paging through). Counts are fetched
+    concurrently and reused for a short time.
+
+    Args:
+        queries: List of {"object_type": ..., "filters": {...}} entries (up to 50).
+                 filters accepts everything netbox_get_objects does, including multi-hop
+                 filters and lists of OR-ed filter dicts, and defaults to no filters.
+
+                 Example:
+                 [{"object_type": "dcim.device", "filters": {"status": "active"}},
+                  {"object_type": "ipam.ipaddress", "filters": {"vrf_id": 3}},
+                  {"object_type": "ipam.vlan"}]
+
+    Returns:
+        One entry per query, in order, with object_type and count. A query that fails
+        (e.g. invalid filters) has count null and an error message instead.
+    """
+    semaphore = asyncio.Semaphore(search_concurrency)
+
+    async def count(query: CountQuery) -> dict[str, Any]:
+        object_type = query.object_type
+        try:
+            async with semaphore:
+                total = await _count_objects(object_type, query.filters)
+        except Exception as e:
+            return {"object_type": object_type, "count": None, "error": str(e)}
+        return {"object_type": object_type, "count": total}
+
+    return list(await asyncio.gather(*(count(query) for query in queries)))
+
+
+async def _count_objects(object_type: str, filters: dict | list[dict]) -> int:
+    """
+    Count the objects matching filters with a limit=1, brief request.
+
+    Args:
+        object_type: The NetBox object type
+        filters: Filters as accepted by netbox_get_objects
+
+    Returns:
+        Number of matching objects
+
+    Raises:
+        ValueError: If the object type or filters are invalid
+    """
+    if object_type not in NETBOX_OBJECT_TYPES:
+        raise ValueError(f"Invalid object_type '{object_type}'")
+    endpoint, fallback = _get_endpoint_info(object_type)
+    key = f"count:{object_type}:{_filters_digest(filters)}"
+    if count_cache is not None and (cached := count_cache.get(key)) is not None:
+        return int(cached)
+
+    query_filters, planned = await _plan_filters(object_type, filters)
+    if query_filters is None:
+        total = 0
+    elif isinstance(filters, list):
+        # The union's IDs already are the exact answer
+        total = len(query_filters["id"])
+    else:
+        params = {**query_filters, "limit": 1, "brief": "1"}
+        pages = await asyncio.gather(
+            *(
+                _netbox_get(endpoint, params=chunk, fallback_endpoint=fallback)
+                for chunk in _chunked_params(endpoint, params, planned)
+            )
+        )
+        total = sum(page.get("count", 0) for page in pages)
+
+    if count_cache is not None:
+        count_cache.set(key, endpoint, str(total).encode())
+    return total
+
+
+@mcp.tool
+@_with_deadline
+async def netbox_aggregate(
+    object_type: str,
+    filters: dict | list[dict],
+    group_by: list[str] | None = None,
+    metrics: list[str] | None = None,
+    max_rows: Annotated[int, Field(default=50, ge=1, le=1000)] = 50,
+    max_objects: Annotated[int, Field(default=100_000, ge=1, le=1_000_000)] = 100_000,
+) -> dict[str, Any]:
+    """
+    Compute group-by counts, sums, averages, min/max and distinct counts inside the server.
+
+    Use this instead of paging through objects and doing arithmetic yourself, e.g.
+    "devices per site by status" or "total vCPUs per cluster". Only the fields needed are
+    fetched and only the aggregate table is returned.
+
+    Args:
+        object_type: String representing the NetBox object type (e.g. "dcim.device")
+        filters: Filters as accepted by netbox_get_objects (dict, multi-hop or OR list)
+        group_by: Field paths to group by, e.g. ['site', 'status'] or ['cluster.name'].
+                  Related objects group by name, choice fields by value, tags by their
+                  comma-separated names. Omit for a single row over all objects.
+        metrics: Metrics per group (default ['count']):
+                 - 'count'
+                 - 'sum:<field>', 'avg:<field>' (numeric fields, e.g. 'sum:vcpus')
+                 - 'min:<field>', 'max:<field>'
+                 - 'distinct:<field>' (number of distinct values, e.g. 'distinct:site')
+        max_rows: Maximum number of groups returned, largest groups first (default 50)
+        max_objects: Maximum number of objects scanned (default 100000)
+
+    Returns:
+        Dict with:
+            - rows: One row per group with the group_by fields and one column per metric
+            - totals: The metrics over all scanned objects (when grouping)
+            - groups: Number of groups found; truncated is true if rows were cut off
+            - objects_matched: Number of objects matching the filters
+            - objects_scanned: Number of objects aggregated; partial is true if fewer
+              than objects_matched (raise max_objects or narrow the filters)
+    """
+    if object_type not in NETBOX_OBJECT_TYPES:
+        valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
+        raise ValueError(f"Invalid object_type. Must be one of:\n{valid_types}")
+    group_by = group_by or []
+    parsed = [parse_metric(spec) for spec in metrics or ["count"]]
+    aggregator = Aggregator(group_by, parsed)
+
+    if not group_by and all(metric.op == "count" for metric in parsed):
+        # Nothing to stream: the count alone answers the query
+        matched = await _count_objects(object_type, filters)
+        return {
+            "rows": [{"count": matched}],
+            "groups": 1,
+            "truncated": False,
+            "objects_matched": matched,
+            "objects_scanned": matched,
+            "partial": False,
+        }
+
+    query_filters, planned = await _plan_filters(object_type, filters)
+    matched = 0
+    if query_filters is not None:
+        endpoint, fallback = _get_endpoint_info(object_type)
+        paths = group_by + [m.path for m in parsed if m.path is not None]
+        params = {**query_filters, "fields": ",".join(top_level_fields(paths))}
+        _exclude_heavy_fields(object_type, params)
+        for chunk in _chunked_params(endpoint, params, planned):
+            budget = max_objects - aggregator.scanned
+            matched += await _aggregate_pages(aggregator, endpoint, chunk, fallback, budget)
+
+    if group_by:
+        rows, truncated = aggregator.rows(max_rows)
+    else:
+        rows, truncated = [aggregator.totals()], False
+    result: dict[str, Any] = {"rows": rows}
+    if group_by:
+        result["totals"] = aggregator.totals()
+    result.update(
+        groups=len(aggregator.groups) if group_by else 1,
+        truncated=truncated,
+        objects_matched=matched,
+        objects_scanned=aggregator.scanned,
+        partial=aggregator.scanned < matched,
+    )
+    return result
+
+
+async def _aggregate_pages(
+    aggregator: Aggregator,
+    endpoint: str,
+    params: dict[str, Any],
+    fallback: str | None,
+    max_objects: int,
+) -> int:
+    """
+    Stream the objects of a query into an aggregator, several pages at a time.
+
+    Args:
+        aggregator: Aggregator the objects are fed to
+        endpoint: API endpoint of the query
+        params: Query parameters (limit/offset are managed here)
+        fallback: Optional fallback endpoint
+        max_objects: Maximum number of objects to feed
+
+    Returns:
+        Number of objects matching the query (which may exceed the number fed)
+    """
+
+    def fetch(offset: int, limit: int) -> Awaitable[dict[str, Any]]:
+        page_params = {**params, "limit": limit, "offset": offset}
+        return _netbox_get(endpoint, params=page_params, fallback_endpoint=fallback)
+
+    pages = iter_pages(fetch, AGGREGATE_PAGE_SIZE, max_objects, AGGREGATE_CONCURRENCY)
+    async with contextlib.aclosing(pages):
+        first = await anext(pages)
+        matched = first.get("count", len(first.get("results", [])))
+        aggregator.add(first.get("results", []))
+        async for page in pages:
+            aggregator.add(page.get("results", []))
+    return matched
 
 
 @mcp.tool
-def netbox_get_changelogs(filters: dict):
+@_with_deadline
+async def netbox_get_changelogs(filters: dict, output_format: OutputFormat = "json"):
     """
     Get object change records (changelogs) from NetBox based on filters.
 
     Args:
         filters: dict of filters to apply to the API call based on the NetBox API filtering options
+        output_format: 'json' (default), 'csv' or 'tsv'. The tabular formats return a
+                       '# count=... next=...' header line followed by one row per entry,
+                       with nested objects flattened to their display name.
 
     Returns:
         Paginated response dict with the following structure:
@@ -403,11 +1231,17 @@ def netbox_get_changelogs(filters: dict):
     - prechange_data: The object's data before the change (null for creations)
     - postchange_data: The object's data after the change (null for deletions)
     - time: The timestamp when the change was made
+
+    Entries are returned in full: unlike other tools, nulls and related-object detail are
+    not stripped from them.
     """
     endpoint = "core/object-changes"
 
-    # Make API call
-    return netbox.get(endpoint, params=filters)
+    # Make API call; entries are not shaped, as nulls in their object data are changes too
+    result = await _netbox_get(endpoint, params=filters)
+    if output_format == "json":
+        return result
+    return _text_result(render_page(result, output_format))
 
 
 @mcp.tool(
@@ -431,10 +1265,30 @@ def netbox_get_changelogs(filters: dict):
                 Examples: ['id', 'name', 'status'], ['address', 'dns_name']
                 Uses NetBox's native field filtering via ?fields= parameter
         limit: Max results per object type (default 5, max 100)
+        route: Route recognizable queries to exact filters (default True):
+               IP address -> ipam.ipaddress (address), CIDR -> ipam.prefix (prefix),
+               MAC address -> dcim.interface / virtualization.vminterface (mac_address),
+               VLAN ID (1-4094) -> ipam.vlan (vid), serial number -> dcim.device (serial).
+               Only routes to types being searched; if a routed search finds nothing,
+               the broad search of all types runs instead.
+        ranked: Merge hits across types into one ranked list of at most `limit` hits
+                (default False). Hits are ranked by name match (exact, prefix,
+                substring, other field), then by the order of object_types. Types are
+                searched in priority order and lower-priority types are skipped once
+                `limit` exact or prefix matches are found.
+        output_format: 'json' (default), 'csv' or 'tsv'. The tabular formats return one
+                       section per object type, headed by a '# <object_type> count=<n>'
+                       line, with nested objects flattened to their display name. Ranked
+                       results are one table with object_type and match columns.
 
     Returns:
         Dictionary with object_type keys and list of matching objects.
-        All searched types present in result (empty list if no matches).
+        All searched types present in result (empty list if no matches); a routed
+        search returns only the types it was routed to.
+        With ranked=True: {"results": [{"object_type", "match", "object"}, ...],
+        "skipped": [types not searched], "timed_out": [types that missed the deadline]}.
+        Types are queried concurrently; types that did not answer before the search
+        deadline are listed under a "timed_out" key (their lists are empty).
 
     Example:
         # Search for anything matching "switch"
@@ -460,15 +1314,39 @@ def netbox_get_changelogs(filters: dict):
         )
     """
 )
-def netbox_search_objects(
+@_with_deadline
+async def netbox_search_objects(
     query: str,
     object_types: list[str] | None = None,
     fields: list[str] | None = None,
     limit: Annotated[int, Field(default=5, ge=1, le=100)] = 5,
-) -> dict[str, list[dict]]:
+    route: bool = True,
+    ranked: bool = False,
+    output_format: OutputFormat = "json",
+):
     """
     Perform global search across NetBox infrastructure.
     """
+    results = await _search_objects(query, object_types, fields, limit, route, ranked)
+    if ranked:
+        objects = [hit["object"] for hit in results["results"]]
+    else:
+        objects = [obj for key, hits in results.items() if key != "timed_out" for obj in hits]
+    _shape("netbox_search_objects", objects, fields)
+    if output_format == "json":
+        return results
+    return _text_result(render_search(results, output_format))
+
+
+async def _search_objects(
+    query: str,
+    object_types: list[str] | None,
+    fields: list[str] | None,
+    limit: int,
+    route: bool,
+    ranked: bool,
+) -> dict[str, list]:
+    """Run a search for netbox_search_objects (see its description for the arguments)."""
     search_types = object_types if object_types is not None else DEFAULT_SEARCH_TYPES
 
     # Validate all object types exist in mapping
@@ -477,31 +1355,182 @@ def netbox_search_objects(
             valid_types = "\n".join(f"- {t}" for t in sorted(NETBOX_OBJECT_TYPES.keys()))
             raise ValueError(f"Invalid object_type '{obj_type}'. Must be one of:\n{valid_types}")
 
-    results = {obj_type: [] for obj_type in search_types}
+    loop = asyncio.get_running_loop()
+    deadline = None if search_timeout is None else loop.time() + search_timeout
+    # Only sent when fields are given: httpx would send fields=None as an empty fields=
+    projection = {"fields": ",".join(fields)} if fields else {}
+
+    # Route IPs, prefixes, MACs, VLAN IDs and serials to exact filters on the matching types
+    if route:
+        shape, routes = classify_query(query)
+        routed = {r.object_type: r.filters for r in routes if r.object_type in search_types}
+        if routed:
+            results = await _search_fan_out(
+                {
+                    obj_type: {**filters, "limit": limit, **projection}
+                    for obj_type, filters in routed.items()
+                },
+                deadline,
+            )
+            if any(results[obj_type] for obj_type in routed) or "timed_out" in results:
+                logger.debug(f"Search for {query!r} routed as {shape} to {list(routed)}")
+                if ranked:
+                    top = TopK(limit)
+                    _rank_into(top, query, list(routed), results)
+                    return {
+                        "results": top.results(),
+                        "skipped": [],
+                        "timed_out": results.get("timed_out", []),
+                    }
+                return results
+
+    if ranked:
+        return await _ranked_search(query, search_types, projection, limit, deadline)
+
+    # Broad search of every type with NetBox's q filter
+    return await _search_fan_out(
+        {obj_type: {"q": query, "limit": limit, **projection} for obj_type in search_types},
+        deadline,
+    )
 
-    # Build results dictionary (error-resilient)
+
+def _rank_into(top: TopK, query: str, search_types: list[str], results: dict[str, list]) -> None:
+    """Score the per-type results of a fan-out and offer them to a top-k heap."""
     for obj_type in search_types:
-        try:
-            endpoint, fallback = _get_endpoint_info(obj_type)
-            response = netbox.get(
-                endpoint,
-                params={
-                    "q": query,
-                    "limit": limit,
-                    "fields": ",".join(fields) if fields else None,
-                },
-                fallback_endpoint=fallback,
+        type_rank = search_types.index(obj_type)
+        for obj in results.get(obj_type, []):
+            top.push(score_match(query, obj), type_rank, obj_type, obj)
+
+
+async def _ranked_search(
+    query: str,
+    search_types: list[str],
+    projection: dict[str, str],
+    limit: int,
+    deadline: float | None,
+) -> dict[str, list]:
+    """
+    Search types in priority order and merge the hits into one ranked top-k list.
+
+    Types are queried in waves of RANKED_SEARCH_WAVE_SIZE. Once ``limit`` hits with an
+    exact or prefix name match have been found, the remaining lower-priority types are
+    skipped.
+
+    Args:
+        query: Search term
+        search_types: Object types in priority order
+        projection: The fields parameter to request, or {} for all fields
+        limit: Number of hits to return
+        deadline: Event loop time after which unfinished types are reported as timed out
+
+    Returns:
+        Dictionary with the ranked "results", plus the "skipped" and "timed_out" types
+    """
+    search_types = list(dict.fromkeys(search_types))
+    top = TopK(limit)
+    timed_out: list[str] = []
+    searched = 0
+    loop = asyncio.get_running_loop()
+
+    while searched < len(search_types) and not top.full_of(PREFIX):
+        if deadline is not None and loop.time() >= deadline:
+            timed_out.extend(search_types[searched:])
+            searched = len(search_types)
+            break
+        wave = search_types[searched : searched + RANKED_SEARCH_WAVE_SIZE]
+        results = await _search_fan_out(
+            {obj_type: {"q": query, "limit": limit, **projection} for obj_type in wave},
+            deadline,
+        )
+        timed_out.extend(results.pop("timed_out", []))
+        _rank_into(top, query, search_types, results)
+        searched += len(wave)
+
+    return {
+        "results": top.results(),
+        "skipped": search_types[searched:],
+        "timed_out": timed_out,
+    }
+
+
+async def _search_fan_out(
+    queries: dict[str, dict[str, Any]], deadline: float | None
+) -> dict[str, list]:
+    """
+    Query several object types concurrently and collect their results.
+
+    Args:
+        queries: Query params per object type
+        deadline: Event loop time after which unfinished types are reported as timed out
+
+    Returns:
+        Dictionary with a results list per object type (empty on error or timeout), plus a
+        "timed_out" list of object types when any missed the deadline
+    """
+    results: dict[str, list] = {obj_type: [] for obj_type in queries}
+    if not results:
+        return results
+
+    semaphore = asyncio.Semaphore(search_concurrency)
+
+    async def search_type(obj_type: str) -> list[dict]:
+        endpoint, fallback = _get_endpoint_info(obj_type)
+        _exclude_heavy_fields(obj_type, queries[obj_type])
+        async with semaphore:
+            response = await _netbox_get(
+                endpoint, params=queries[obj_type], fallback_endpoint=fallback
             )
-            # Extract results array from paginated response
-            results[obj_type] = response.get("results", [])
-        except Exception:  # noqa: S112 - intentional error-resilient search
-            # Continue searching other types if one fails
-            # results[obj_type] already has empty list
-            continue
+        # Extract results array from paginated response
+        return response.get("results", [])
+
+    # Query all types concurrently; latency is that of the slowest type, capped by the deadline
+    timeout = None
+    if deadline is not None:
+        timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+    tasks = {obj_type: asyncio.ensure_future(search_type(obj_type)) for obj_type in results}
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        task.cancel()
 
+    # Build results dictionary (error-resilient)
+    timed_out = []
+    for obj_type, task in tasks.items():
+        if task in pending:
+            timed_out.append(obj_type)
+        elif task.exception() is not None:
+            # Continue with other types if one fails; results[obj_type] already has empty list
+            logger.debug(f"Search of {obj_type} failed: {task.exception()}")
+        else:
+            results[obj_type] = task.result()
+
+    if timed_out:
+        results["timed_out"] = timed_out
     return results
 
 
+def _exclude_heavy_fields(object_type: str, params: dict[str, Any]) -> None:
+    """
+    Ask NetBox to skip the object type's expensive fields unless they were requested.
+
+    NetBox computes some fields for every object of a full (non-brief) response, even
+    when ?fields= leaves them out, e.g. the rendered config_context of devices and virtual
+    machines. The object types' "exclude" lists name them; those not listed in the
+    request's fields are added to its exclude parameter.
+
+    Args:
+        object_type: The object type queried
+        params: The query parameters, updated in place
+    """
+    heavy = NETBOX_OBJECT_TYPES[object_type].get("exclude")
+    if not heavy or params.get("brief"):
+        return
+    requested = str(params.get("fields") or "").split(",")
+    excluded = str(params.get("exclude") or "").split(",")
+    excluded += [field for field in heavy if field not in requested and field not in excluded]
+    if any(excluded):
+        params["exclude"] = ",".join(field for field in excluded if field)
+
+
 def _get_endpoint_info(object_type: str) -> tuple[str, str | None]:
     """
     Returns (endpoint, fallback_endpoint) for the given object type.
@@ -522,7 +1551,8 @@ def _get_endpoint_info(object_type: str) -> tuple[str, str | None]:
 
 def main() -> None:
     """Main entry point for the MCP server."""
-    global netbox
+    global netbox, tool_retry_budget, raw_passthrough, search_concurrency, search_timeout
+    global count_cache, lean_responses, tool_timeout
 
     cli_overlay: dict[str, Any] = parse_cli_args()
 
@@ -533,7 +1563,6 @@ def main() -> None:
         sys.exit(1)
 
     configure_logging(settings.log_level)
-    logger = logging.getLogger(__name__)
 
     logger.info("Starting NetBox MCP Server")
     logger.info(f"Effective configuration: {settings.get_effective_config_summary()}")
@@ -559,17 +1588,81 @@ def main() -> None:
             "Ensure this is secured with TLS/reverse proxy if exposed to network."
         )
 
-    try:
-        netbox = NetBoxRestClient(
-            url=str(settings.netbox_url),
-            token=settings.netbox_token.get_secret_value(),
-            verify_ssl=settings.verify_ssl,
+    cache = None
+    if settings.cache_enabled:
+        cache = ResponseCache(
+            max_bytes=settings.cache_max_bytes,
+            default_ttl=settings.cache_default_ttl,
         )
+
+    retry_policy = RetryPolicy(
+        max_retries=settings.retry_max_retries,
+        backoff_base=settings.retry_backoff,
+        backoff_max=settings.retry_backoff_max,
+        deadline=settings.retry_deadline,
+        retry_writes=settings.retry_writes,
+    )
+    if settings.count_cache_ttl > 0:
+        count_cache = ResponseCache(
+            max_bytes=1024 * 1024, default_ttl=settings.count_cache_ttl, ttls={}
+        )
+
+    tool_retry_budget = settings.retry_deadline
+    raw_passthrough = settings.raw_passthrough
+    lean_responses = settings.lean_responses
+    search_concurrency = settings.search_concurrency
+    search_timeout = settings.search_timeout
+    tool_timeout = settings.tool_timeout or None
+
+    try:
+        decoder = get_decoder(settings.json_decoder)
+        logger.debug(f"Using JSON decoder: {decoder.name}")
+        if settings.netbox_client == "async":
+            netbox = NetBoxAsyncClient(
+                url=str(settings.netbox_url),
+                token=settings.netbox_token.get_secret_value(),
+                verify_ssl=settings.verify_ssl,
+                http2=settings.http2,
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+                cache=cache,
+                retry_policy=retry_policy,
+                decoder=decoder,
+                timeout=settings.request_timeout or None,
+            )
+        else:
+            netbox = NetBoxRestClient(
+                url=str(settings.netbox_url),
+                token=settings.netbox_token.get_secret_value(),
+                verify_ssl=settings.verify_ssl,
+                max_connections=settings.max_connections,
+                cache=cache,
+                retry_policy=retry_policy,
+                decoder=decoder,
+                timeout=settings.request_timeout or None,
+            )
         logger.debug("NetBox client initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize NetBox client: {e}")
         sys.exit(1)
 
+    # The async client learns version-dependent endpoints from its first fallback instead,
+    # since its connection pool must not be bound to a throwaway event loop.
+    if isinstance(netbox, NetBoxRestClient):
+        try:
+            logger.info(f"NetBox endpoint probe: {netbox.probe()}")
+        except Exception as e:
+            logger.warning(f"NetBox version probe failed, endpoints will be learned lazily: {e}")
+
+    if settings.replica_path:
+        netbox = NetBoxReplicaClient(ReplicaStore(settings.replica_path), upstream=netbox)
+        netbox.decoder = decoder
+        logger.info(
+            f"Serving reads of {sorted(netbox.store.endpoints().values())} "
+            f"from replica {settings.replica_path}"
+        )
+
     try:
         if settings.transport == "stdio":
             logger.info("Starting stdio transport")
@@ -0,0 +1,124 @@
+"""
+Lean shaping of NetBox objects before they are returned to MCP clients.
+
+NetBox objects carry a lot that an agent never reads: hyperlinks, a display string
+duplicating the name, nulls and empty lists for unset fields, and related objects
+embedded with their url, display, slug and description. Shaping strips that noise in
+place, in a single pass over each object, and collapses related objects to {id, name}.
+"""
+
+from typing import Any
+
+# Hyperlink fields, dropped at every level
+LINK_FIELDS = frozenset({"url", "display_url"})
+
+
+class ShapeStats:
+    """What shaping removed from a response."""
+
+    __slots__ = ("bytes_saved", "collapsed", "dropped")
+
+    def __init__(self):
+        self.dropped = 0
+        self.collapsed = 0
+        self.bytes_saved = 0
+
+    def __str__(self) -> str:
+        return (
+            f"dropped {self.dropped} fields, collapsed {self.collapsed} related objects, "
+            f"~{self.bytes_saved} bytes saved"
+        )
+
+
+def json_size(value: Any) -> int:
+    """Estimate the compact JSON size of a value in bytes (exact for unescaped ASCII)."""
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        items = sum(len(str(key)) + 4 + json_size(item) for key, item in value.items())
+        return 1 + items + (not value)
+    if isinstance(value, list):
+        return 1 + sum(json_size(item) + 1 for item in value) + (not value)
+    return len(str(value))
+
+
+def _is_droppable(key: str, value: Any) -> bool:
+    """Tell whether a field carries nothing the agent can use."""
+    if value is None or key in LINK_FIELDS:
+        return True
+    if isinstance(value, list):
+        return not value
+    return key == "custom_fields" and value == {}
+
+
+def _collapse(obj: dict[str, Any], stats: ShapeStats) -> dict[str, Any]:
+    """
+    Reduce a related object to its ID and name.
+
+    Objects without a name (IP addresses, prefixes, cables, ...) keep their display string
+    instead, as it is their only label.
+    """
+    label = "name" if "name" in obj else "display"
+    collapsed = {"id": obj["id"]}
+    if label in obj:
+        collapsed[label] = obj[label]
+    stats.collapsed += 1
+    stats.bytes_saved += json_size(obj) - json_size(collapsed)
+    return collapsed
+
+
+def _shape_value(value: Any, stats: ShapeStats) -> Any:
+    """Shape a field value of an object, returning the (possibly replaced) value."""
+    if isinstance(value, dict):
+        return _collapse(value, stats) if "id" in value else value
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, dict) and "id" in item:
+                value[i] = _collapse(item, stats)
+    return value
+
+
+def shape_object(obj: dict[str, Any], stats: ShapeStats, keep: frozenset[str] = frozenset()):
+    """
+    Shape one object in place.
+
+    Drops hyperlinks, display, nulls, empty lists and empty custom_fields, and collapses
+    related objects (also inside lists, such as tags) to {id, name}. Other nested dicts
+    (choices, custom field values, config contexts) are left as they are, so that shaping
+    never modifies a dict the object does not own.
+
+    Args:
+        obj: The object, as decoded from NetBox
+        stats: Tally of what was removed
+        keep: Fields never dropped, typically those the agent explicitly asked for
+    """
+    for key in list(obj):
+        value = obj[key]
+        if key not in keep and (key == "display" or _is_droppable(key, value)):
+            del obj[key]
+            stats.dropped += 1
+            stats.bytes_saved += len(key) + 4 + json_size(value)
+        elif isinstance(value, dict | list):
+            obj[key] = _shape_value(value, stats)
+
+
+def shape_objects(objects: list[dict[str, Any]], keep: frozenset[str] = frozenset()) -> ShapeStats:
+    """
+    Shape a list of objects in place.
+
+    Args:
+        objects: The objects, as decoded from NetBox
+        keep: Fields never dropped, typically those the agent explicitly asked for
+
+    Returns:
+        What was removed
+    """
+    stats = ShapeStats()
+    for obj in objects:
+        if isinstance(obj, dict):
+            shape_object(obj, stats, keep)
+    return stats
@@ -0,0 +1,136 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+When several callers ask for the same key at the same time, only the first one (the
+leader) performs the request; the others wait for it and receive the same result. Thread
+and asyncio variants are provided for the sync and async NetBox clients.
+
+The shared request runs with the leader's context, so it may fail for reasons that only
+concern the leader (its tool call was cancelled, or ran out of retry budget). Such errors
+are listed in ``retry_on``: the followers do not receive them, but try again themselves.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group for blocking calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        retry_on: tuple[type[BaseException], ...] = (),
+    ) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight, then share its result.
+
+        Args:
+            key: Canonical request key
+            fn: Zero-argument callable performing the request
+            retry_on: Errors of the leader's call that are not shared; a follower receiving
+                      one calls again, as the new leader unless another caller got there first
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            Exception: Whatever the leader's call raised
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                break
+            call.done.wait()
+            if isinstance(call.error, retry_on):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Single-flight group for coroutines running on one event loop."""
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        retry_on: tuple[type[BaseException], ...] = (),
+    ) -> Any:
+        """
+        Await ``fn()`` unless a call with the same key is already in flight, then share it.
+
+        The shared call runs as its own task, so a caller being cancelled does not cancel
+        the request for the other callers.
+
+        Args:
+            key: Canonical request key
+            fn: Zero-argument coroutine function performing the request
+            retry_on: Errors of the shared call that only concern the caller that started it;
+                      other callers receiving one call again
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        while True:
+            task = self._calls.get(key)
+            leader = task is None
+            if leader:
+                task = asyncio.ensure_future(fn())
+                self._calls[key] = task
+                task.add_done_callback(lambda done: self._forget(key, done))
+            else:
+                self.coalesced += 1
+            try:
+                return await asyncio.shield(task)
+            except retry_on:
+                if leader:
+                    raise
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        """Remove a finished call so later requests go to NetBox again."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -0,0 +1,130 @@
+"""
+Compact CSV/TSV rendering of list results.
+
+JSON repeats every key in every row; a table names each column once. Nested objects are
+flattened to their display name (or name, value or id), choice fields to their value and
+lists to their elements joined with ';'. The response's metadata (count, next, ...) is
+kept in a '#' header line above the table.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Literal
+
+OutputFormat = Literal["json", "csv", "tsv"]
+
+DELIMITERS = {"csv": ",", "tsv": "\t"}
+
+
+def flatten_value(value: Any) -> str:
+    """
+    Flatten a field value to a single table cell.
+
+    Args:
+        value: A value of a NetBox object's field
+
+    Returns:
+        The cell text ('' for null)
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, dict):
+        # Choice fields carry value/label, related objects display/name/id
+        for key in ("value", "display", "name", "id"):
+            if key in value and not isinstance(value[key], dict | list):
+                return flatten_value(value[key])
+        return json.dumps(value, separators=(",", ":"), default=str)
+    if isinstance(value, list):
+        return ";".join(flatten_value(item) for item in value)
+    return str(value)
+
+
+def render_table(rows: list[dict[str, Any]], output_format: OutputFormat) -> str:
+    """
+    Render objects as a CSV or TSV table with a header row.
+
+    Columns appear in the order they are first seen across the rows.
+
+    Args:
+        rows: The objects
+        output_format: 'csv' or 'tsv'
+
+    Returns:
+        The table text, one line per object
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=DELIMITERS[output_format], lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        cells = [flatten_value(row.get(column)) for column in columns]
+        if output_format == "tsv":
+            # TSV has no quoting; keep every object on one line
+            cells = [
+                " ".join(cell.split()) if "\t" in cell or "\n" in cell else cell for cell in cells
+            ]
+        writer.writerow(cells)
+    return buffer.getvalue()
+
+
+def render_header(metadata: dict[str, Any]) -> str:
+    """Render response metadata as a '#' comment line, e.g. '# count=57 next=null'."""
+    items = " ".join(
+        f"{key}={json.dumps(value, separators=(',', ':')) if not isinstance(value, str) else value}"
+        for key, value in metadata.items()
+    )
+    return f"# {items}\n"
+
+
+def render_page(response: dict[str, Any], output_format: OutputFormat) -> str:
+    """
+    Render a paginated list response (count, next, ..., results) as a table.
+
+    Args:
+        response: The response dict
+        output_format: 'csv' or 'tsv'
+
+    Returns:
+        A '#' header line with every key besides results, followed by the table
+    """
+    metadata = {key: value for key, value in response.items() if key != "results"}
+    return render_header(metadata) + render_table(response.get("results", []), output_format)
+
+
+def render_search(results: dict[str, Any], output_format: OutputFormat) -> str:
+    """
+    Render netbox_search_objects results as tables.
+
+    Per-type results become one section per object type, each starting with a
+    '# <object_type> count=<n>' line. Ranked results become a single table with the
+    object_type and match of every hit in front of the object's fields.
+
+    Args:
+        results: The search results
+        output_format: 'csv' or 'tsv'
+
+    Returns:
+        The rendered sections
+    """
+    if isinstance(results.get("results"), list):
+        metadata = {key: value for key, value in results.items() if key != "results"}
+        rows = [
+            {"object_type": hit["object_type"], "match": hit["match"], **hit["object"]}
+            for hit in results["results"]
+        ]
+        return render_header(metadata) + render_table(rows, output_format)
+
+    sections = []
+    if results.get("timed_out"):
+        sections.append(render_header({"timed_out": results["timed_out"]}))
+    for object_type, rows in results.items():
+        if object_type == "timed_out":
+            continue
+        section = f"# {object_type} count={len(rows)}\n"
+        if rows:
+            section += render_table(rows, output_format)
+        sections.append(section)
+    return "".join(sections)
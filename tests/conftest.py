@@ -0,0 +1,123 @@
+"""Shared fixtures: an in-memory fake NetBox serving the list queries the tools make."""
+
+import copy
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from netbox_mcp_server import server
+from netbox_mcp_server.joins import JoinPlanner
+
+# Parameters that shape the response rather than filter it
+CONTROL_PARAMS = frozenset({"limit", "offset", "fields", "ordering", "exclude", "brief"})
+
+
+def _value(value: Any) -> Any:
+    """Reduce a choice ({value, label}) or related object to what filters compare."""
+    if isinstance(value, dict):
+        return value.get("value", value.get("id"))
+    return value
+
+
+def _matches(actual: Any, lookup: str, wanted: list[Any]) -> bool:
+    """Tell whether a field value passes a filter with the given lookup suffix."""
+    actual = _value(actual)
+    if lookup == "ic":
+        return str(wanted[0]).lower() in str(actual).lower()
+    if lookup in ("lte", "gte"):
+        if actual is None:
+            return False
+        return actual <= wanted[0] if lookup == "lte" else actual >= wanted[0]
+    return str(actual) in {str(w) for w in wanted}
+
+
+class FakeNetBox:
+    """
+    Serve list and single-object GETs over in-memory tables, the way NetBox does.
+
+    Supports equality and ID-list filters (choices compare by value, related objects by
+    ID), the ic/lte/gte lookups, q (name contains), ordering by one field, limit/offset
+    pagination capped at max_page_size, and fields projection. Endpoints without a table
+    are empty. Like a decoded response, every result is a fresh copy of its row.
+    """
+
+    def __init__(self, tables: dict[str, list[dict[str, Any]]], max_page_size: int = 1000):
+        self.tables = tables
+        self.max_page_size = max_page_size
+
+    def get(
+        self,
+        endpoint: str,
+        id: int | None = None,
+        params: dict[str, Any] | None = None,
+        fallback_endpoint: str | None = None,
+    ) -> dict[str, Any]:
+        params = params or {}
+        head, _, tail = endpoint.rpartition("/")
+        if id is None and tail.isdigit():
+            endpoint, id = head, int(tail)
+        rows = self.tables.get(endpoint, [])
+        if id is not None:
+            for row in rows:
+                if row["id"] == id:
+                    return self._project(row, params)
+            raise requests.HTTPError(f"404 Not Found: {endpoint}/{id}/")
+
+        for name, value in params.items():
+            if name in CONTROL_PARAMS or value is None:
+                continue
+            if name == "q":
+                rows = [row for row in rows if str(value).lower() in str(row.get("name")).lower()]
+                continue
+            field, _, lookup = name.partition("__")
+            wanted = value if isinstance(value, list) else [value]
+            rows = [row for row in rows if _matches(row.get(field), lookup, wanted)]
+
+        ordering = params.get("ordering")
+        if ordering:
+            field = ordering.lstrip("-")
+            rows = sorted(
+                rows, key=lambda row: _value(row.get(field)), reverse=ordering.startswith("-")
+            )
+        offset = params.get("offset", 0)
+        limit = min(params.get("limit", 50), self.max_page_size)
+        page = rows[offset : offset + limit]
+        return {
+            "count": len(rows),
+            "next": "more" if offset + limit < len(rows) else None,
+            "previous": None,
+            "results": [self._project(row, params) for row in page],
+        }
+
+    @staticmethod
+    def _project(row: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+        """Copy a row, applying the fields projection."""
+        if not params.get("fields"):
+            return copy.deepcopy(row)
+        return {field: copy.deepcopy(row.get(field)) for field in params["fields"].split(",")}
+
+
+@pytest.fixture
+def netbox_tables() -> dict[str, list[dict[str, Any]]]:
+    """Tables the fake NetBox serves, per endpoint; override in a test module."""
+    return {}
+
+
+@pytest.fixture
+def fake_netbox(netbox_tables) -> FakeNetBox:
+    """A fake NetBox serving the test module's tables."""
+    return FakeNetBox(netbox_tables)
+
+
+@pytest.fixture
+def mock_netbox(fake_netbox):
+    """Point the tools at the fake NetBox, with fresh join and count caches."""
+    with (
+        patch("netbox_mcp_server.server.netbox") as mock_netbox,
+        patch.object(server, "join_planner", JoinPlanner(server._netbox_get)),
+        patch.object(server, "count_cache", None),
+    ):
+        mock_netbox.get.side_effect = fake_netbox.get
+        yield mock_netbox
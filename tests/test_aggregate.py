@@ -0,0 +1,177 @@
+"""Tests for server-side aggregation."""
+
+import asyncio
+
+import pytest
+
+from netbox_mcp_server.aggregation import Aggregator, Metric, parse_metric
+from netbox_mcp_server.server import netbox_aggregate
+
+# 2500 VMs over 3 clusters; every 10th VM is offline
+VMS = [
+    {
+        "id": id,
+        "name": f"vm-{id}",
+        "cluster": {"id": id % 3 + 1, "name": f"cluster-{id % 3 + 1}"},
+        "status": {"value": "offline" if id % 10 == 0 else "active", "label": "..."},
+        "vcpus": id % 4 + 1,
+        "memory": id,
+        "tags": [{"name": "prod"}] if id % 2 else [],
+    }
+    for id in range(1, 2501)
+]
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve VMS."""
+    return {"virtualization/virtual-machines": VMS}
+
+
+# ============================================================================
+# Aggregator
+# ============================================================================
+
+
+def test_parse_metric():
+    """Metric specs should parse into an operation and a field path."""
+    assert parse_metric("count") == Metric("count", None)
+    assert parse_metric("sum:vcpus").label == "sum:vcpus"
+    assert parse_metric("distinct:site.name") == Metric("distinct", "site.name")
+    with pytest.raises(ValueError, match="Unknown metric"):
+        parse_metric("median:vcpus")
+    with pytest.raises(ValueError, match="needs a field"):
+        parse_metric("sum")
+
+
+def test_aggregator_groups_and_metrics():
+    """Groups should reduce related objects and choices to scalars."""
+    metrics = [
+        parse_metric(m) for m in ("count", "sum:vcpus", "avg:vcpus", "min:name", "max:vcpus")
+    ]
+    aggregator = Aggregator(["site", "status"], [*metrics, parse_metric("distinct:rack")])
+    aggregator.add(
+        [
+            {
+                "site": {"name": "A"},
+                "status": {"value": "active"},
+                "vcpus": 2,
+                "name": "b",
+                "rack": 1,
+            },
+            {
+                "site": {"name": "A"},
+                "status": {"value": "active"},
+                "vcpus": 4,
+                "name": "a",
+                "rack": 1,
+            },
+            {"site": {"name": "B"}, "status": {"value": "active"}, "vcpus": None, "name": "c"},
+        ]
+    )
+
+    rows, truncated = aggregator.rows(max_rows=10)
+
+    assert not truncated
+    assert rows == [
+        {
+            "site": "A",
+            "status": "active",
+            "count": 2,
+            "sum:vcpus": 6,
+            "avg:vcpus": 3.0,
+            "min:name": "a",
+            "max:vcpus": 4,
+            "distinct:rack": 1,
+        },
+        {
+            "site": "B",
+            "status": "active",
+            "count": 1,
+            "sum:vcpus": 0,
+            "avg:vcpus": None,
+            "min:name": "c",
+            "max:vcpus": None,
+            "distinct:rack": 0,
+        },
+    ]
+    assert aggregator.totals()["count"] == 3
+    assert aggregator.rows(max_rows=1)[1]
+
+
+# ============================================================================
+# Tool
+# ============================================================================
+
+
+def test_aggregate_group_by(mock_netbox):
+    """Objects should be streamed with minimal fields and aggregated per group."""
+    result = asyncio.run(
+        netbox_aggregate.fn(
+            object_type="virtualization.virtualmachine",
+            filters={},
+            group_by=["cluster", "status"],
+            metrics=["count", "sum:vcpus", "max:memory"],
+        )
+    )
+
+    assert result["objects_matched"] == result["objects_scanned"] == 2500
+    assert not result["partial"]
+    assert result["groups"] == 6
+    assert result["totals"] == {
+        "count": 2500,
+        "sum:vcpus": sum(vm["vcpus"] for vm in VMS),
+        "max:memory": 2500,
+    }
+    assert [row["status"] for row in result["rows"]] == ["active"] * 3 + ["offline"] * 3
+    row = next(r for r in result["rows"] if r["cluster"] == "cluster-2" and r["status"] == "active")
+    expected = [vm for vm in VMS if vm["cluster"]["id"] == 2 and vm["id"] % 10]
+    assert row["count"] == len(expected)
+    assert row["sum:vcpus"] == sum(vm["vcpus"] for vm in expected)
+    fields = {c[1]["params"]["fields"] for c in mock_netbox.get.call_args_list}
+    assert fields == {"cluster,memory,status,vcpus"}
+
+
+def test_aggregate_partial_and_truncated(mock_netbox):
+    """Row and object caps should be reported."""
+    result = asyncio.run(
+        netbox_aggregate.fn(
+            object_type="virtualization.virtualmachine",
+            filters={"status": "active"},
+            group_by=["name"],
+            max_rows=5,
+            max_objects=1500,
+        )
+    )
+
+    assert result["objects_matched"] == 2250
+    assert result["objects_scanned"] == 1500
+    assert result["partial"]
+    assert result["truncated"]
+    assert len(result["rows"]) == 5
+    assert result["groups"] == 1500
+
+
+def test_aggregate_count_only_uses_count_query(mock_netbox):
+    """A plain count should not stream any objects."""
+    result = asyncio.run(
+        netbox_aggregate.fn(object_type="virtualization.virtualmachine", filters={})
+    )
+
+    assert result["rows"] == [{"count": 2500}]
+    assert mock_netbox.get.call_count == 1
+    assert mock_netbox.get.call_args[1]["params"]["limit"] == 1
+
+
+def test_aggregate_without_grouping(mock_netbox):
+    """Metrics without group_by should give a single row."""
+    result = asyncio.run(
+        netbox_aggregate.fn(
+            object_type="virtualization.virtualmachine",
+            filters={},
+            metrics=["distinct:tags", "min:vcpus"],
+        )
+    )
+
+    assert result["rows"] == [{"distinct:tags": 2, "min:vcpus": 1}]
+    assert "totals" not in result
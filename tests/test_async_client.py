@@ -0,0 +1,180 @@
+"""Tests for the httpx-based NetBoxAsyncClient and its wiring into the MCP tools."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from netbox_mcp_server.config import Settings
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxClientBase
+from netbox_mcp_server.server import netbox_get_objects, netbox_search_objects
+
+
+def make_client(handler) -> NetBoxAsyncClient:
+    """Create an async client whose requests are served by ``handler``."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com/", token="test-token")
+    client.client = httpx.AsyncClient(
+        headers=client.client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+# ============================================================================
+# Client Construction
+# ============================================================================
+
+
+def test_async_client_implements_base_interface():
+    """NetBoxAsyncClient should be a concrete NetBoxClientBase."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+
+    assert isinstance(client, NetBoxClientBase)
+    assert client.api_url == "https://netbox.example.com/api"
+    assert client.client.headers["Authorization"] == "Token test-token"
+
+
+def test_async_client_pool_limits_configurable():
+    """Connection pool limits should be passed through to httpx."""
+    with patch("netbox_mcp_server.netbox_client.httpx.AsyncClient") as mock_async_client:
+        NetBoxAsyncClient(
+            url="https://netbox.example.com",
+            token="test-token",
+            http2=False,
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=1.5,
+        )
+
+    kwargs = mock_async_client.call_args[1]
+    assert kwargs["http2"] is False
+    assert kwargs["limits"].max_connections == 7
+    assert kwargs["limits"].max_keepalive_connections == 3
+    assert kwargs["limits"].keepalive_expiry == 1.5
+
+
+def test_async_probe_has_explicit_timeout():
+    """The startup probe should not wait on an unresponsive NetBox indefinitely."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"netbox-version": "4.4.0"})
+
+    client = make_client(handler)
+    client.timeout = 2.5
+
+    assert asyncio.run(client.probe())["netbox_version"] == "4.4.0"
+    assert timeouts == [{"connect": 2.5, "read": 2.5, "write": 2.5, "pool": 2.5}]
+
+
+# ============================================================================
+# CRUD Operations
+# ============================================================================
+
+
+def test_async_get_passes_params():
+    """GET should hit the list endpoint with query params and return decoded JSON."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"count": 1, "results": [{"id": 1}]})
+
+    client = make_client(handler)
+    result = asyncio.run(client.get("dcim/sites", params={"limit": 5, "name__ic": "nyc"}))
+
+    assert result == {"count": 1, "results": [{"id": 1}]}
+    assert seen[0].url.path == "/api/dcim/sites/"
+    assert seen[0].url.params["name__ic"] == "nyc"
+
+
+def test_async_get_falls_back_on_404():
+    """GET should retry the fallback endpoint when the primary returns 404."""
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if "core" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"id": 3})
+
+    client = make_client(handler)
+    result = asyncio.run(
+        client.get("core/object-types", id=3, fallback_endpoint="extras/object-types")
+    )
+
+    assert result == {"id": 3}
+    assert paths == ["/api/core/object-types/3/", "/api/extras/object-types/3/"]
+
+
+def test_async_get_raises_on_error():
+    """Non-404 errors should propagate as httpx.HTTPStatusError."""
+    client = make_client(lambda request: httpx.Response(500))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("dcim/sites", fallback_endpoint="dcim/other"))
+
+
+def test_async_bulk_delete_sends_ids_in_body():
+    """bulk_delete should send a DELETE with the list of IDs as JSON body."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(204)
+
+    client = make_client(handler)
+    assert asyncio.run(client.bulk_delete("dcim/sites", [1, 2])) is True
+    assert seen[0].method == "DELETE"
+    assert seen[0].url.path == "/api/dcim/sites/bulk/"
+    assert json.loads(seen[0].content) == [{"id": 1}, {"id": 2}]
+
+
+# ============================================================================
+# Settings and Tool Integration
+# ============================================================================
+
+
+def test_settings_select_async_client():
+    """Settings should expose the client choice and pool tuning fields."""
+    settings = Settings(
+        netbox_url="https://netbox.example.com/",
+        netbox_token="test-token",
+        netbox_client="async",
+        max_connections=50,
+    )
+
+    assert settings.netbox_client == "async"
+    assert settings.http2 is True
+    assert settings.get_effective_config_summary()["max_connections"] == 50
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_tools_await_async_client(mock_netbox):
+    """Tools should await results when the configured client is asynchronous."""
+    mock_netbox.get = AsyncMock(return_value={"count": 1, "results": [{"id": 1, "name": "s1"}]})
+
+    page = asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}))
+    search = asyncio.run(netbox_search_objects.fn(query="s1", object_types=["dcim.site"]))
+
+    assert page["results"] == [{"id": 1, "name": "s1"}]
+    assert search == {"dcim.site": [{"id": 1, "name": "s1"}]}
+
+
+def test_search_without_fields_sends_no_fields_param():
+    """A search without a projection should not send an empty fields= to NetBox."""
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.query.decode())
+        return httpx.Response(200, json={"count": 0, "next": None, "results": []})
+
+    with patch("netbox_mcp_server.server.netbox", make_client(handler)):
+        asyncio.run(netbox_search_objects.fn(query="sw", object_types=["dcim.site"], route=False))
+        asyncio.run(make_client(handler).get("dcim/sites", params={"q": "a", "fields": None}))
+
+    assert queries
+    assert all("fields" not in query for query in queries)
@@ -1,5 +1,6 @@
 """Tests for brief parameter validation and behavior."""
 
+import asyncio
 from unittest.mock import patch
 
 from netbox_mcp_server.server import netbox_get_object_by_id, netbox_get_objects
@@ -15,7 +16,7 @@ def test_brief_false_omits_parameter_get_objects(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, brief=False)
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, brief=False))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -34,7 +35,7 @@ def test_brief_default_omits_parameter_get_objects(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={})
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -53,7 +54,7 @@ def test_brief_true_includes_parameter_get_objects(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, brief=True)
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, brief=True))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -69,7 +70,7 @@ def test_brief_false_omits_parameter_get_by_id(mock_netbox):
     """
     mock_netbox.get.return_value = {"id": 1, "name": "Test Site"}
 
-    netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1, brief=False)
+    asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1, brief=False))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -83,7 +84,7 @@ def test_brief_default_omits_parameter_get_by_id(mock_netbox):
     """When brief not specified (uses default False), should not include brief in API params."""
     mock_netbox.get.return_value = {"id": 1, "name": "Test Site"}
 
-    netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1)
+    asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -100,7 +101,7 @@ def test_brief_true_includes_parameter_get_by_id(mock_netbox):
         "url": "http://example.com/api/dcim/sites/1/",
     }
 
-    netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1, brief=True)
+    asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1, brief=True))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
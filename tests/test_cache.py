@@ -0,0 +1,170 @@
+"""Tests for the GET response cache and its integration with NetBoxRestClient."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from netbox_mcp_server.cache import ResponseCache, make_cache_key
+from netbox_mcp_server.netbox_client import NetBoxRestClient
+
+
+def make_response(body: bytes, status_code: int = 200) -> MagicMock:
+    """Create a mock requests.Response carrying a JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = body
+    response.json.side_effect = lambda: json.loads(body)
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a test client with caching enabled."""
+    return NetBoxRestClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        cache=ResponseCache(max_bytes=1024),
+    )
+
+
+# ============================================================================
+# Cache Keys
+# ============================================================================
+
+
+def test_cache_key_is_order_independent():
+    """Equivalent params in a different order should share a key."""
+    assert make_cache_key("dcim/sites", params={"a": 1, "b": [1, 2]}) == make_cache_key(
+        "/dcim/sites/", params={"b": [1, 2], "a": 1}
+    )
+
+
+def test_cache_key_ignores_none_params():
+    """None-valued params are never sent, so they must not change the key."""
+    assert make_cache_key("dcim/sites", params={"fields": None}) == make_cache_key("dcim/sites")
+
+
+def test_cache_key_includes_id():
+    """Lookups by ID should not collide with list queries."""
+    assert make_cache_key("dcim/sites", id=1) != make_cache_key("dcim/sites")
+    assert make_cache_key("dcim/sites", id=1) == make_cache_key("dcim/sites/1")
+
+
+# ============================================================================
+# TTL and Eviction
+# ============================================================================
+
+
+def test_per_type_ttls():
+    """Reference types should live longer than volatile types."""
+    cache = ResponseCache(default_ttl=30)
+
+    assert cache.ttl_for("dcim/manufacturers") > cache.ttl_for("ipam/ip-addresses")
+    assert cache.ttl_for("dcim/manufacturers/4") == cache.ttl_for("dcim/manufacturers")
+    assert cache.ttl_for("dcim/cables") == 30
+
+
+def test_expired_entries_are_misses():
+    """Entries past their TTL should not be returned."""
+    cache = ResponseCache(ttls={"dcim.site": 10})
+
+    with patch("netbox_mcp_server.cache.time.monotonic", return_value=100.0):
+        cache.set("k", "dcim/sites", b"{}")
+    with patch("netbox_mcp_server.cache.time.monotonic", return_value=105.0):
+        assert cache.get("k") == b"{}"
+    with patch("netbox_mcp_server.cache.time.monotonic", return_value=111.0):
+        assert cache.get("k") is None
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bytes"] == 0
+
+
+def test_lru_eviction_by_size():
+    """The least recently used entries should be evicted once max_bytes is exceeded."""
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", "dcim/sites", b"aaaa")
+    cache.set("b", "dcim/sites", b"bbbb")
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", "dcim/sites", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_oversized_body_not_cached():
+    """A body larger than the whole cache should be skipped, not evict everything."""
+    cache = ResponseCache(max_bytes=4)
+    cache.set("a", "dcim/sites", b"aa")
+    cache.set("big", "dcim/sites", b"x" * 10)
+
+    assert cache.get("a") == b"aa"
+    assert cache.get("big") is None
+
+
+# ============================================================================
+# Client Integration
+# ============================================================================
+
+
+def test_repeated_get_served_from_cache(client):
+    """A repeated identical GET should not hit NetBox again."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = make_response(b'{"count": 1, "results": [{"id": 1}]}')
+
+        first = client.get("dcim/sites", params={"limit": 5})
+        second = client.get("dcim/sites", params={"limit": 5})
+
+    assert mock_get.call_count == 1
+    assert first == second == {"count": 1, "results": [{"id": 1}]}
+    assert first is not second  # callers get independent copies
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_errors_are_not_cached(client):
+    """Failed responses should not be stored."""
+    error = make_response(b"{}", status_code=500)
+    error.raise_for_status.side_effect = requests.HTTPError("Server error")
+
+    with (
+        patch.object(client.session, "get", return_value=error),
+        pytest.raises(requests.HTTPError),
+    ):
+        client.get("dcim/sites")
+
+    assert client.cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [
+        ("create", ({"name": "x"},)),
+        ("update", (1, {"name": "x"})),
+        ("delete", (1,)),
+        ("bulk_create", ([{"name": "x"}],)),
+        ("bulk_update", ([{"id": 1, "name": "x"}],)),
+        ("bulk_delete", ([1],)),
+    ],
+)
+def test_writes_invalidate_endpoint(client, method, args):
+    """The client's own writes should drop cached reads of the same endpoint."""
+    client.cache.set(make_cache_key("dcim/sites"), "dcim/sites", b"{}")
+    client.cache.set(make_cache_key("dcim/sites", id=1), "dcim/sites/1", b"{}")
+    client.cache.set(make_cache_key("dcim/devices"), "dcim/devices", b"{}")
+
+    write_response = make_response(b"{}", status_code=204)
+    with (
+        patch.object(client.session, "post", return_value=write_response),
+        patch.object(client.session, "patch", return_value=write_response),
+        patch.object(client.session, "delete", return_value=write_response),
+    ):
+        getattr(client, method)("dcim/sites", *args)
+
+    assert client.cache.get(make_cache_key("dcim/sites")) is None
+    assert client.cache.get(make_cache_key("dcim/sites", id=1)) is None
+    assert client.cache.get(make_cache_key("dcim/devices")) == b"{}"
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
-from netbox_mcp_server.netbox_client import NetBoxRestClient
+from netbox_mcp_server.netbox_client import NetBoxRestClient, parse_version
 
 
 @pytest.fixture
@@ -296,3 +296,97 @@ def test_fallback_builds_correct_url(client):
 
         fallback_url = mock_get.call_args_list[1][0][0]
         assert fallback_url == "https://netbox.example.com/api/extras/object-types/"
+
+
+# ============================================================================
+# Endpoint Resolution Memory
+# ============================================================================
+
+
+def test_fallback_learned_after_first_404(client):
+    """After falling back once, later calls should go straight to the fallback endpoint."""
+    primary_response = MagicMock()
+    primary_response.status_code = 404
+
+    fallback_response = MagicMock()
+    fallback_response.status_code = 200
+    fallback_response.json.return_value = {"id": 7}
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = [primary_response, fallback_response, fallback_response]
+
+        client.get(
+            "core/object-types", params={"limit": 5}, fallback_endpoint="extras/object-types"
+        )
+        client.get("core/object-types/7", fallback_endpoint="extras/object-types/7")
+
+        assert mock_get.call_count == 3
+        assert mock_get.call_args_list[2][0][0] == (
+            "https://netbox.example.com/api/extras/object-types/7/"
+        )
+
+    assert client.endpoints.snapshot()["resolved"] == {"core/object-types": "extras/object-types"}
+
+
+def test_primary_learned_skips_fallback_on_missing_object(client):
+    """Once the primary endpoint is known good, a 404 means the object is missing."""
+    ok_response = MagicMock()
+    ok_response.status_code = 200
+    ok_response.json.return_value = {"count": 0, "results": []}
+
+    missing_response = MagicMock()
+    missing_response.status_code = 404
+    missing_response.raise_for_status.side_effect = requests.HTTPError("Not found")
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = [ok_response, missing_response]
+
+        client.get("core/object-types", fallback_endpoint="extras/object-types")
+        with pytest.raises(requests.HTTPError):
+            client.get("core/object-types/999", fallback_endpoint="extras/object-types/999")
+
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("4.3.7-Docker-3.3.0", "extras/object-types"),
+        ("4.4.0", "core/object-types"),
+        ("v4.5.1", "core/object-types"),
+    ],
+)
+def test_probe_resolves_endpoints_from_version(client, version, expected):
+    """The /api/status/ probe should resolve fallback-capable types up front."""
+    status_response = MagicMock()
+    status_response.status_code = 200
+    status_response.json.return_value = {"netbox-version": version}
+
+    with patch.object(client.session, "get", return_value=status_response) as mock_get:
+        result = client.probe()
+
+    assert mock_get.call_args[0][0] == "https://netbox.example.com/api/status/"
+    assert mock_get.call_args.kwargs["timeout"] == client.timeout
+    assert result == {"netbox_version": version, "resolved": {"core/object-types": expected}}
+
+
+def test_probe_result_used_for_single_request(client):
+    """After probing an old NetBox, a fallback-capable type should cost one request."""
+    client.endpoints.apply_version("4.2.0")
+
+    fallback_response = MagicMock()
+    fallback_response.status_code = 200
+    fallback_response.json.return_value = {"results": []}
+
+    with patch.object(client.session, "get", return_value=fallback_response) as mock_get:
+        client.get("core/object-types", fallback_endpoint="extras/object-types")
+
+    assert mock_get.call_count == 1
+    assert "extras/object-types" in mock_get.call_args[0][0]
+
+
+def test_parse_version():
+    """Version strings from /api/status/ should parse to comparable tuples."""
+    assert parse_version("4.3.7-Docker-3.3.0") == (4, 3, 7)
+    assert parse_version("v4.4") == (4, 4)
+    assert parse_version("unknown") == ()
@@ -0,0 +1,86 @@
+"""Tests for the batched netbox_count_objects tool."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server import server
+from netbox_mcp_server.cache import ResponseCache
+from netbox_mcp_server.server import CountQuery, netbox_count_objects
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve 120 devices (half of them spines), 4000 IP addresses and 7 VLANs."""
+    return {
+        "dcim/devices": [{"id": id, "role": "spine" if id % 2 else "leaf"} for id in range(1, 121)],
+        "ipam/ip-addresses": [{"id": id} for id in range(1, 4001)],
+        "ipam/vlans": [{"id": id, "vid": 100 + id} for id in range(1, 8)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def count_cache(mock_netbox):
+    """Give each test an empty count cache."""
+    with patch.object(server, "count_cache", ResponseCache(default_ttl=30, ttls={})):
+        yield
+
+
+def test_counts_in_order_with_minimal_requests(mock_netbox):
+    """Each query should be counted with a limit=1, brief request."""
+    result = asyncio.run(
+        netbox_count_objects.fn(
+            queries=[
+                CountQuery(object_type="dcim.device", filters={"role": "spine"}),
+                CountQuery(object_type="ipam.ipaddress"),
+                CountQuery(object_type="ipam.vlan", filters={}),
+            ]
+        )
+    )
+
+    assert result == [
+        {"object_type": "dcim.device", "count": 60},
+        {"object_type": "ipam.ipaddress", "count": 4000},
+        {"object_type": "ipam.vlan", "count": 7},
+    ]
+    for call in mock_netbox.get.call_args_list:
+        assert call[1]["params"]["limit"] == 1
+        assert call[1]["params"]["brief"] == "1"
+
+
+def test_counts_are_cached(mock_netbox):
+    """Repeated counts should be served from the count cache."""
+    queries = [CountQuery(object_type="ipam.vlan", filters={"vid__gte": 100})]
+
+    asyncio.run(netbox_count_objects.fn(queries=queries))
+    asyncio.run(netbox_count_objects.fn(queries=queries))
+
+    assert mock_netbox.get.call_count == 1
+
+
+def test_failed_query_does_not_fail_the_batch(mock_netbox):
+    """Invalid queries should report an error next to the other counts."""
+    result = asyncio.run(
+        netbox_count_objects.fn(
+            queries=[
+                CountQuery(object_type="dcim.nothing"),
+                CountQuery(object_type="dcim.device", filters={"name__bogus": "x"}),
+                CountQuery(object_type="ipam.vlan"),
+            ]
+        )
+    )
+
+    assert result[0]["count"] is None
+    assert "Invalid object_type" in result[0]["error"]
+    assert "Invalid filter 'name__bogus'" in result[1]["error"]
+    assert result[2] == {"object_type": "ipam.vlan", "count": 7}
+
+
+def test_schema_accepts_plain_dicts(mock_netbox):
+    """MCP clients send queries as plain JSON objects."""
+    result = asyncio.run(
+        netbox_count_objects.run({"queries": [{"object_type": "ipam.vlan", "filters": {}}]})
+    )
+
+    assert result.structured_content == {"result": [{"object_type": "ipam.vlan", "count": 7}]}
@@ -0,0 +1,137 @@
+"""Tests for keyset (id-cursor) pagination in netbox_get_objects."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.server import netbox_get_objects
+
+
+def page(ids: list[int], has_next: bool, count: int = 100) -> dict:
+    """Build a NetBox paginated response for the given object IDs."""
+    return {
+        "count": count,
+        "next": "https://netbox.example.com/api/dcim/devices/?limit=2&offset=2"
+        if has_next
+        else None,
+        "previous": None,
+        "results": [{"id": i, "name": f"dev{i}"} for i in ids],
+    }
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_first_cursor_page_orders_by_id(mock_netbox):
+    """The first cursor page should order by id without offset and return next_cursor."""
+    mock_netbox.get.return_value = page([3, 7], has_next=True)
+
+    result = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters={"site_id": 1}, limit=2, pagination="cursor"
+        )
+    )
+
+    params = mock_netbox.get.call_args[1]["params"]
+    assert params["ordering"] == "id"
+    assert "offset" not in params
+    assert "id__gt" not in params
+    assert result["results"] == [{"id": 3, "name": "dev3"}, {"id": 7, "name": "dev7"}]
+    assert result["next_cursor"]
+    assert "next" not in result
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_continues_with_id_gt(mock_netbox):
+    """Passing next_cursor back should fetch rows after the last seen id."""
+    mock_netbox.get.return_value = page([3, 7], has_next=True)
+    first = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters={"site_id": 1}, limit=2, pagination="cursor"
+        )
+    )
+
+    mock_netbox.get.return_value = page([9], has_next=False, count=1)
+    second = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device",
+            filters={"site_id": 1},
+            limit=2,
+            cursor=first["next_cursor"],
+        )
+    )
+
+    params = mock_netbox.get.call_args[1]["params"]
+    assert params["id__gt"] == 7
+    assert params["site_id"] == 1
+    assert second["next_cursor"] is None
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_adds_id_to_fields(mock_netbox):
+    """Field projection without id should still return ids for the cursor."""
+    mock_netbox.get.return_value = page([1], has_next=False)
+
+    asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters={}, fields=["name"], pagination="cursor"
+        )
+    )
+
+    assert mock_netbox.get.call_args[1]["params"]["fields"] == "name,id"
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_works_with_brief(mock_netbox):
+    """brief should still be passed through in cursor mode."""
+    mock_netbox.get.return_value = page([1], has_next=False)
+
+    asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters={}, brief=True, pagination="cursor"
+        )
+    )
+
+    assert mock_netbox.get.call_args[1]["params"]["brief"] == "1"
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_rejects_other_filters(mock_netbox):
+    """A cursor should only be valid for the query that issued it."""
+    mock_netbox.get.return_value = page([3, 7], has_next=True)
+    first = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters={"site_id": 1}, pagination="cursor"
+        )
+    )
+
+    with pytest.raises(ValueError, match="different object_type or filters"):
+        asyncio.run(
+            netbox_get_objects.fn(
+                object_type="dcim.device", filters={"site_id": 2}, cursor=first["next_cursor"]
+            )
+        )
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_rejects_garbage(mock_netbox):
+    """Malformed cursors should raise a helpful ValueError."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters={}, cursor="%%%"))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"offset": 10}, "offset cannot be combined"),
+        ({"ordering": "-name"}, "always orders by id"),
+    ],
+)
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_incompatible_options(mock_netbox, kwargs, message):
+    """offset and non-id ordering make no sense with keyset pagination."""
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(
+            netbox_get_objects.fn(
+                object_type="dcim.device", filters={}, pagination="cursor", **kwargs
+            )
+        )
@@ -0,0 +1,167 @@
+"""Tests for interning and normalizing the related objects embedded in NetBox objects."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.entities import Interner, normalize_objects
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+from netbox_mcp_server.server import netbox_get_objects
+
+SITES = {1: "DC 1", 2: "DC 2"}
+
+
+def device(id: int) -> dict:
+    """Build a device whose site, role and tags repeat across devices."""
+    site = id % 2 + 1
+    return {
+        "id": id,
+        "name": f"sw-{id:02d}",
+        "site": {"id": site, "url": f"https://x/api/dcim/sites/{site}/", "name": SITES[site]},
+        "role": {"id": 4, "url": "https://x/api/dcim/device-roles/4/", "name": "leaf"},
+        "status": {"value": "active", "label": "Active"},
+        "tags": [{"id": 9, "name": "prod"}],
+        "primary_ip4": None,
+    }
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve 20 devices."""
+    return {"dcim/devices": [device(id) for id in range(1, 21)]}
+
+
+# ============================================================================
+# Interning
+# ============================================================================
+
+
+def test_interner_shares_equal_nested_dicts():
+    """Equal nested dicts should be replaced by one shared copy."""
+    interner = Interner()
+    a, b = interner.intern(device(1)), interner.intern(device(3))
+
+    assert a["site"] is b["site"]
+    assert a["status"] is b["status"]
+    assert a["tags"][0] is b["tags"][0]
+    # Lists belong to their object
+    assert a["tags"] is not b["tags"]
+    assert interner.intern(device(2))["site"] is not a["site"]
+    assert a == device(1)
+
+
+def test_interner_compares_content_exactly():
+    """Values that are equal in Python but not in JSON should not be conflated."""
+    interner = Interner()
+    a = interner.intern({"id": 1, "x": {"v": 1}})
+    b = interner.intern({"id": 2, "x": {"v": True}})
+
+    assert a["x"] is not b["x"]
+    assert b["x"] == {"v": True}
+
+
+def test_interner_bounded():
+    """Once full, the interner should only share the dicts it already holds."""
+    interner = Interner(max_entries=1)
+    interner.intern({"id": 1, "x": {"v": 1}})
+    a, b = interner.intern({"id": 2, "x": {"v": 2}}), interner.intern({"id": 3, "x": {"v": 2}})
+
+    assert len(interner) == 1
+    assert a["x"] is not b["x"]
+
+
+def test_iter_objects_interns(fake_netbox):
+    """Crawls with intern=True should hold one copy of each repeated nested dict."""
+    client = NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+
+    with patch.object(client, "get", side_effect=fake_netbox.get):
+        objects = list(client.iter_objects("dcim/devices", page_size=5, intern=True))
+
+    assert len(objects) == 20
+    assert len({id(obj["site"]) for obj in objects}) == 2
+    assert len({id(obj["role"]) for obj in objects}) == 1
+
+
+def test_async_iter_objects_interns(fake_netbox):
+    """The async client should intern the same way."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+
+    async def get(endpoint, params=None, fallback_endpoint=None):
+        return fake_netbox.get(endpoint, params=params)
+
+    async def collect():
+        return [obj async for obj in client.iter_objects("dcim/devices", page_size=5, intern=True)]
+
+    with patch.object(client, "get", side_effect=get):
+        objects = asyncio.run(collect())
+
+    assert len({id(obj["role"]) for obj in objects}) == 1
+
+
+# ============================================================================
+# Normalization
+# ============================================================================
+
+
+def test_normalize_objects():
+    """Related objects should be replaced by IDs and listed once per field."""
+    objects = [device(1), device(2), device(3)]
+
+    entities = normalize_objects(objects)
+
+    assert objects[0] == {
+        "id": 1,
+        "name": "sw-01",
+        "site": 2,
+        "role": 4,
+        "status": {"value": "active", "label": "Active"},
+        "tags": [9],
+        "primary_ip4": None,
+    }
+    assert sorted(entities) == ["role", "site", "tags"]
+    assert entities["site"][2]["name"] == "DC 2"
+    assert sorted(entities["site"]) == [1, 2]
+
+
+def test_normalize_keeps_colliding_generic_relations_inline():
+    """A generic relation to objects of different types with the same ID stays inline."""
+    objects = [
+        {"id": 1, "assigned_object": {"id": 5, "url": "https://x/api/dcim/interfaces/5/"}},
+        {
+            "id": 2,
+            "assigned_object": {"id": 5, "url": "https://x/api/virtualization/interfaces/5/"},
+        },
+    ]
+
+    entities = normalize_objects(objects)
+
+    assert objects[0]["assigned_object"] == 5
+    assert objects[1]["assigned_object"]["url"].endswith("virtualization/interfaces/5/")
+    assert list(entities["assigned_object"]) == [5]
+
+
+def test_get_objects_normalized(mock_netbox):
+    """netbox_get_objects should return the references and the entity table."""
+    with patch("netbox_mcp_server.server.lean_responses", True):
+        result = asyncio.run(
+            netbox_get_objects.fn(object_type="dcim.device", filters={}, normalize=True)
+        )
+
+    assert [obj["site"] for obj in result["results"]] == [2, 1, 2, 1, 2]
+    # Entities are shaped like objects: their links are dropped
+    assert result["entities"]["site"] == {
+        2: {"id": 2, "name": "DC 2"},
+        1: {"id": 1, "name": "DC 1"},
+    }
+    assert result["entities"]["tags"] == {9: {"id": 9, "name": "prod"}}
+
+
+def test_normalize_requires_json():
+    """Tables cannot carry the entity table."""
+    with pytest.raises(ValueError, match="normalize requires output_format='json'"):
+        asyncio.run(
+            netbox_get_objects.fn(
+                object_type="dcim.device", filters={}, normalize=True, output_format="csv"
+            )
+        )
@@ -0,0 +1,112 @@
+"""Tests for fetching many objects by ID with URL-length-aware chunking."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.netbox_client import (
+    MAX_URL_LENGTH,
+    NetBoxAsyncClient,
+    NetBoxRestClient,
+    chunk_ids,
+)
+from netbox_mcp_server.server import netbox_get_objects_by_ids
+
+EXISTING = set(range(1, 10_000)) - {42, 4242}
+
+
+def fake_lookup(endpoint, params=None, fallback_endpoint=None):
+    """Serve the objects matching repeated id filters, like NetBox does."""
+    results = [{"id": id, "name": f"obj-{id}"} for id in params["id"] if id in EXISTING]
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+async def async_fake_lookup(endpoint, params=None, fallback_endpoint=None):
+    """Async variant of fake_lookup."""
+    return fake_lookup(endpoint, params, fallback_endpoint)
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+
+
+def test_chunk_ids_respects_url_length():
+    """Chunks should fill up to the URL length limit and keep the ID order."""
+    ids = list(range(1000, 1300))
+
+    chunks = chunk_ids(ids, base_length=100, max_length=500)
+
+    assert [id for chunk in chunks for id in chunk] == ids
+    assert all(100 + sum(len(f"&id={id}") for id in chunk) <= 500 for chunk in chunks)
+    assert len(chunks[0]) == 400 // len("&id=1000")
+
+
+def test_chunk_ids_caps_ids_per_request():
+    """Short IDs should still be split at NetBox's page size."""
+    chunks = chunk_ids(list(range(2500)), base_length=0, max_length=10**6)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_get_many_keys_results_and_reports_missing(client):
+    """Objects should be keyed by ID in request order, with unknown IDs reported."""
+    with patch.object(client, "get", side_effect=fake_lookup) as mock_get:
+        result = client.get_many("dcim/devices", [7, 42, 3, 7], params={"fields": "name"})
+
+    assert list(result["results"]) == [7, 3]
+    assert result["results"][3] == {"id": 3, "name": "obj-3"}
+    assert result["missing"] == [42]
+    params = mock_get.call_args[1]["params"]
+    assert params == {"fields": "name,id", "id": [7, 42, 3], "limit": 3}
+
+
+def test_get_many_chunks_long_id_lists(client):
+    """Long ID lists should be fetched in several requests with bounded URLs."""
+    ids = list(range(1, 3001))
+    with patch.object(client, "get", side_effect=fake_lookup) as mock_get:
+        result = client.get_many("dcim/interfaces", ids, concurrency=4)
+
+    assert len(result["results"]) == 2999
+    assert result["missing"] == [42]
+    assert mock_get.call_count > 1
+    for call in mock_get.call_args_list:
+        chunk = call[1]["params"]["id"]
+        url = f"{client.api_url}/dcim/interfaces/?limit={len(chunk)}" + "".join(
+            f"&id={id}" for id in chunk
+        )
+        assert len(url) <= MAX_URL_LENGTH
+
+
+def test_async_get_many():
+    """The async client should fetch chunks concurrently and merge them the same way."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+
+    with patch.object(client, "get", side_effect=async_fake_lookup) as mock_get:
+        result = asyncio.run(client.get_many("dcim/devices", list(range(4000, 4500))))
+
+    assert len(result["results"]) == 499
+    assert result["missing"] == [4242]
+    assert mock_get.call_count > 1
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_tool_resolves_endpoint_and_fields(mock_netbox):
+    """The tool should pass the endpoint, fields and fallback through to get_many."""
+    mock_netbox.get_many.return_value = {"results": {}, "missing": [1]}
+
+    result = asyncio.run(
+        netbox_get_objects_by_ids.fn(object_type="dcim.device", ids=[1], fields=["id", "name"])
+    )
+
+    assert result == {"results": {}, "missing": [1]}
+    args, kwargs = mock_netbox.get_many.call_args
+    assert args == ("dcim/devices", [1])
+    assert kwargs["params"] == {"fields": "id,name", "exclude": "config_context"}
+
+
+def test_tool_rejects_invalid_object_type():
+    """Unknown object types should be rejected before any request."""
+    with pytest.raises(ValueError, match="Invalid object_type"):
+        asyncio.run(netbox_get_objects_by_ids.fn(object_type="dcim.nothing", ids=[1]))
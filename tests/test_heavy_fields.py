@@ -0,0 +1,63 @@
+"""Tests for excluding expensive fields NetBox renders per object."""
+
+import asyncio
+
+import pytest
+
+from netbox_mcp_server.server import (
+    netbox_get_object_by_id,
+    netbox_get_objects,
+    netbox_search_objects,
+)
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve a single device."""
+    return {"dcim/devices": [{"id": 1, "name": "sw-01"}]}
+
+
+def sent_params(mock_netbox) -> dict:
+    """Return the params of the last NetBox request."""
+    return mock_netbox.get.call_args[1]["params"]
+
+
+@pytest.mark.parametrize(
+    ("object_type", "fields", "brief", "expected"),
+    [
+        ("dcim.device", None, False, "config_context"),
+        ("virtualization.virtualmachine", ["id", "name"], False, "config_context"),
+        ("dcim.device", ["id", "config_context"], False, None),
+        ("dcim.device", None, True, None),
+        ("dcim.site", None, False, None),
+    ],
+)
+def test_get_objects_excludes_unrequested_heavy_fields(
+    mock_netbox, object_type, fields, brief, expected
+):
+    """config_context should be excluded unless requested (or irrelevant)."""
+    asyncio.run(
+        netbox_get_objects.fn(object_type=object_type, filters={}, fields=fields, brief=brief)
+    )
+
+    assert sent_params(mock_netbox).get("exclude") == expected
+
+
+def test_get_object_by_id_excludes_heavy_fields(mock_netbox):
+    """Single-object reads should exclude config_context too."""
+    asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.device", object_id=1))
+
+    assert sent_params(mock_netbox) == {"exclude": "config_context"}
+
+
+def test_search_excludes_heavy_fields_per_type(mock_netbox):
+    """Search should only add exclude to the types that have heavy fields."""
+    asyncio.run(
+        netbox_search_objects.fn(
+            query="edge", object_types=["dcim.device", "dcim.site"], route=False
+        )
+    )
+
+    params = {c[0][0]: c[1]["params"] for c in mock_netbox.get.call_args_list}
+    assert params["dcim/devices"]["exclude"] == "config_context"
+    assert "exclude" not in params["dcim/sites"]
@@ -0,0 +1,210 @@
+"""Tests for the auto-paginating iter_objects streaming iterator."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.netbox_client import (
+    NetBoxAsyncClient,
+    NetBoxRestClient,
+    iter_pages,
+    remaining_offsets,
+)
+
+TOTAL = 23
+
+
+def fake_page(endpoint, params=None, fallback_endpoint=None):
+    """Serve a slice of TOTAL fake objects the way NetBox paginates them."""
+    limit, offset = params["limit"], params["offset"]
+    ids = range(offset + 1, min(offset + limit, TOTAL) + 1)
+    has_next = offset + limit < TOTAL
+    return {
+        "count": TOTAL,
+        "next": f"https://netbox.example.com/api/{endpoint}/?offset={offset + limit}"
+        if has_next
+        else None,
+        "previous": None,
+        "results": [{"id": i} for i in ids],
+    }
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+
+
+def test_iter_objects_streams_all_pages(client):
+    """All objects should be yielded in order across pages."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        ids = [obj["id"] for obj in client.iter_objects("dcim/interfaces", page_size=10)]
+
+    assert ids == list(range(1, TOTAL + 1))
+    assert [c[1]["params"]["offset"] for c in mock_get.call_args_list] == [0, 10, 20]
+
+
+def test_iter_objects_preserves_filters(client):
+    """Filters should be sent with every page request."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        list(client.iter_objects("dcim/interfaces", params={"device_id": 5}, page_size=10))
+
+    assert all(c[1]["params"]["device_id"] == 5 for c in mock_get.call_args_list)
+
+
+def test_iter_objects_respects_max_items(client):
+    """max_items should cap the output and shrink the last page request."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        ids = [
+            obj["id"] for obj in client.iter_objects("dcim/interfaces", page_size=10, max_items=15)
+        ]
+
+    assert ids == list(range(1, 16))
+    assert [c[1]["params"]["limit"] for c in mock_get.call_args_list] == [10, 5]
+
+
+def test_iter_objects_is_lazy(client):
+    """Stopping early should not fetch more than the page after the one being consumed."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        iterator = client.iter_objects("dcim/interfaces", page_size=5)
+        first = next(iterator)
+        iterator.close()
+
+    assert first == {"id": 1}
+    assert mock_get.call_count <= 2
+
+
+def test_async_iter_objects_streams_all_pages():
+    """The async client should stream pages the same way."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+
+    async def get(endpoint, params=None, fallback_endpoint=None):
+        return fake_page(endpoint, params=params)
+
+    async def collect():
+        return [obj["id"] async for obj in client.iter_objects("dcim/interfaces", page_size=10)]
+
+    with patch.object(client, "get", side_effect=get):
+        ids = asyncio.run(collect())
+
+    assert ids == list(range(1, TOTAL + 1))
+
+
+# ============================================================================
+# Parallel Page Fetching
+# ============================================================================
+
+
+def test_parallel_crawl_yields_in_order(client):
+    """With concurrency > 1, pages computed from count should be reassembled in order."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        ids = [
+            obj["id"] for obj in client.iter_objects("dcim/interfaces", page_size=5, concurrency=3)
+        ]
+
+    assert ids == list(range(1, TOTAL + 1))
+    assert sorted(c[1]["params"]["offset"] for c in mock_get.call_args_list) == [0, 5, 10, 15, 20]
+
+
+def test_parallel_crawl_bounded_concurrency(client):
+    """No more than `concurrency` page requests should be in flight at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_page(endpoint, params=None, fallback_endpoint=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return fake_page(endpoint, params=params)
+
+    with patch.object(client, "get", side_effect=slow_page):
+        ids = [
+            obj["id"] for obj in client.iter_objects("dcim/interfaces", page_size=2, concurrency=3)
+        ]
+
+    assert ids == list(range(1, TOTAL + 1))
+    assert 1 < peak <= 3
+
+
+def test_parallel_crawl_adapts_to_server_page_cap(client):
+    """If NetBox caps the page size, offsets should step by the page it actually returned."""
+
+    def capped_page(endpoint, params=None, fallback_endpoint=None):
+        return fake_page(endpoint, params={**params, "limit": min(params["limit"], 7)})
+
+    with patch.object(client, "get", side_effect=capped_page):
+        ids = [
+            obj["id"]
+            for obj in client.iter_objects("dcim/interfaces", page_size=1000, concurrency=4)
+        ]
+
+    assert ids == list(range(1, TOTAL + 1))
+
+
+def test_parallel_crawl_respects_max_items(client):
+    """max_items should cap the computed offsets in parallel mode too."""
+    with patch.object(client, "get", side_effect=fake_page) as mock_get:
+        ids = [
+            obj["id"]
+            for obj in client.iter_objects(
+                "dcim/interfaces", page_size=5, max_items=12, concurrency=4
+            )
+        ]
+
+    assert ids == list(range(1, 13))
+    assert sorted(c[1]["params"]["offset"] for c in mock_get.call_args_list) == [0, 5, 10]
+
+
+def test_async_parallel_crawl_yields_in_order():
+    """The async client should fetch pages concurrently and reassemble them in order."""
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+
+    async def get(endpoint, params=None, fallback_endpoint=None):
+        # Later pages finish first to prove results are reordered
+        await asyncio.sleep(0.001 * (TOTAL - params["offset"]))
+        return fake_page(endpoint, params=params)
+
+    async def collect():
+        return [
+            obj["id"]
+            async for obj in client.iter_objects("dcim/interfaces", page_size=4, concurrency=3)
+        ]
+
+    with patch.object(client, "get", side_effect=get):
+        ids = asyncio.run(collect())
+
+    assert ids == list(range(1, TOTAL + 1))
+
+
+def test_remaining_offsets_step_by_returned_page():
+    """The remaining pages should follow the first page's actual size, up to max_items."""
+    first = fake_page("dcim/interfaces", params={"limit": 7, "offset": 0})
+
+    assert remaining_offsets(first) == range(7, TOTAL, 7)
+    assert remaining_offsets(first, max_items=10) == range(7, 10, 7)
+    assert remaining_offsets(first, max_items=7) == range(0)
+
+
+def test_iter_pages_without_budget_still_counts():
+    """With max_items=0, only the first page should be fetched, for its count."""
+    limits = []
+
+    async def fetch(offset, limit):
+        limits.append(limit)
+        return fake_page("dcim/interfaces", params={"limit": limit, "offset": offset})
+
+    async def collect():
+        return [page async for page in iter_pages(fetch, page_size=5, max_items=0)]
+
+    pages = asyncio.run(collect())
+
+    assert [(page["count"], page["results"]) for page in pages] == [(TOTAL, [])]
+    assert limits == [1]
@@ -0,0 +1,262 @@
+"""Tests for the join planner resolving multi-hop filters."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.joins import (
+    IdSetCache,
+    JoinPlanner,
+    is_multi_hop,
+    related_object_type,
+)
+from netbox_mcp_server.server import netbox_get_objects
+
+# 3 sites with 400 devices each, 2 interfaces per device, 1 IP address per interface
+DEVICES = [{"id": id, "site_id": (id - 1) // 400 + 1} for id in range(1, 1201)]
+INTERFACES = [
+    {"id": id, "device_id": (id + 1) // 2, "name": f"eth{id % 2}"} for id in range(1, 2401)
+]
+IPS = [{"id": id, "interface_id": id} for id in range(1, 2401)]
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve the devices, interfaces and IP addresses."""
+    return {"dcim/devices": DEVICES, "dcim/interfaces": INTERFACES, "ipam/ip-addresses": IPS}
+
+
+@pytest.fixture
+def fetch(fake_netbox):
+    """Count the requests made to the fake NetBox."""
+    calls = []
+
+    async def fetch(endpoint, params=None, fallback_endpoint=None):
+        calls.append((endpoint, params))
+        return fake_netbox.get(endpoint, params=params, fallback_endpoint=fallback_endpoint)
+
+    fetch.calls = calls
+    return fetch
+
+
+# ============================================================================
+# Relation resolution
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("object_type", "relation", "expected"),
+    [
+        ("dcim.interface", "device", "dcim.device"),
+        ("ipam.ipaddress", "virtual_machine", "virtualization.virtualmachine"),
+        ("dcim.device", "device_type", "dcim.devicetype"),
+        ("dcim.device", "role", "dcim.devicerole"),
+        ("ipam.prefix", "role", "ipam.role"),
+        ("ipam.prefix", "tenant", "tenancy.tenant"),
+        ("dcim.site", "group", "dcim.sitegroup"),
+        ("ipam.vlan", "group", "ipam.vlangroup"),
+        ("virtualization.cluster", "group", "virtualization.clustergroup"),
+        ("virtualization.cluster", "type", "virtualization.clustertype"),
+        ("dcim.rack", "role", "dcim.rackrole"),
+        ("tenancy.tenant", "group", "tenancy.tenantgroup"),
+        ("circuits.circuit", "type", "circuits.circuittype"),
+        ("virtualization.virtualmachine", "role", "dcim.devicerole"),
+    ],
+)
+def test_related_object_type(object_type, relation, expected):
+    """Relations should resolve to the object type of the outer type they belong to."""
+    assert related_object_type(object_type, relation) == expected
+
+
+@pytest.mark.parametrize(
+    ("object_type", "relation"),
+    [("dcim.device", "group"), ("dcim.interface", "type"), ("dcim.cable", "role")],
+)
+def test_ambiguous_relation_rejected(object_type, relation):
+    """Generic relation names should not be guessed from another app's models."""
+    with pytest.raises(ValueError, match=f"filter on '{relation}_id' instead"):
+        related_object_type(object_type, relation)
+
+
+def test_unknown_relation_rejected():
+    """Relations that match no object type should be rejected with a hint."""
+    with pytest.raises(ValueError, match="filter on 'gadget_id' instead"):
+        related_object_type("dcim.device", "gadget")
+
+
+def test_is_multi_hop():
+    """Only filters traversing a relation are multi-hop."""
+    assert is_multi_hop("device__site_id")
+    assert is_multi_hop("device__name__ic")
+    assert not is_multi_hop("name__ic")
+    assert not is_multi_hop("site_id")
+
+
+# ============================================================================
+# Planning
+# ============================================================================
+
+
+def test_plan_rewrites_to_id_list(fetch):
+    """A multi-hop filter should become a '<relation>_id' filter with the matching IDs."""
+    planner = JoinPlanner(fetch)
+
+    planned = asyncio.run(planner.plan("dcim.interface", {"device__site_id": 2, "name": "eth0"}))
+
+    assert planned == {"name": "eth0", "device_id": list(range(401, 801))}
+    assert fetch.calls == [
+        (
+            "dcim/devices",
+            {"site_id": 2, "fields": "id", "ordering": "id", "limit": 1000, "offset": 0},
+        )
+    ]
+
+
+def test_plan_nested_relations(fetch):
+    """Nested relations should be resolved innermost first, chunking long ID lists."""
+    planner = JoinPlanner(fetch)
+
+    planned = asyncio.run(planner.plan("ipam.ipaddress", {"interface__device__site_id": 3}))
+
+    assert planned == {"interface_id": list(range(1601, 2401))}
+    # 400 device IDs do not fit in one URL, so the interfaces are resolved in chunks
+    assert sum(1 for endpoint, _ in fetch.calls if endpoint == "dcim/interfaces") > 1
+
+
+def test_plan_with_no_matches(fetch):
+    """A relation matching nothing means the query cannot match anything."""
+    planner = JoinPlanner(fetch)
+    assert asyncio.run(planner.plan("dcim.interface", {"device__site_id": 99})) is None
+
+
+def test_plan_intersects_direct_filter(fetch):
+    """A direct filter on the same relation should narrow the resolved IDs."""
+    planner = JoinPlanner(fetch)
+
+    planned = asyncio.run(
+        planner.plan("dcim.interface", {"device__site_id": 1, "device_id": [5, 900]})
+    )
+
+    assert planned == {"device_id": [5]}
+
+
+def test_id_sets_cached_per_session(fetch):
+    """Resolved ID sets should be reused within a session only."""
+    planner = JoinPlanner(fetch)
+
+    asyncio.run(planner.plan("dcim.interface", {"device__site_id": 1}, session="a"))
+    asyncio.run(planner.plan("dcim.interface", {"device__site_id": 1}, session="a"))
+    assert len(fetch.calls) == 1
+
+    asyncio.run(planner.plan("dcim.interface", {"device__site_id": 1}, session="b"))
+    assert len(fetch.calls) == 2
+
+
+def test_id_set_cache_expires():
+    """Expired and evicted entries should not be returned."""
+    cache = IdSetCache(ttl=0, max_entries=1)
+    cache.set(("s", "dcim.device", "x"), [1])
+    assert cache.get(("s", "dcim.device", "x")) is None
+
+    cache = IdSetCache(max_entries=1)
+    cache.set(("s", "dcim.device", "x"), [1])
+    cache.set(("s", "dcim.device", "y"), [2])
+    assert cache.get(("s", "dcim.device", "x")) is None
+    assert cache.get(("s", "dcim.device", "y")) == [2]
+
+
+def test_too_many_matches_rejected(fetch):
+    """Relations matching too many objects should ask for narrower filters."""
+    planner = JoinPlanner(fetch)
+
+    with (
+        patch("netbox_mcp_server.joins.MAX_JOIN_IDS", 100),
+        pytest.raises(ValueError, match="narrow"),
+    ):
+        asyncio.run(planner.plan("dcim.interface", {"device__site_id": 1}))
+
+
+def test_id_pages_fetched_with_bounded_concurrency(fetch):
+    """Resolving a relation should keep at most ID_CONCURRENCY page requests in flight."""
+    in_flight = peak = 0
+
+    async def slow_fetch(endpoint, params=None, fallback_endpoint=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return await fetch(endpoint, params=params, fallback_endpoint=fallback_endpoint)
+
+    planner = JoinPlanner(slow_fetch)
+    with (
+        patch("netbox_mcp_server.joins.ID_PAGE_SIZE", 50),
+        patch("netbox_mcp_server.joins.ID_CONCURRENCY", 3),
+    ):
+        ids = asyncio.run(planner.resolve("dcim.interface", {"device_id": list(range(1, 1201))}))
+
+    assert ids == list(range(1, 2401))
+    assert len({params["device_id"][0] for _, params in fetch.calls}) > 1
+    assert len(fetch.calls) >= 2400 // 50
+    assert peak == 3
+
+
+# ============================================================================
+# Tool
+# ============================================================================
+
+
+def test_get_objects_with_multi_hop_filter(mock_netbox):
+    """netbox_get_objects should run the join and send a direct ID-list filter."""
+    result = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.interface", filters={"device__site_id": 1, "name": "eth1"}, limit=3
+        )
+    )
+
+    assert result["count"] == 400
+    assert [obj["id"] for obj in result["results"]] == [1, 3, 5]
+    # One id-only query for the devices, then the interfaces in several chunks
+    assert mock_netbox.get.call_count > 2
+
+
+def test_get_objects_sends_short_id_list_directly(mock_netbox):
+    """Resolved IDs that fit in one URL should be sent in a single outer query."""
+    result = asyncio.run(
+        netbox_get_objects.fn(object_type="dcim.interface", filters={"device__id__lte": 10})
+    )
+
+    assert result["count"] == 20
+    params = mock_netbox.get.call_args[1]["params"]
+    assert params == {"device_id": list(range(1, 11)), "limit": 5, "offset": 0}
+
+
+def test_get_objects_merges_chunked_id_filter(mock_netbox):
+    """ID lists too long for one URL should be queried in chunks and merged exactly."""
+    mock_netbox.api_url = "https://netbox.example.com/api"
+
+    result = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="ipam.ipaddress",
+            filters={"interface__device__site_id": 1},
+            fields=["interface_id"],
+            ordering="-id",
+            limit=4,
+            offset=2,
+        )
+    )
+
+    assert result["count"] == 800
+    assert result["results"] == [{"interface_id": id} for id in (798, 797, 796, 795)]
+    assert result["next"] is None
+
+
+def test_get_objects_join_without_matches(mock_netbox):
+    """A join matching nothing should return an empty page without the outer query."""
+    result = asyncio.run(
+        netbox_get_objects.fn(object_type="dcim.interface", filters={"device__site_id": 99})
+    )
+
+    assert result == {"count": 0, "next": None, "previous": None, "results": []}
+    assert [c[0][0] for c in mock_netbox.get.call_args_list] == ["dcim/devices"]
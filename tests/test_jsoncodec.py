@@ -0,0 +1,134 @@
+"""Tests for the pluggable JSON decoder."""
+
+import asyncio
+import importlib
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from netbox_mcp_server.cache import ResponseCache
+from netbox_mcp_server.jsoncodec import JsonDecoder, get_decoder
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+
+real_import_module = importlib.import_module
+
+
+def without_modules(*missing: str):
+    """Patch importlib so the given backends look uninstalled."""
+
+    def import_module(name, *args, **kwargs):
+        if name.split(".")[0] in missing:
+            raise ImportError(name)
+        return real_import_module(name, *args, **kwargs)
+
+    return patch("netbox_mcp_server.jsoncodec.importlib.import_module", side_effect=import_module)
+
+
+def tracking_decoder() -> tuple[JsonDecoder, list]:
+    """Create a decoder that records the bodies it was given."""
+    seen = []
+
+    def loads(body):
+        seen.append(body)
+        return json.loads(body)
+
+    return JsonDecoder("tracking", loads), seen
+
+
+# ============================================================================
+# Backend Selection
+# ============================================================================
+
+
+def test_auto_falls_back_to_stdlib():
+    """Without orjson and msgspec, auto should select the stdlib decoder."""
+    with without_modules("orjson", "msgspec"):
+        decoder = get_decoder("auto")
+
+    assert decoder.name == "json"
+    assert decoder.loads(b'{"id": 1}') == {"id": 1}
+
+
+def test_auto_prefers_orjson():
+    """orjson should be preferred when installed."""
+    pytest.importorskip("orjson")
+
+    assert get_decoder("auto").name == "orjson"
+
+
+def test_explicit_backend_not_installed():
+    """Requesting an uninstalled backend explicitly should fail loudly."""
+    with without_modules("msgspec"), pytest.raises(ValueError, match="not installed"):
+        get_decoder("msgspec")
+
+
+def test_unknown_backend():
+    """Unknown backend names should be rejected."""
+    with pytest.raises(ValueError, match="Unknown JSON decoder"):
+        get_decoder("simplejson")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_backends_decode_bytes_and_str(backend):
+    """Every backend should accept both raw bytes and str bodies."""
+    pytest.importorskip(backend)
+    decoder = get_decoder(backend)
+
+    assert decoder.loads(b'{"results": [{"id": 1}]}') == {"results": [{"id": 1}]}
+    assert decoder.loads('{"name": "sw-01"}') == {"name": "sw-01"}
+
+
+# ============================================================================
+# Client Integration
+# ============================================================================
+
+
+def test_sync_client_decodes_body_with_decoder():
+    """The sync client should decode response.content with the configured decoder."""
+    decoder, seen = tracking_decoder()
+    client = NetBoxRestClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        cache=ResponseCache(max_bytes=1024 * 1024, default_ttl=60),
+        decoder=decoder,
+    )
+    response = MagicMock()
+    response.status_code = 200
+    response.content = b'{"count": 1, "results": [{"id": 1}]}'
+
+    with patch.object(client.session, "get", return_value=response):
+        assert client.get("dcim/sites") == {"count": 1, "results": [{"id": 1}]}
+        # Cache hits go through the same decoder
+        assert client.get("dcim/sites") == {"count": 1, "results": [{"id": 1}]}
+
+    response.json.assert_not_called()
+    assert seen == [response.content, response.content]
+
+
+def test_sync_client_without_decoder_uses_response_json():
+    """Without a decoder the HTTP library's own decoding is used."""
+    client = NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"id": 1}
+
+    with patch.object(client.session, "get", return_value=response):
+        assert client.get("dcim/sites", id=1) == {"id": 1}
+
+
+def test_async_client_decodes_body_with_decoder():
+    """The async client should decode bodies with the configured decoder too."""
+    decoder, seen = tracking_decoder()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"id": 7, "name": "new"})
+
+    client = NetBoxAsyncClient(
+        url="https://netbox.example.com", token="test-token", decoder=decoder
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert asyncio.run(client.create("dcim/sites", {"name": "new"})) == {"id": 7, "name": "new"}
+    assert len(seen) == 1
@@ -0,0 +1,107 @@
+"""Tests for OR-ed filter dicts in netbox_get_objects."""
+
+import asyncio
+
+import pytest
+
+from netbox_mcp_server import server
+from netbox_mcp_server.server import netbox_get_objects
+
+DEVICES = [
+    {"id": 1, "name": "core-sw-01", "role": "access"},
+    {"id": 2, "name": "spine-01", "role": "spine"},
+    {"id": 3, "name": "core-spine-01", "role": "spine"},
+    {"id": 4, "name": "leaf-01", "role": "leaf"},
+    {"id": 5, "name": "core-rtr-01", "role": "router"},
+    {"id": 6, "name": "spine-02", "role": "spine"},
+]
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve DEVICES."""
+    return {"dcim/devices": DEVICES}
+
+
+def test_or_filters_merge_branches(mock_netbox):
+    """Objects matching any branch should be returned once, counted exactly."""
+    result = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device",
+            filters=[{"name__ic": "core"}, {"role": "spine"}],
+            fields=["id", "name"],
+            ordering="-name",
+            limit=3,
+        )
+    )
+
+    # core-spine-01 matches both branches and is counted once
+    assert result["count"] == 5
+    assert [obj["name"] for obj in result["results"]] == ["spine-02", "spine-01", "core-sw-01"]
+
+
+def test_or_filters_paginate_merged_set(mock_netbox):
+    """limit and offset should page through the merged set."""
+    result = asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device",
+            filters=[{"name__ic": "core"}, {"role": "spine"}],
+            limit=2,
+            offset=4,
+        )
+    )
+
+    assert [obj["id"] for obj in result["results"]] == [6]
+    params = mock_netbox.get.call_args[1]["params"]
+    assert params["id"] == [1, 2, 3, 5, 6]
+
+
+def test_or_filters_branches_run_in_parallel(mock_netbox):
+    """Each branch should be resolved with an id-only query."""
+    asyncio.run(
+        netbox_get_objects.fn(
+            object_type="dcim.device", filters=[{"role": "leaf"}, {"role": "router"}]
+        )
+    )
+
+    id_queries = [
+        c[1]["params"]
+        for c in mock_netbox.get.call_args_list
+        if c[1]["params"].get("fields") == "id"
+    ]
+    assert sorted(q["role"] for q in id_queries) == ["leaf", "router"]
+
+
+def test_or_filters_resolved_fresh(mock_netbox, netbox_tables):
+    """Branch ID sets should not be reused, so new objects show up in the next call."""
+    filters = [{"role": "leaf"}, {"role": "router"}]
+    first = asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters=filters))
+    netbox_tables["dcim/devices"] = [*DEVICES, {"id": 7, "name": "leaf-02", "role": "leaf"}]
+    second = asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters=filters))
+
+    assert first["count"] == 2
+    assert second["count"] == 3
+    assert len(server.join_planner.cache) == 0
+
+
+def test_or_filters_without_matches(mock_netbox):
+    """Branches matching nothing should give an empty page."""
+    result = asyncio.run(
+        netbox_get_objects.fn(object_type="dcim.device", filters=[{"role": "firewall"}])
+    )
+
+    assert result == {"count": 0, "next": None, "previous": None, "results": []}
+
+
+def test_or_filters_validated(mock_netbox):
+    """Every branch should go through validate_filters."""
+    with pytest.raises(ValueError, match="Invalid filter 'name__bogus'"):
+        asyncio.run(
+            netbox_get_objects.fn(
+                object_type="dcim.device", filters=[{"role": "spine"}, {"name__bogus": "x"}]
+            )
+        )
+    mock_netbox.get.assert_not_called()
+
+    with pytest.raises(ValueError, match="list of 1 to"):
+        asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters=[]))
@@ -1,5 +1,6 @@
 """Tests for ordering parameter validation and behavior."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -33,7 +34,7 @@ def test_ordering_none_omits_parameter(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=None)
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=None))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -52,7 +53,7 @@ def test_ordering_empty_string_omits_parameter(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering="")
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=""))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -71,7 +72,7 @@ def test_ordering_single_field_ascending(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering="name")
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering="name"))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -89,7 +90,7 @@ def test_ordering_single_field_descending(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering="-id")
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering="-id"))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -107,7 +108,9 @@ def test_ordering_multiple_fields_as_list(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=["facility", "-name"])
+    asyncio.run(
+        netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=["facility", "-name"])
+    )
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
@@ -126,7 +129,7 @@ def test_ordering_empty_list_omits_parameter(mock_netbox):
         "previous": None,
     }
 
-    netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=[])
+    asyncio.run(netbox_get_objects.fn(object_type="dcim.site", filters={}, ordering=[]))
 
     call_args = mock_netbox.get.call_args
     params = call_args[1]["params"]
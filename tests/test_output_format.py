@@ -0,0 +1,151 @@
+"""Tests for the CSV/TSV output formats."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.server import (
+    netbox_get_changelogs,
+    netbox_get_objects,
+    netbox_search_objects,
+)
+from netbox_mcp_server.tabular import flatten_value, render_page, render_search
+
+PAGE = {
+    "count": 57,
+    "next": "https://netbox.example.com/api/ipam/ip-addresses/?limit=2&offset=2",
+    "previous": None,
+    "results": [
+        {
+            "id": 1,
+            "address": "10.0.0.1/24",
+            "status": {"value": "active", "label": "Active"},
+            "tenant": {"id": 3, "display": "Acme, Inc.", "name": "Acme, Inc."},
+            "tags": [{"id": 1, "name": "prod"}, {"id": 2, "name": "core"}],
+            "vrf": None,
+        },
+        {"id": 2, "address": "10.0.0.2/24", "status": {"value": "reserved"}, "dns_name": "h2"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, ""),
+        (True, "true"),
+        (42, "42"),
+        ({"value": "active", "label": "Active"}, "active"),
+        ({"id": 3, "url": "https://x/3/", "display": "Site 3", "name": "site-3"}, "Site 3"),
+        ({"id": 9}, "9"),
+        ([{"name": "a"}, {"name": "b"}], "a;b"),
+        ({"ntp": ["10.0.0.1"]}, '{"ntp":["10.0.0.1"]}'),
+    ],
+)
+def test_flatten_value(value, expected):
+    """Nested values should be flattened to a single cell."""
+    assert flatten_value(value) == expected
+
+
+def test_render_csv():
+    """CSV should have a metadata header, one column per field and quoted values."""
+    assert render_page(PAGE, "csv") == (
+        "# count=57 next=https://netbox.example.com/api/ipam/ip-addresses/?limit=2&offset=2"
+        " previous=null\n"
+        "id,address,status,tenant,tags,vrf,dns_name\n"
+        '1,10.0.0.1/24,active,"Acme, Inc.",prod;core,,\n'
+        "2,10.0.0.2/24,reserved,,,,h2\n"
+    )
+
+
+def test_render_tsv_keeps_rows_on_one_line():
+    """Tabs and newlines inside values should not break TSV rows."""
+    page = {"count": 1, "results": [{"id": 1, "comments": "line 1\nline\t2"}]}
+
+    assert render_page(page, "tsv") == "# count=1\nid\tcomments\n1\tline 1 line 2\n"
+
+
+def test_render_search_sections():
+    """Per-type results should be rendered as one section per type."""
+    results = {"dcim.device": [{"id": 1, "name": "sw-01"}], "dcim.site": [], "timed_out": ["x"]}
+
+    assert render_search(results, "csv") == (
+        '# timed_out=["x"]\n# dcim.device count=1\nid,name\n1,sw-01\n# dcim.site count=0\n'
+    )
+
+
+def test_render_ranked_search():
+    """Ranked hits should be one table with their type and match in front."""
+    results = {
+        "results": [{"object_type": "dcim.site", "match": "exact", "object": {"id": 2}}],
+        "skipped": [],
+        "timed_out": [],
+    }
+
+    assert render_search(results, "tsv") == (
+        "# skipped=[] timed_out=[]\nobject_type\tmatch\tid\ndcim.site\texact\t2\n"
+    )
+
+
+# ============================================================================
+# Tools
+# ============================================================================
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_get_objects_csv(mock_netbox):
+    """netbox_get_objects should return the table as text content."""
+    mock_netbox.get.return_value = PAGE
+
+    result = asyncio.run(
+        netbox_get_objects.run(
+            {"object_type": "ipam.ipaddress", "filters": {}, "output_format": "csv"}
+        )
+    )
+
+    assert result.content[0].text == render_page(PAGE, "csv")
+    assert result.structured_content is None
+
+
+@patch("netbox_mcp_server.server.raw_passthrough", True)
+@patch("netbox_mcp_server.server.netbox")
+def test_tables_bypass_raw_passthrough(mock_netbox):
+    """Tables are rendered from decoded objects even when raw passthrough is enabled."""
+    mock_netbox.get.return_value = PAGE
+
+    result = asyncio.run(
+        netbox_get_objects.fn(object_type="ipam.ipaddress", filters={}, output_format="tsv")
+    )
+
+    assert result.content[0].text.startswith("# count=57")
+    mock_netbox.get_raw.assert_not_called()
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_changelogs_csv(mock_netbox):
+    """Changelog pages should be rendered like object pages."""
+    mock_netbox.get.return_value = {
+        "count": 1,
+        "next": None,
+        "previous": None,
+        "results": [{"id": 7, "action": {"value": "update", "label": "Updated"}}],
+    }
+
+    result = asyncio.run(netbox_get_changelogs.fn(filters={}, output_format="csv"))
+
+    assert result.content[0].text == "# count=1 next=null previous=null\nid,action\n7,update\n"
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_search_csv(mock_netbox):
+    """Search results should be rendered per object type."""
+    mock_netbox.get.return_value = {"count": 1, "results": [{"id": 1, "name": "sw-01"}]}
+
+    result = asyncio.run(
+        netbox_search_objects.fn(
+            query="sw", object_types=["dcim.device"], route=False, output_format="csv"
+        )
+    )
+
+    assert result.content[0].text == "# dcim.device count=1\nid,name\n1,sw-01\n"
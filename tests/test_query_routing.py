@@ -0,0 +1,49 @@
+"""Tests for query-shape routing of global search terms."""
+
+import pytest
+
+from netbox_mcp_server.query_routing import SearchRoute, classify_query
+
+
+@pytest.mark.parametrize(
+    ("query", "shape", "routes"),
+    [
+        ("192.168.1.100", "ip", [SearchRoute("ipam.ipaddress", {"address": "192.168.1.100"})]),
+        ("2001:db8::1", "ip", [SearchRoute("ipam.ipaddress", {"address": "2001:db8::1"})]),
+        ("10.0.0.0/24", "cidr", [SearchRoute("ipam.prefix", {"prefix": "10.0.0.0/24"})]),
+        (
+            "10.0.0.5/24",
+            "ip_interface",
+            [SearchRoute("ipam.ipaddress", {"address": "10.0.0.5/24"})],
+        ),
+        ("100", "vlan_id", [SearchRoute("ipam.vlan", {"vid": 100})]),
+        ("SN123456", "serial", [SearchRoute("dcim.device", {"serial": "SN123456"})]),
+        (" 192.168.1.1 ", "ip", [SearchRoute("ipam.ipaddress", {"address": "192.168.1.1"})]),
+    ],
+)
+def test_classifies_query_shapes(query, shape, routes):
+    """Recognizable terms should be routed to exact filters."""
+    assert classify_query(query) == (shape, routes)
+
+
+@pytest.mark.parametrize(
+    "mac", ["aa:bb:cc:dd:ee:ff", "AA-BB-CC-DD-EE-FF", "aabb.ccdd.eeff", "aabbccddeeff"]
+)
+def test_classifies_mac_formats(mac):
+    """Common MAC notations should route to interface mac_address filters."""
+    shape, routes = classify_query(mac)
+
+    assert shape == "mac"
+    assert [route.object_type for route in routes] == [
+        "dcim.interface",
+        "virtualization.vminterface",
+    ]
+    assert routes[0].filters == {"mac_address": mac}
+
+
+@pytest.mark.parametrize(
+    "query", ["switch01", "NYC-DC1", "core router", "0", "5000", "ABCDEFGH", "aa:bb:cc:dd:ee"]
+)
+def test_free_text_is_not_routed(query):
+    """Names, out-of-range VLAN IDs and malformed values use the broad search."""
+    assert classify_query(query) == ("text", [])
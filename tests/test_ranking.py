@@ -0,0 +1,53 @@
+"""Tests for scoring and top-k selection of merged search results."""
+
+import pytest
+
+from netbox_mcp_server.ranking import EXACT, OTHER, PREFIX, SUBSTRING, TopK, score_match
+
+
+@pytest.mark.parametrize(
+    ("obj", "score"),
+    [
+        ({"name": "Switch01"}, EXACT),
+        ({"name": "switch01-b"}, PREFIX),
+        ({"name": "core-switch01"}, SUBSTRING),
+        ({"name": "core", "description": "switch01 uplink"}, OTHER),
+        ({"display": "switch01 (rack 4)"}, PREFIX),
+        ({"id": 1}, OTHER),
+    ],
+)
+def test_score_match(obj, score):
+    """Exact beats prefix beats substring beats a match on another field."""
+    assert score_match("switch01", obj) == score
+
+
+def test_score_match_ignores_mask():
+    """An IP term should match an address stored with its mask exactly."""
+    assert score_match("10.0.0.1", {"address": "10.0.0.1/24"}) == EXACT
+
+
+def test_topk_keeps_best_hits():
+    """Only the k best hits should be kept, best first, ties broken by type priority."""
+    top = TopK(2)
+    top.push(SUBSTRING, 0, "dcim.device", {"id": 1})
+    top.push(EXACT, 1, "dcim.site", {"id": 2})
+    top.push(EXACT, 0, "dcim.device", {"id": 3})
+    top.push(OTHER, 0, "dcim.device", {"id": 4})
+
+    assert top.results() == [
+        {"object_type": "dcim.device", "match": "exact", "object": {"id": 3}},
+        {"object_type": "dcim.site", "match": "exact", "object": {"id": 2}},
+    ]
+
+
+def test_topk_full_of():
+    """full_of should report when k hits reach the score threshold."""
+    top = TopK(2)
+    top.push(EXACT, 0, "dcim.device", {"id": 1})
+    assert not top.full_of(PREFIX)
+
+    top.push(SUBSTRING, 0, "dcim.device", {"id": 2})
+    assert not top.full_of(PREFIX)
+
+    top.push(PREFIX, 0, "dcim.device", {"id": 3})
+    assert top.full_of(PREFIX)
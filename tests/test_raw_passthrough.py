@@ -0,0 +1,148 @@
+"""Tests for returning unmodified NetBox responses without a decode/encode round trip."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from netbox_mcp_server.cache import ResponseCache
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+from netbox_mcp_server.server import netbox_get_object_by_id, netbox_get_objects
+
+BODY = b'{"count":1,"next":null,"previous":null,"results":[{"id":1,"name":"sw-01"}]}'
+
+
+@pytest.fixture
+def passthrough():
+    """Enable raw passthrough for the duration of a test."""
+    with patch("netbox_mcp_server.server.raw_passthrough", True):
+        yield
+
+
+# ============================================================================
+# Tools
+# ============================================================================
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_get_objects_returns_body_as_text(mock_netbox, passthrough):
+    """The NetBox body should become the tool's text content unchanged."""
+    mock_netbox.get_raw.return_value = BODY
+
+    result = asyncio.run(netbox_get_objects.run({"object_type": "dcim.device", "filters": {}}))
+
+    assert result.content[0].text == BODY.decode()
+    assert result.structured_content is None
+    mock_netbox.get.assert_not_called()
+    assert mock_netbox.get_raw.call_args[1]["params"] == {
+        "limit": 5,
+        "offset": 0,
+        "exclude": "config_context",
+    }
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_get_object_by_id_returns_body_as_text(mock_netbox, passthrough):
+    """Single-object lookups should pass the body through too."""
+    mock_netbox.get_raw.return_value = b'{"id":5,"name":"sw-05"}'
+
+    result = asyncio.run(
+        netbox_get_object_by_id.fn(object_type="dcim.device", object_id=5, fields=["id", "name"])
+    )
+
+    assert result.content[0].text == '{"id":5,"name":"sw-05"}'
+    assert mock_netbox.get_raw.call_args[0][0] == "dcim/devices/5"
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_cursor_pagination_still_decodes(mock_netbox, passthrough):
+    """Cursor pagination rewrites the response, so it must not use the passthrough."""
+    mock_netbox.get.return_value = {"count": 1, "next": None, "results": [{"id": 1}]}
+
+    result = asyncio.run(
+        netbox_get_objects.fn(object_type="dcim.device", filters={}, pagination="cursor")
+    )
+
+    assert result == {"count": 1, "next_cursor": None, "results": [{"id": 1}]}
+    mock_netbox.get_raw.assert_not_called()
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_passthrough_disabled_decodes(mock_netbox):
+    """With passthrough disabled, tools return decoded dicts as before."""
+    mock_netbox.get.return_value = {"id": 5}
+
+    assert asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.device", object_id=5)) == {
+        "id": 5
+    }
+    mock_netbox.get_raw.assert_not_called()
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_lean_responses_pass_through_explicit_fields(mock_netbox, passthrough):
+    """With lean shaping also on (the defaults), only queries with fields pass through."""
+    mock_netbox.get_raw.return_value = BODY
+    mock_netbox.get.return_value = {
+        "count": 1,
+        "next": None,
+        "previous": None,
+        "results": [{"id": 1, "name": "sw-01", "url": "https://netbox.example.com/..."}],
+    }
+
+    with patch("netbox_mcp_server.server.lean_responses", True):
+        projected = asyncio.run(
+            netbox_get_objects.run(
+                {"object_type": "dcim.device", "filters": {}, "fields": ["id", "name"]}
+            )
+        )
+        full = asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters={}))
+
+    assert projected.content[0].text == BODY.decode()
+    assert full["results"] == [{"id": 1, "name": "sw-01"}]
+    assert mock_netbox.get_raw.call_count == 1
+    assert mock_netbox.get.call_count == 1
+
+
+# ============================================================================
+# Clients
+# ============================================================================
+
+
+def test_sync_get_raw_returns_content_and_shares_cache():
+    """get_raw should return the body bytes and share cached bodies with get()."""
+    client = NetBoxRestClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        cache=ResponseCache(max_bytes=1024 * 1024, default_ttl=60),
+    )
+    response = MagicMock()
+    response.status_code = 200
+    response.content = BODY
+
+    with patch.object(client.session, "get", return_value=response) as mock_get:
+        assert client.get_raw("dcim/devices", params={"limit": 5}) == BODY
+        assert client.get("dcim/devices", params={"limit": 5})["results"][0]["name"] == "sw-01"
+
+    assert mock_get.call_count == 1
+    response.json.assert_not_called()
+
+
+def test_async_get_raw_returns_content():
+    """The async client should return the body bytes untouched."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=BODY, headers={"Content-Type": "application/json"})
+
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert asyncio.run(client.get_raw("dcim/devices")) == BODY
+
+
+def test_default_get_raw_encodes_get_result():
+    """Clients without a wire body fall back to encoding get()."""
+    client = NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+
+    with patch.object(client, "get", return_value={"id": 1}):
+        assert super(NetBoxRestClient, client).get_raw("dcim/sites", id=1) == b'{"id": 1}'
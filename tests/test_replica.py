@@ -0,0 +1,324 @@
+"""Tests for the local SQLite replica client."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from netbox_mcp_server.replica import (
+    NetBoxReplicaClient,
+    ReplicaQueryError,
+    ReplicaStore,
+    sync_replica,
+    sync_replica_incremental,
+)
+
+
+def device(id: int, name: str, site_id: int, status: str = "active", **extra) -> dict:
+    """Build a dcim.device object shaped like a NetBox response."""
+    return {
+        "id": id,
+        "url": f"https://netbox.example.com/api/dcim/devices/{id}/",
+        "display": name,
+        "name": name,
+        "serial": f"SN{id:06d}",
+        "status": {"value": status, "label": status.title()},
+        "site": {"id": site_id, "name": f"Site {site_id}", "slug": f"site-{site_id}"},
+        "tenant": None,
+        "tags": [{"id": 1, "name": "Core", "slug": "core"}] if id % 2 else [],
+        "position": float(id),
+        **extra,
+    }
+
+
+DEVICES = [
+    device(1, "core-sw-01", 1),
+    device(2, "core-sw-02", 1, status="planned"),
+    device(3, "edge-rtr-01", 2, tenant={"id": 7, "name": "Acme", "slug": "acme"}),
+    device(4, "Edge_FW_01", 2, status="offline"),
+    device(5, "access-sw-01", 3),
+]
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory replica holding a few devices."""
+    store = ReplicaStore(":memory:")
+    store.set_meta("source_url", "https://netbox.example.com")
+    store.replace_all("dcim/devices", "dcim.device", DEVICES)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def client(store):
+    """Create a replica client without an upstream."""
+    return NetBoxReplicaClient(store)
+
+
+def ids(response: dict) -> list[int]:
+    """Return the IDs of a list response's results."""
+    return [obj["id"] for obj in response["results"]]
+
+
+# ============================================================================
+# Filters
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        ({"name": "core-sw-01"}, [1]),
+        ({"name__n": "core-sw-01"}, [2, 3, 4, 5]),
+        ({"name__ic": "SW"}, [1, 2, 5]),
+        ({"name__nic": "sw"}, [3, 4]),
+        ({"name__isw": "edge"}, [3, 4]),
+        ({"name__iew": "-01"}, [1, 3, 5]),
+        ({"name__ie": "EDGE-RTR-01"}, [3]),
+        ({"name__ic": "_fw"}, [4]),
+        ({"name__regex": "^core-sw-0[12]$"}, [1, 2]),
+        ({"status": "active"}, [1, 3, 5]),
+        ({"status__in": "planned,offline"}, [2, 4]),
+        ({"status__in": ["planned", "offline"]}, [2, 4]),
+        ({"site_id": 2}, [3, 4]),
+        ({"site_id": "2"}, [3, 4]),
+        ({"site": "site-1"}, [1, 2]),
+        ({"tenant_id": 7}, [3]),
+        ({"tenant__empty": "true"}, [1, 2, 4, 5]),
+        ({"id__gt": 3}, [4, 5]),
+        ({"id__lte": "2"}, [1, 2]),
+        ({"position__gte": 4}, [4, 5]),
+        ({"tag": "core"}, [1, 3, 5]),
+        ({"tag_id": 1}, [1, 3, 5]),
+        ({"tag__n": "core"}, [2, 4]),
+        ({"q": "rtr"}, [3]),
+        ({"site_id": 1, "status": "active"}, [1]),
+    ],
+)
+def test_filters(client, params, expected):
+    """The validate_filters subset should behave like NetBox's filters."""
+    assert ids(client.get("dcim/devices", params={**params, "limit": 100})) == expected
+
+
+def test_unknown_filter_without_upstream_raises(client):
+    """Filters on fields the replica does not hold cannot be answered locally."""
+    with pytest.raises(ReplicaQueryError):
+        client.get("dcim/devices", params={"rack_id": 1})
+
+
+def test_filter_uses_index(store):
+    """Common filter columns should be served from an expression index."""
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM objects "
+        "WHERE endpoint = ? AND json_extract(data, '$.name') IN (?)",
+        ("dcim/devices", "core-sw-01"),
+    ).fetchall()
+
+    assert "idx_objects_name" in str(plan)
+
+
+# ============================================================================
+# Projection, Ordering and Pagination
+# ============================================================================
+
+
+def test_fields_and_brief(client):
+    """fields and brief should trim the returned objects."""
+    response = client.get("dcim/devices", params={"fields": "id,name", "limit": 1})
+    assert response["results"] == [{"id": 1, "name": "core-sw-01"}]
+
+    response = client.get("dcim/devices", params={"brief": "1", "limit": 1})
+    assert set(response["results"][0]) == {"id", "url", "display", "name"}
+
+
+def test_exclude(client):
+    """exclude should drop fields without forwarding the query."""
+    params = {"exclude": "config_context,tags", "limit": 1}
+
+    response = client.get("dcim/devices", params=params)
+
+    assert "tags" not in response["results"][0]
+    assert "name" in response["results"][0]
+    assert json.loads(client.get_raw("dcim/devices", params=params)) == response
+
+
+def test_ordering(client):
+    """ordering should support multiple fields, descending order and nested objects."""
+    response = client.get("dcim/devices", params={"ordering": "-site,name", "limit": 100})
+    assert ids(response) == [5, 4, 3, 1, 2]
+
+    response = client.get("dcim/devices", params={"ordering": ["-id"], "limit": 2})
+    assert ids(response) == [5, 4]
+
+
+def test_pagination_envelope(client):
+    """limit and offset should page through results with NetBox-style links."""
+    response = client.get("dcim/devices", params={"limit": 2, "offset": 2, "site_id": 1})
+    assert response["count"] == 2
+    assert response["results"] == []
+
+    response = client.get("dcim/devices", params={"limit": 2, "offset": 2})
+    assert response["count"] == 5
+    assert ids(response) == [3, 4]
+    assert response["next"] == "https://netbox.example.com/api/dcim/devices/?limit=2&offset=4"
+    assert response["previous"] == "https://netbox.example.com/api/dcim/devices/?limit=2&offset=0"
+
+
+def test_get_by_id(client):
+    """Single objects should be looked up by ID, also via an 'endpoint/id' path."""
+    assert client.get("dcim/devices", id=3)["name"] == "edge-rtr-01"
+    assert client.get("dcim/devices/3", params={"fields": "name"}) == {"name": "edge-rtr-01"}
+
+    with pytest.raises(LookupError):
+        client.get("dcim/devices", id=99)
+
+
+def test_get_raw_matches_get(client):
+    """The spliced raw body should decode to the same response as get()."""
+    params = {"site_id": 1, "limit": 1}
+
+    assert json.loads(client.get_raw("dcim/devices", params=params)) == client.get(
+        "dcim/devices", params=params
+    )
+    assert json.loads(client.get_raw("dcim/devices/2")) == DEVICES[1]
+
+
+def test_get_many(client):
+    """Objects should be looked up by ID locally, with missing IDs reported."""
+    result = client.get_many("dcim/devices", [4, 99, 1], params={"fields": "name"})
+
+    assert result == {
+        "results": {4: {"name": "Edge_FW_01", "id": 4}, 1: {"name": "core-sw-01", "id": 1}},
+        "missing": [99],
+    }
+
+
+# ============================================================================
+# Upstream Forwarding
+# ============================================================================
+
+
+def test_forwards_unreplicated_and_unsupported_queries(store):
+    """Reads the replica cannot serve should go to the upstream client."""
+    upstream = MagicMock()
+    upstream.get.return_value = {"count": 0, "results": []}
+    client = NetBoxReplicaClient(store, upstream=upstream)
+
+    client.get("dcim/sites", params={"limit": 5})
+    client.get("dcim/devices", params={"rack_id": 4})
+    client.get("dcim/devices", id=99)
+    client.get("dcim/devices", params={"name": "core-sw-01"})
+
+    assert [call.args[0] for call in upstream.get.call_args_list] == [
+        "dcim/sites",
+        "dcim/devices",
+        "dcim/devices",
+    ]
+
+
+def test_writes_go_upstream_and_update_replica(store):
+    """Writes should be sent to NetBox and applied to the replica."""
+    upstream = MagicMock()
+    upstream.update.return_value = device(1, "core-sw-01-renamed", 1)
+    upstream.delete.return_value = True
+    client = NetBoxReplicaClient(store, upstream=upstream)
+
+    client.update("dcim/devices", 1, {"name": "core-sw-01-renamed"})
+    client.delete("dcim/devices", 5)
+
+    assert client.get("dcim/devices", id=1)["name"] == "core-sw-01-renamed"
+    assert ids(client.get("dcim/devices", params={"limit": 100})) == [1, 2, 3, 4]
+
+
+# ============================================================================
+# Sync
+# ============================================================================
+
+
+def test_sync_replaces_snapshot(store):
+    """A sync should atomically replace the stored objects of each type."""
+    source = MagicMock()
+    source.iter_objects.return_value = iter(DEVICES[:2])
+    source.get.return_value = {"count": 40, "next": None, "results": [{"id": 40}]}
+
+    counts = sync_replica(source, store, ["dcim.device"])
+
+    assert counts == {"dcim.device": 2}
+    assert source.iter_objects.call_args[0][0] == "dcim/devices"
+    client = NetBoxReplicaClient(store)
+    assert ids(client.get("dcim/devices", params={"limit": 100})) == [1, 2]
+    assert "dcim.device" in store.synced_at()
+    assert store.change_ids() == {"dcim/devices": 40}
+
+
+def test_sync_rejects_unknown_type(store):
+    """Unknown object types should be rejected."""
+    with pytest.raises(ValueError, match="Unknown object type"):
+        sync_replica(MagicMock(), store, ["dcim.nothing"])
+
+
+def change(id: int, action: str, object_id: int, object_type: str = "dcim.device") -> dict:
+    """Build a core.objectchange shaped like a NetBox response."""
+    return {
+        "id": id,
+        "action": {"value": action, "label": action.title()},
+        "changed_object_type": object_type,
+        "changed_object_id": object_id,
+    }
+
+
+def changelog_source(changes: list[dict], objects: list[dict], page_size: int = 2) -> MagicMock:
+    """Build a client serving paged object changes and objects looked up by ID."""
+
+    def get(endpoint, id=None, params=None):
+        if endpoint == "core/object-changes":
+            newer = [c for c in changes if c["id"] > params["id__gt"]]
+            page = newer[:page_size]
+            return {"next": "more" if len(newer) > page_size else None, "results": page}
+        found = [obj for obj in objects if obj["id"] in params["id"]]
+        return {"count": len(found), "next": None, "results": found}
+
+    source = MagicMock()
+    source.get.side_effect = get
+    return source
+
+
+def test_incremental_sync_applies_changes(store):
+    """Object changes should be re-fetched in batches and applied to the replica."""
+    store.mark_synced("dcim/devices", 10, 0.0)
+    source = changelog_source(
+        [
+            change(9, "update", 1),  # Already applied
+            change(11, "update", 2),
+            change(12, "create", 6),
+            change(13, "update", 3),
+            change(14, "delete", 3),
+            change(15, "update", 4),  # Deleted since, so missing from the re-fetch
+            change(16, "update", 1, object_type="dcim.site"),  # Not replicated
+        ],
+        [device(2, "core-sw-02-renamed", 1), device(6, "new-sw-01", 3)],
+    )
+
+    applied = sync_replica_incremental(source, store, page_size=2, batch_size=1)
+
+    assert applied == {"dcim.device": {"upserted": 2, "deleted": 2}}
+    client = NetBoxReplicaClient(store)
+    assert ids(client.get("dcim/devices", params={"limit": 100})) == [1, 2, 5, 6]
+    assert client.get("dcim/devices", id=2)["name"] == "core-sw-02-renamed"
+    assert store.change_ids() == {"dcim/devices": 16}
+    assert store.staleness()["dcim.device"] < 60
+    # One request per batch of IDs, and never an id__in filter NetBox does not support
+    refetches = [c for c in source.get.call_args_list if c.args[0] == "dcim/devices"]
+    assert [c.kwargs["params"]["id"] for c in refetches] == [[2], [4], [6]]
+
+
+def test_incremental_sync_without_changes(store):
+    """With nothing new, the high-water mark stays put and staleness resets."""
+    store.mark_synced("dcim/devices", 10, 0.0)
+    assert store.staleness(now=100.0) == {"dcim.device": 100.0}
+
+    assert sync_replica_incremental(changelog_source([], []), store) == {}
+
+    assert store.change_ids() == {"dcim/devices": 10}
+    assert store.staleness()["dcim.device"] < 60
@@ -0,0 +1,179 @@
+"""Tests for the retry policy for transient NetBox failures."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+from netbox_mcp_server.retry import RetryPolicy, parse_retry_after, retry_budget
+
+
+def make_response(status_code: int, headers: dict | None = None) -> MagicMock:
+    """Create a mock requests.Response with a status code and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"count": 0, "results": []}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"HTTP {status_code}")
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a retry policy."""
+    return NetBoxRestClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        retry_policy=RetryPolicy(max_retries=3, backoff_base=0.5),
+    )
+
+
+# ============================================================================
+# Policy
+# ============================================================================
+
+
+def test_parse_retry_after():
+    """Retry-After should accept delta-seconds and ignore malformed values."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_is_exponential_with_jitter():
+    """Delays should be drawn from [0, base * 2**attempt], capped at backoff_max."""
+    policy = RetryPolicy(max_retries=10, backoff_base=1.0, backoff_max=4.0, deadline=1000)
+    deadline = policy.start()
+
+    with patch("netbox_mcp_server.retry.random.uniform", side_effect=lambda a, b: b):
+        delays = [policy.next_delay(attempt, deadline) for attempt in range(4)]
+
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+
+
+def test_no_delay_past_max_retries_or_deadline():
+    """The policy should stop once retries or the time budget are exhausted."""
+    policy = RetryPolicy(max_retries=2, deadline=5)
+    deadline = policy.start()
+
+    assert policy.next_delay(2, deadline) is None
+    assert policy.next_delay(0, deadline, retry_after="60") is None
+
+
+def test_retry_budget_caps_deadline():
+    """A retry_budget block should shorten the per-request deadline, never extend it."""
+    policy = RetryPolicy(deadline=30)
+
+    with patch("netbox_mcp_server.retry.time.monotonic", return_value=100.0):
+        assert policy.start() == 130.0
+        with retry_budget(5):
+            assert policy.start() == 105.0
+            with retry_budget(50):
+                assert policy.start() == 105.0
+
+
+def test_writes_not_retried_by_default():
+    """Only idempotent methods are retried unless retry_writes is set."""
+    assert RetryPolicy().allows("get")
+    assert not RetryPolicy().allows("post")
+    assert RetryPolicy(retry_writes=True).allows("delete")
+
+
+# ============================================================================
+# Sync Client
+# ============================================================================
+
+
+@patch("netbox_mcp_server.retry.time.sleep")
+def test_get_retries_transient_status(mock_sleep, client):
+    """A 503 followed by a 200 should succeed after one retry."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = [make_response(503), make_response(200)]
+
+        assert client.get("dcim/sites") == {"count": 0, "results": []}
+
+    assert mock_get.call_count == 2
+    assert mock_sleep.call_count == 1
+    assert client.retry_policy.stats() == {"dcim/sites": 1}
+
+
+@patch("netbox_mcp_server.retry.time.sleep")
+def test_get_honors_retry_after(mock_sleep, client):
+    """The Retry-After header should override the computed backoff."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = [make_response(429, {"Retry-After": "2"}), make_response(200)]
+        client.get("dcim/sites")
+
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("netbox_mcp_server.retry.time.sleep")
+def test_get_retries_connection_errors(mock_sleep, client):
+    """Connection resets should be retried and the last error raised when retries run out."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("reset")
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("dcim/devices/4")
+
+    assert mock_get.call_count == 4
+    assert client.retry_policy.stats() == {"dcim/devices": 3}
+
+
+@patch("netbox_mcp_server.retry.time.sleep")
+def test_get_does_not_retry_other_errors(mock_sleep, client):
+    """Non-transient errors should fail immediately."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = make_response(500)
+
+        with pytest.raises(requests.HTTPError):
+            client.get("dcim/sites")
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("netbox_mcp_server.retry.time.sleep")
+def test_create_not_retried_unless_enabled(mock_sleep, client):
+    """Writes should surface a 503 immediately unless retry_writes is enabled."""
+    with patch.object(client.session, "post") as mock_post:
+        mock_post.return_value = make_response(503)
+        with pytest.raises(requests.HTTPError):
+            client.create("dcim/sites", {"name": "x"})
+    assert mock_post.call_count == 1
+
+    client.retry_policy.retry_writes = True
+    with patch.object(client.session, "post") as mock_post:
+        mock_post.side_effect = [make_response(503), make_response(201)]
+        client.create("dcim/sites", {"name": "x"})
+    assert mock_post.call_count == 2
+
+
+# ============================================================================
+# Async Client
+# ============================================================================
+
+
+@patch("netbox_mcp_server.netbox_client.asyncio.sleep")
+def test_async_get_retries_transient_status(mock_sleep):
+    """The async client should apply the same policy."""
+    statuses = iter([502, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"id": 1})
+
+    client = NetBoxAsyncClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        retry_policy=RetryPolicy(),
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert asyncio.run(client.get("dcim/sites", id=1)) == {"id": 1}
+    assert mock_sleep.call_count == 1
+    assert client.retry_policy.stats() == {"dcim/sites": 1}
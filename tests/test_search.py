@@ -1,12 +1,14 @@
 """Tests for global search functionality (netbox_search_objects tool)."""
 
-from unittest.mock import patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from pydantic import TypeAdapter, ValidationError
 
 from netbox_mcp_server.netbox_types import NETBOX_OBJECT_TYPES
-from netbox_mcp_server.server import netbox_search_objects
+from netbox_mcp_server.server import DEFAULT_SEARCH_TYPES, netbox_search_objects
 
 # ============================================================================
 # Parameter Validation Tests
@@ -33,7 +35,7 @@ def test_limit_validation_rejects_invalid_values():
 def test_invalid_object_type_raises_error():
     """Invalid object type should raise ValueError with helpful message."""
     with pytest.raises(ValueError, match="Invalid object_type"):
-        netbox_search_objects.fn(query="test", object_types=["invalid_type_xyz"])
+        asyncio.run(netbox_search_objects.fn(query="test", object_types=["invalid_type_xyz"]))
 
 
 # ============================================================================
@@ -51,7 +53,7 @@ def test_searches_default_types_when_none_specified(mock_netbox):
         "results": [],
     }
 
-    result = netbox_search_objects.fn(query="test")
+    result = asyncio.run(netbox_search_objects.fn(query="test"))
 
     # Should search 8 default types
     assert mock_netbox.get.call_count == 8
@@ -69,7 +71,9 @@ def test_custom_object_types_limits_search_scope(mock_netbox):
         "results": [],
     }
 
-    result = netbox_search_objects.fn(query="test", object_types=["dcim.device", "dcim.site"])
+    result = asyncio.run(
+        netbox_search_objects.fn(query="test", object_types=["dcim.device", "dcim.site"])
+    )
 
     # Should only search specified types
     assert mock_netbox.get.call_count == 2
@@ -91,8 +95,10 @@ def test_field_projection_applied_to_queries(mock_netbox):
         "results": [],
     }
 
-    netbox_search_objects.fn(
-        query="test", object_types=["dcim.device", "dcim.site"], fields=["id", "name"]
+    asyncio.run(
+        netbox_search_objects.fn(
+            query="test", object_types=["dcim.device", "dcim.site"], fields=["id", "name"]
+        )
     )
 
     # All calls should include fields parameter
@@ -122,8 +128,10 @@ def test_result_structure_with_empty_and_populated_results(mock_netbox):
 
     mock_netbox.get.side_effect = mock_get_side_effect
 
-    result = netbox_search_objects.fn(
-        query="test", object_types=["dcim.device", "dcim.site", "dcim.rack"]
+    result = asyncio.run(
+        netbox_search_objects.fn(
+            query="test", object_types=["dcim.device", "dcim.site", "dcim.rack"]
+        )
     )
 
     # All types present
@@ -158,7 +166,9 @@ def test_continues_searching_when_one_type_fails(mock_netbox):
 
     mock_netbox.get.side_effect = mock_get_side_effect
 
-    result = netbox_search_objects.fn(query="test", object_types=["dcim.device", "dcim.site"])
+    result = asyncio.run(
+        netbox_search_objects.fn(query="test", object_types=["dcim.device", "dcim.site"])
+    )
 
     # Should continue despite error
     assert result["dcim.site"] == [{"id": 1, "name": "site01"}]
@@ -181,8 +191,10 @@ def test_api_parameters_passed_correctly(mock_netbox):
         "results": [],
     }
 
-    netbox_search_objects.fn(
-        query="switch01", object_types=["dcim.device"], fields=["id"], limit=25
+    asyncio.run(
+        netbox_search_objects.fn(
+            query="switch01", object_types=["dcim.device"], fields=["id"], limit=25
+        )
     )
 
     call_args = mock_netbox.get.call_args
@@ -203,7 +215,9 @@ def test_uses_correct_api_endpoints(mock_netbox):
         "results": [],
     }
 
-    netbox_search_objects.fn(query="test", object_types=["dcim.device", "ipam.ipaddress"])
+    asyncio.run(
+        netbox_search_objects.fn(query="test", object_types=["dcim.device", "ipam.ipaddress"])
+    )
 
     called_endpoints = [call[0][0] for call in mock_netbox.get.call_args_list]
     assert NETBOX_OBJECT_TYPES["dcim.device"]["endpoint"] in called_endpoints
@@ -240,7 +254,7 @@ def test_extracts_results_from_paginated_response(mock_netbox):
         ],
     }
 
-    result = netbox_search_objects.fn(query="test", object_types=["dcim.device"])
+    result = asyncio.run(netbox_search_objects.fn(query="test", object_types=["dcim.device"]))
 
     # Should return dict with object type as key
     assert "dcim.device" in result
@@ -251,3 +265,189 @@ def test_extracts_results_from_paginated_response(mock_netbox):
         {"id": 1, "name": "device01"},
         {"id": 2, "name": "device02"},
     ]
+
+
+# ============================================================================
+# Concurrency Tests
+# ============================================================================
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_types_are_queried_concurrently(mock_netbox):
+    """Per-type queries should overlap instead of running one after another."""
+    barrier = threading.Barrier(3, timeout=2)
+
+    def mock_get_side_effect(endpoint, params, fallback_endpoint=None):
+        # Only returns once all three queries are in flight at the same time
+        barrier.wait()
+        return {"count": 1, "results": [{"id": 1, "endpoint": endpoint}]}
+
+    mock_netbox.get.side_effect = mock_get_side_effect
+
+    result = asyncio.run(
+        netbox_search_objects.fn(
+            query="test", object_types=["dcim.device", "dcim.site", "dcim.rack"]
+        )
+    )
+
+    assert result["dcim.site"] == [{"id": 1, "endpoint": "dcim/sites"}]
+    assert "timed_out" not in result
+
+
+@patch("netbox_mcp_server.server.search_timeout", 0.05)
+@patch("netbox_mcp_server.server.netbox")
+def test_slow_types_reported_as_timed_out(mock_netbox):
+    """Types still running at the deadline should be reported instead of blocking."""
+    release = threading.Event()
+
+    def mock_get_side_effect(endpoint, params, fallback_endpoint=None):
+        if "devices" in endpoint:
+            release.wait(2)
+        return {"count": 1, "results": [{"id": 1}]}
+
+    mock_netbox.get.side_effect = mock_get_side_effect
+
+    try:
+        result = asyncio.run(
+            netbox_search_objects.fn(query="test", object_types=["dcim.device", "dcim.site"])
+        )
+    finally:
+        release.set()
+
+    assert result["dcim.site"] == [{"id": 1}]
+    assert result["dcim.device"] == []
+    assert result["timed_out"] == ["dcim.device"]
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_async_client_queries_are_awaited(mock_netbox):
+    """An async client's get should be awaited directly rather than run in a thread."""
+    mock_netbox.get = AsyncMock(return_value={"count": 1, "results": [{"id": 7}]})
+
+    result = asyncio.run(netbox_search_objects.fn(query="test", object_types=["dcim.site"]))
+
+    assert result == {"dcim.site": [{"id": 7}]}
+    mock_netbox.get.assert_awaited_once()
+
+
+# ============================================================================
+# Query Routing Tests
+# ============================================================================
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_ip_query_routed_to_ipaddress(mock_netbox):
+    """An IP address should be looked up with the address filter only."""
+    mock_netbox.get.return_value = {"count": 1, "results": [{"id": 42}]}
+
+    result = asyncio.run(netbox_search_objects.fn(query="192.168.1.100", fields=["id"]))
+
+    assert result == {"ipam.ipaddress": [{"id": 42}]}
+    assert mock_netbox.get.call_count == 1
+    assert mock_netbox.get.call_args[1]["params"] == {
+        "address": "192.168.1.100",
+        "limit": 5,
+        "fields": "id",
+    }
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_routed_search_without_hits_falls_back_to_q(mock_netbox):
+    """If the precise lookup finds nothing, the broad q search should run."""
+    mock_netbox.get.return_value = {"count": 0, "results": []}
+
+    result = asyncio.run(netbox_search_objects.fn(query="SN123456"))
+
+    # One routed query plus the 8 default types
+    assert mock_netbox.get.call_count == 9
+    assert mock_netbox.get.call_args_list[0][1]["params"]["serial"] == "SN123456"
+    assert len(result) == 8
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_routing_respects_requested_object_types(mock_netbox):
+    """Routes to types outside object_types should not be used."""
+    mock_netbox.get.return_value = {"count": 0, "results": []}
+
+    asyncio.run(netbox_search_objects.fn(query="100", object_types=["dcim.site"]))
+
+    assert mock_netbox.get.call_count == 1
+    assert mock_netbox.get.call_args[1]["params"]["q"] == "100"
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_routing_can_be_disabled(mock_netbox):
+    """route=False should always run the broad search."""
+    mock_netbox.get.return_value = {"count": 0, "results": []}
+
+    asyncio.run(netbox_search_objects.fn(query="192.168.1.100", route=False))
+
+    assert mock_netbox.get.call_count == 8
+
+
+# ============================================================================
+# Ranked Search Tests
+# ============================================================================
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_ranked_search_merges_across_types(mock_netbox):
+    """Hits from all types should be merged into one list of at most `limit` hits."""
+
+    def mock_get_side_effect(endpoint, params, fallback_endpoint=None):
+        if "devices" in endpoint:
+            return {"results": [{"id": 1, "name": "core-edge"}, {"id": 2, "name": "other"}]}
+        if "sites" in endpoint:
+            return {"results": [{"id": 3, "name": "edge"}]}
+        return {"results": []}
+
+    mock_netbox.get.side_effect = mock_get_side_effect
+
+    result = asyncio.run(
+        netbox_search_objects.fn(
+            query="edge", object_types=["dcim.device", "dcim.site"], limit=2, ranked=True
+        )
+    )
+
+    assert result["results"] == [
+        {"object_type": "dcim.site", "match": "exact", "object": {"id": 3, "name": "edge"}},
+        {
+            "object_type": "dcim.device",
+            "match": "substring",
+            "object": {"id": 1, "name": "core-edge"},
+        },
+    ]
+    assert result["skipped"] == []
+    assert result["timed_out"] == []
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_ranked_search_skips_lower_priority_types(mock_netbox):
+    """Once enough strong matches are found, remaining types should not be queried."""
+    mock_netbox.get.return_value = {
+        "results": [{"id": 1, "name": "edge"}, {"id": 2, "name": "edge-2"}]
+    }
+
+    result = asyncio.run(netbox_search_objects.fn(query="edge", limit=2, ranked=True))
+
+    # Only the first wave of default types is searched
+    assert mock_netbox.get.call_count == 3
+    assert result["skipped"] == DEFAULT_SEARCH_TYPES[3:]
+    assert len(result["results"]) == 2
+
+
+@patch("netbox_mcp_server.server.netbox")
+def test_ranked_search_with_routing(mock_netbox):
+    """Routed lookups should be ranked too."""
+    mock_netbox.get.return_value = {"results": [{"id": 42, "address": "192.168.1.100/24"}]}
+
+    result = asyncio.run(netbox_search_objects.fn(query="192.168.1.100", ranked=True))
+
+    assert result["results"] == [
+        {
+            "object_type": "ipam.ipaddress",
+            "match": "exact",
+            "object": {"id": 42, "address": "192.168.1.100/24"},
+        }
+    ]
+    assert mock_netbox.get.call_count == 1
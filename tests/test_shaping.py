@@ -0,0 +1,177 @@
+"""Tests for lean shaping of returned objects."""
+
+import asyncio
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from netbox_mcp_server.server import (
+    netbox_get_changelogs,
+    netbox_get_object_by_id,
+    netbox_get_objects,
+    netbox_search_objects,
+)
+from netbox_mcp_server.shaping import json_size, shape_objects
+
+
+def device() -> dict:
+    """Build a dcim.device object as NetBox returns it."""
+    return {
+        "id": 1,
+        "url": "https://netbox.example.com/api/dcim/devices/1/",
+        "display_url": "https://netbox.example.com/dcim/devices/1/",
+        "display": "sw-01",
+        "name": "sw-01",
+        "site": {
+            "id": 3,
+            "url": "https://netbox.example.com/api/dcim/sites/3/",
+            "display": "DC 1",
+            "name": "DC 1",
+            "slug": "dc-1",
+            "description": "",
+        },
+        "device_type": {"id": 7, "display": "QFX5120", "model": "QFX5120", "slug": "qfx5120"},
+        "status": {"value": "active", "label": "Active"},
+        "primary_ip4": None,
+        "tags": [{"id": 1, "name": "prod", "slug": "prod", "color": "4caf50"}],
+        "nat_outside": [],
+        "custom_fields": {},
+        "config_context": {"ntp": None},
+        "serial": "",
+    }
+
+
+def test_shape_object():
+    """Links, display, nulls and empty values should go and related objects collapse."""
+    obj = device()
+
+    shape_objects([obj])
+
+    assert obj == {
+        "id": 1,
+        "name": "sw-01",
+        "site": {"id": 3, "name": "DC 1"},
+        "device_type": {"id": 7, "display": "QFX5120"},
+        "status": {"value": "active", "label": "Active"},
+        "tags": [{"id": 1, "name": "prod"}],
+        "config_context": {"ntp": None},
+        "serial": "",
+    }
+
+
+def test_requested_fields_kept():
+    """Fields the agent asked for should be kept even when null or empty."""
+    obj = {"id": 1, "primary_ip4": None, "tags": [], "url": "https://x/1/"}
+
+    shape_objects([obj], keep=frozenset({"primary_ip4", "tags", "url"}))
+
+    assert obj == {"id": 1, "primary_ip4": None, "tags": [], "url": "https://x/1/"}
+
+
+def test_shape_does_not_modify_nested_dicts():
+    """Related objects should be replaced, not modified, as they may be shared."""
+    site = {"id": 3, "url": "https://x/3/", "name": "DC 1"}
+    objects = [{"id": 1, "site": site}, {"id": 2, "site": site}]
+
+    shape_objects(objects)
+
+    assert site == {"id": 3, "url": "https://x/3/", "name": "DC 1"}
+    assert objects[1]["site"] == {"id": 3, "name": "DC 1"}
+
+
+def test_savings_reported():
+    """The estimated savings should match the actual difference in JSON size."""
+    obj = device()
+    before = len(json.dumps(obj, separators=(",", ":")))
+
+    stats = shape_objects([obj])
+
+    assert stats.bytes_saved == before - len(json.dumps(obj, separators=(",", ":")))
+    assert stats.dropped == 6
+    assert stats.collapsed == 3
+
+
+@pytest.mark.parametrize("value", [None, True, 1.5, "ab", [], {}, {"a": [1, {"b": None}]}])
+def test_json_size(value):
+    """json_size should match the compact JSON encoding."""
+    assert json_size(value) == len(json.dumps(value, separators=(",", ":")))
+
+
+# ============================================================================
+# Tools
+# ============================================================================
+
+
+@pytest.fixture
+def lean():
+    """Enable lean shaping and raw passthrough for the duration of a test."""
+    with (
+        patch("netbox_mcp_server.server.lean_responses", True),
+        patch("netbox_mcp_server.server.raw_passthrough", True),
+        patch("netbox_mcp_server.server.netbox") as mock_netbox,
+    ):
+        yield mock_netbox
+
+
+def test_get_objects_shaped(lean):
+    """Lean shaping should take precedence over raw passthrough for queries without fields."""
+    lean.get.return_value = {"count": 1, "next": None, "previous": None, "results": [device()]}
+
+    result = asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters={}))
+
+    assert result["results"][0]["site"] == {"id": 3, "name": "DC 1"}
+    assert result["next"] is None
+    lean.get_raw.assert_not_called()
+
+
+def test_tool_savings_logged_at_info(lean, caplog):
+    """What shaping saved should be visible at the default log level."""
+    lean.get.return_value = {"count": 1, "next": None, "previous": None, "results": [device()]}
+
+    with caplog.at_level(logging.INFO, logger="netbox_mcp_server.server"):
+        asyncio.run(netbox_get_objects.fn(object_type="dcim.device", filters={}))
+
+    assert any(
+        record.levelno == logging.INFO and "netbox_get_objects: lean shaping" in record.message
+        for record in caplog.records
+    )
+
+
+def test_changelogs_not_shaped(lean):
+    """Changelog entries should keep the nulls and related objects of their object data."""
+    entry = {"id": 7, "action": "update", "prechange_data": device(), "postchange_data": None}
+    lean.get.return_value = {"count": 1, "next": None, "previous": None, "results": [entry]}
+
+    result = asyncio.run(netbox_get_changelogs.fn(filters={}))
+
+    assert result["results"] == [entry]
+
+
+def test_get_object_by_id_shaped(lean):
+    """Single objects should be shaped, keeping requested fields."""
+    lean.get.return_value = {"id": 1, "name": "sw-01", "primary_ip4": None, "url": "x"}
+
+    # With raw passthrough on, queries with fields are passed through instead
+    with patch("netbox_mcp_server.server.raw_passthrough", False):
+        result = asyncio.run(
+            netbox_get_object_by_id.fn(
+                object_type="dcim.device", object_id=1, fields=["id", "name", "primary_ip4"]
+            )
+        )
+
+    assert result == {"id": 1, "name": "sw-01", "primary_ip4": None}
+
+
+def test_ranked_search_shaped(lean):
+    """Ranked search hits should be shaped too."""
+    lean.get.return_value = {"results": [device()]}
+
+    result = asyncio.run(
+        netbox_search_objects.fn(
+            query="sw-01", object_types=["dcim.device"], route=False, ranked=True
+        )
+    )
+
+    assert result["results"][0]["object"]["site"] == {"id": 3, "name": "DC 1"}
@@ -0,0 +1,134 @@
+"""Tests for single-flight coalescing of identical concurrent GETs."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+from netbox_mcp_server.singleflight import SingleFlight
+
+
+def wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true or fail the test."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.001)
+
+
+# ============================================================================
+# Sync Client
+# ============================================================================
+
+
+def test_concurrent_identical_gets_share_one_request():
+    """Threads asking for the same endpoint and params should share one round trip."""
+    client = NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+    release = threading.Event()
+
+    response = MagicMock()
+    response.status_code = 200
+    response.json.side_effect = lambda: {"count": 1, "results": [{"id": 1}]}
+
+    def slow_get(*args, **kwargs):
+        release.wait()
+        return response
+
+    results = []
+    with patch.object(client.session, "get", side_effect=slow_get) as mock_get:
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(client.get("dcim/sites", params={"limit": 5}))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: client.inflight.coalesced == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert mock_get.call_count == 1
+    assert len(results) == 5
+    assert all(result == {"count": 1, "results": [{"id": 1}]} for result in results)
+    # Every caller decodes its own copy, so one caller mutating it cannot affect the others
+    assert len({id(result) for result in results}) == 5
+
+
+def test_different_params_are_not_coalesced():
+    """Requests with different params must each reach NetBox."""
+    client = NetBoxRestClient(url="https://netbox.example.com", token="test-token")
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"results": []}
+
+    with patch.object(client.session, "get", return_value=response) as mock_get:
+        client.get("dcim/sites", params={"limit": 5})
+        client.get("dcim/sites", params={"limit": 10})
+        client.get("dcim/sites", params={"limit": 5})
+
+    assert mock_get.call_count == 3
+    assert client.inflight.coalesced == 0
+
+
+def test_leader_error_propagates_to_followers():
+    """If the shared request fails, every waiting caller should see the error."""
+    group = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        release.wait()
+        raise requests.HTTPError("Server error")
+
+    def call():
+        try:
+            group.do("key", failing)
+        except requests.HTTPError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: group.coalesced == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    # The key is released after the call, so the next request goes to NetBox again
+    assert group.do("key", lambda: "fresh") == "fresh"
+
+
+# ============================================================================
+# Async Client
+# ============================================================================
+
+
+def test_async_concurrent_identical_gets_share_one_request():
+    """Coroutines asking for the same thing should share one request."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": 1})
+
+    client = NetBoxAsyncClient(url="https://netbox.example.com", token="test-token")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        return await asyncio.gather(*(client.get("dcim/sites", id=1) for _ in range(4)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert results == [{"id": 1}] * 4
+    assert client.inflight.coalesced == 3
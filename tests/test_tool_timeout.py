@@ -0,0 +1,252 @@
+"""Tests for tool timeouts and the cancellation of pending sync NetBox requests."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from netbox_mcp_server import server
+from netbox_mcp_server.config import Settings
+from netbox_mcp_server.netbox_client import NetBoxAsyncClient, NetBoxRestClient
+from netbox_mcp_server.retry import (
+    RequestCancelledError,
+    RetryBudgetExhaustedError,
+    RetryPolicy,
+    cancel_scope,
+    retry_budget,
+)
+from netbox_mcp_server.server import netbox_get_object_by_id
+
+
+def unavailable() -> MagicMock:
+    """Create a mock 503 response asking to retry after one second."""
+    response = MagicMock()
+    response.status_code = 503
+    response.headers = {"Retry-After": "1"}
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a sync client that keeps retrying a NetBox that is down."""
+    return NetBoxRestClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        retry_policy=RetryPolicy(max_retries=10, deadline=60),
+    )
+
+
+def test_tool_times_out(client):
+    """A tool call should fail after tool_timeout and its worker thread stop retrying."""
+    started = time.monotonic()
+    with (
+        patch.object(server, "netbox", client),
+        patch.object(server, "tool_timeout", 0.1),
+        patch.object(client.session, "get", return_value=unavailable()) as mock_get,
+        pytest.raises(TimeoutError, match="netbox_get_object_by_id did not complete within"),
+    ):
+        # asyncio.run() waits for the worker thread before returning
+        asyncio.run(netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1))
+
+    assert time.monotonic() - started < 0.9
+    assert mock_get.call_count == 1
+
+
+def test_cancelled_tool_stops_worker_thread(client):
+    """Cancelling a tool call (e.g. on client disconnect) should also cancel its retries."""
+
+    async def call_and_cancel():
+        task = asyncio.create_task(netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    started = time.monotonic()
+    with (
+        patch.object(server, "netbox", client),
+        patch.object(client.session, "get", return_value=unavailable()) as mock_get,
+    ):
+        asyncio.run(call_and_cancel())
+
+    assert time.monotonic() - started < 0.9
+    assert mock_get.call_count == 1
+
+
+def test_sync_client_calls_overlap():
+    """Concurrent tool calls should not block each other on the sync client."""
+    both_started = threading.Barrier(2, timeout=2)
+
+    def get(endpoint, params=None, fallback_endpoint=None):
+        both_started.wait()
+        return {"id": int(endpoint.rstrip("/").rsplit("/", 1)[1])}
+
+    async def call_twice():
+        return await asyncio.gather(
+            netbox_get_object_by_id.fn(object_type="dcim.site", object_id=1),
+            netbox_get_object_by_id.fn(object_type="dcim.site", object_id=2),
+        )
+
+    with patch("netbox_mcp_server.server.netbox") as mock_netbox:
+        mock_netbox.get.side_effect = get
+        assert asyncio.run(call_twice()) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.fixture
+def netbox_tables():
+    """Serve two sites."""
+    return {"dcim/sites": [{"id": 1, "name": "dc-1"}, {"id": 2, "name": "dc-2"}]}
+
+
+TOOL_CALLS = {
+    "get_objects": lambda: server.netbox_get_objects.fn(object_type="dcim.site", filters={}),
+    "get_object_by_id": lambda: server.netbox_get_object_by_id.fn(
+        object_type="dcim.site", object_id=1
+    ),
+    "get_objects_by_ids": lambda: server.netbox_get_objects_by_ids.fn(
+        object_type="dcim.site", ids=[1, 2]
+    ),
+    "count_objects": lambda: server.netbox_count_objects.fn(
+        queries=[server.CountQuery(object_type="dcim.site", filters={})]
+    ),
+    "aggregate": lambda: server.netbox_aggregate.fn(object_type="dcim.site", filters={}),
+    "get_changelogs": lambda: server.netbox_get_changelogs.fn(filters={}),
+    "search_objects": lambda: server.netbox_search_objects.fn(
+        query="dc", object_types=["dcim.site"], route=False
+    ),
+}
+
+
+@pytest.mark.parametrize("passthrough", [False, True])
+@pytest.mark.parametrize("tool", TOOL_CALLS)
+def test_sync_client_never_blocks_event_loop(mock_netbox, fake_netbox, tool, passthrough):
+    """Every tool should make its sync client calls in worker threads, off the event loop."""
+    on_loop = []
+
+    def off_loop(method):
+        def call(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(method.__name__)
+            except RuntimeError:
+                pass
+            return method(*args, **kwargs)
+
+        return call
+
+    def get(endpoint, params=None, fallback_endpoint=None):
+        return fake_netbox.get(endpoint, params=params)
+
+    def get_raw(endpoint, params=None, fallback_endpoint=None):
+        return json.dumps(get(endpoint, params)).encode()
+
+    def get_many(endpoint, ids, params=None, fallback_endpoint=None, concurrency=4):
+        return {"results": {}, "missing": ids}
+
+    mock_netbox.get.side_effect = off_loop(get)
+    mock_netbox.get_raw.side_effect = off_loop(get_raw)
+    mock_netbox.get_many.side_effect = off_loop(get_many)
+    with patch.object(server, "raw_passthrough", passthrough):
+        asyncio.run(TOOL_CALLS[tool]())
+
+    assert mock_netbox.method_calls
+    assert on_loop == []
+
+
+def test_cancel_scope_skips_unsent_requests(client):
+    """Requests should not be sent once their scope is cancelled."""
+    with (
+        patch.object(client.session, "get") as mock_get,
+        cancel_scope() as cancelled,
+    ):
+        cancelled.set()
+        with pytest.raises(RequestCancelledError):
+            client.get("dcim/sites")
+
+    mock_get.assert_not_called()
+
+
+def wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true or fail the test."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.001)
+
+
+def test_cancelled_leader_does_not_fail_coalesced_follower(client):
+    """A follower sharing a cancelled call's request should send it again, and succeed."""
+    ok = MagicMock(status_code=200)
+    ok.json.return_value = {"id": 1}
+    scopes = []
+    outcomes = {}
+
+    def lead():
+        with cancel_scope() as cancelled:
+            scopes.append(cancelled)
+            try:
+                client.get("dcim/sites", id=1)
+            except RequestCancelledError as e:
+                outcomes["leader"] = e
+
+    def follow():
+        outcomes["follower"] = client.get("dcim/sites", id=1)
+
+    with patch.object(client.session, "get", side_effect=[unavailable(), ok]) as mock_get:
+        leader = threading.Thread(target=lead)
+        leader.start()
+        wait_for(lambda: mock_get.call_count == 1)
+        follower = threading.Thread(target=follow)
+        follower.start()
+        wait_for(lambda: client.inflight.coalesced == 1)
+        scopes[0].set()
+        leader.join()
+        follower.join()
+
+    assert isinstance(outcomes["leader"], RequestCancelledError)
+    assert outcomes["follower"] == {"id": 1}
+    assert mock_get.call_count == 2
+
+
+def test_leader_budget_does_not_fail_coalesced_follower():
+    """A request shared with a call out of retry budget should be retried by the others."""
+    responses = [httpx.Response(503, headers={"Retry-After": "1"}), httpx.Response(200, json={})]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return responses.pop(0)
+
+    client = NetBoxAsyncClient(
+        url="https://netbox.example.com",
+        token="test-token",
+        retry_policy=RetryPolicy(max_retries=3, deadline=60),
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def lead():
+        with retry_budget(0.5):
+            return await client.get("dcim/sites")
+
+    async def both():
+        return await asyncio.gather(lead(), client.get("dcim/sites"), return_exceptions=True)
+
+    leader, follower = asyncio.run(both())
+
+    assert isinstance(leader, RetryBudgetExhaustedError)
+    assert follower == {}
+    assert client.inflight.coalesced == 1
+
+
+def test_timeouts_must_not_be_negative():
+    """Negative timeouts should be rejected; zero disables them."""
+    settings = Settings(netbox_url="https://netbox.example.com/", netbox_token="t", tool_timeout=0)
+    assert settings.tool_timeout == 0
+
+    with pytest.raises(ValidationError, match="Timeouts must not be negative"):
+        Settings(netbox_url="https://netbox.example.com/", netbox_token="t", request_timeout=-1)